@@ -11,6 +11,11 @@ from core.config import settings
 from core.models.base_model import BaseModel
 from core.models.user_model import User
 from core.models.task_model import Task
+from core.models.outbox_model import OutboxMessage
+from core.models.task_reminder_model import TaskReminder
+from core.models.task_photo_model import TaskPhoto
+from core.models.fsm_state_model import FsmState
+from core.models.leader_lease_model import LeaderLease
 
 
 config = context.config
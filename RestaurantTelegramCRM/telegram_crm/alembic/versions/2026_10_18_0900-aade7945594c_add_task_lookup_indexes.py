@@ -0,0 +1,44 @@
+"""Add task lookup indexes
+
+Revision ID: aade7945594c
+Revises: 1e1d8a55c5c3
+Create Date: 2026-10-18 09:00:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'aade7945594c'
+down_revision: Union[str, Sequence[str], None] = '1e1d8a55c5c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_executor_id_status', 'tasks', ['executor_id', 'status'], unique=False)
+    op.create_index('ix_tasks_sector_task_status', 'tasks', ['sector_task', 'status'], unique=False)
+    op.create_index('ix_tasks_status_deadline', 'tasks', ['status', 'deadline'], unique=False)
+    op.create_index(
+        'ix_tasks_overdue_unnotified', 'tasks', ['status', 'executor_id'], unique=False,
+        postgresql_where=sa.text("notified_overdue = false"),
+        sqlite_where=sa.text("notified_overdue = 0"),
+    )
+    op.create_index(
+        'ix_tasks_active_unnotified', 'tasks', ['status', 'deadline'], unique=False,
+        postgresql_where=sa.text("notified_24_hours = false OR notified_10_hours = false OR notified_2_hours = false"),
+        sqlite_where=sa.text("notified_24_hours = 0 OR notified_10_hours = 0 OR notified_2_hours = 0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_active_unnotified', table_name='tasks')
+    op.drop_index('ix_tasks_overdue_unnotified', table_name='tasks')
+    op.drop_index('ix_tasks_status_deadline', table_name='tasks')
+    op.drop_index('ix_tasks_sector_task_status', table_name='tasks')
+    op.drop_index('ix_tasks_executor_id_status', table_name='tasks')
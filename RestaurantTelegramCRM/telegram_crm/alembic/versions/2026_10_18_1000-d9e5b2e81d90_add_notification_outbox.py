@@ -0,0 +1,46 @@
+"""Add notification outbox
+
+Revision ID: d9e5b2e81d90
+Revises: aade7945594c
+Create Date: 2026-10-18 10:00:41.207553
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9e5b2e81d90'
+down_revision: Union[str, Sequence[str], None] = 'aade7945594c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('outbox',
+    sa.Column('message_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('chat_id', sa.BigInteger(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('parse_mode', sa.String(length=16), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'DEAD', name='outboxstatus'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('message_id')
+    )
+    op.create_index(
+        'ix_outbox_pending', 'outbox', ['next_attempt_at', 'message_id'], unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+        sqlite_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_outbox_pending', table_name='outbox')
+    op.drop_table('outbox')
+    sa.Enum(name='outboxstatus').drop(op.get_bind(), checkfirst=True)
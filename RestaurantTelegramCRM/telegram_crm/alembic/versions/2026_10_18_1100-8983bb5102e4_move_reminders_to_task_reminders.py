@@ -0,0 +1,87 @@
+"""Move deadline reminders to task_reminders
+
+Revision ID: 8983bb5102e4
+Revises: d9e5b2e81d90
+Create Date: 2026-10-18 11:00:27.650194
+
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8983bb5102e4'
+down_revision: Union[str, Sequence[str], None] = 'd9e5b2e81d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LEGACY_REMINDERS = (
+    ('notified_24_hours', 1440),
+    ('notified_10_hours', 600),
+    ('notified_2_hours', 120),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    task_reminders = op.create_table('task_reminders',
+    sa.Column('reminder_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('offset_minutes', sa.Integer(), nullable=False),
+    sa.Column('fire_at', sa.DateTime(), nullable=False),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.task_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('reminder_id'),
+    sa.UniqueConstraint('task_id', 'offset_minutes', name='uq_task_reminders_task_offset')
+    )
+    op.create_index(
+        'ix_task_reminders_due', 'task_reminders', ['fire_at'], unique=False,
+        postgresql_where=sa.text("sent_at IS NULL"),
+        sqlite_where=sa.text("sent_at IS NULL"),
+    )
+
+    tasks = sa.table(
+        'tasks',
+        sa.column('task_id', sa.Integer()),
+        sa.column('deadline', sa.DateTime()),
+        sa.column('status', sa.String()),
+        *(sa.column(flag, sa.Boolean()) for flag, _ in LEGACY_REMINDERS),
+    )
+    rows = op.get_bind().execute(
+        sa.select(tasks).where(tasks.c.status == 'ACTIVE', tasks.c.deadline.isnot(None))
+    ).mappings().all()
+    op.bulk_insert(task_reminders, [
+        {
+            'task_id': row['task_id'],
+            'offset_minutes': offset_minutes,
+            'fire_at': row['deadline'].replace(tzinfo=None) - timedelta(minutes=offset_minutes),
+            'sent_at': None,
+        }
+        for row in rows
+        for flag, offset_minutes in LEGACY_REMINDERS
+        if not row[flag]
+    ])
+
+    op.drop_index('ix_tasks_active_unnotified', table_name='tasks')
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('notified_2_hours')
+        batch_op.drop_column('notified_10_hours')
+        batch_op.drop_column('notified_24_hours')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.add_column(sa.Column('notified_24_hours', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch_op.add_column(sa.Column('notified_10_hours', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch_op.add_column(sa.Column('notified_2_hours', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.create_index(
+        'ix_tasks_active_unnotified', 'tasks', ['status', 'deadline'], unique=False,
+        postgresql_where=sa.text("notified_24_hours = false OR notified_10_hours = false OR notified_2_hours = false"),
+        sqlite_where=sa.text("notified_24_hours = 0 OR notified_10_hours = 0 OR notified_2_hours = 0"),
+    )
+    op.drop_index('ix_task_reminders_due', table_name='task_reminders')
+    op.drop_table('task_reminders')
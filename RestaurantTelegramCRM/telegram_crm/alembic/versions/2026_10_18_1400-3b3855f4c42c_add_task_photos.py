@@ -0,0 +1,87 @@
+"""Move report photos to task_photos
+
+Revision ID: 3b3855f4c42c
+Revises: 42bc528a62ea
+Create Date: 2026-10-18 14:00:12.384716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b3855f4c42c'
+down_revision: Union[str, Sequence[str], None] = '42bc528a62ea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    task_photos = op.create_table('task_photos',
+    sa.Column('photo_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('file_id', sa.String(length=255), nullable=False),
+    sa.Column('file_unique_id', sa.String(length=64), nullable=True),
+    sa.Column('ordinal', sa.Integer(), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.task_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('photo_id'),
+    sa.UniqueConstraint('task_id', 'ordinal', name='uq_task_photos_task_ordinal')
+    )
+
+    tasks = sa.table(
+        'tasks',
+        sa.column('task_id', sa.Integer()),
+        sa.column('photo_url', sa.Text()),
+    )
+    rows = op.get_bind().execute(
+        sa.select(tasks.c.task_id, tasks.c.photo_url).where(tasks.c.photo_url.isnot(None))
+    ).all()
+    op.bulk_insert(task_photos, [
+        {
+            'task_id': task_id,
+            'file_id': file_id,
+            'file_unique_id': None,
+            'ordinal': ordinal,
+            'size': None,
+        }
+        for task_id, photo_url in rows
+        for ordinal, file_id in enumerate(url.strip() for url in photo_url.split(',') if url.strip())
+    ])
+
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('photo_url')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.add_column(sa.Column('photo_url', sa.Text(), nullable=True))
+
+    task_photos = sa.table(
+        'task_photos',
+        sa.column('task_id', sa.Integer()),
+        sa.column('file_id', sa.String()),
+        sa.column('ordinal', sa.Integer()),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(task_photos.c.task_id, task_photos.c.file_id)
+        .order_by(task_photos.c.task_id, task_photos.c.ordinal)
+    ).all()
+    photo_urls: dict[int, list[str]] = {}
+    for task_id, file_id in rows:
+        photo_urls.setdefault(task_id, []).append(file_id)
+
+    tasks = sa.table(
+        'tasks',
+        sa.column('task_id', sa.Integer()),
+        sa.column('photo_url', sa.Text()),
+    )
+    for task_id, file_ids in photo_urls.items():
+        bind.execute(tasks.update().where(tasks.c.task_id == task_id).values(photo_url=",".join(file_ids)))
+
+    op.drop_table('task_photos')
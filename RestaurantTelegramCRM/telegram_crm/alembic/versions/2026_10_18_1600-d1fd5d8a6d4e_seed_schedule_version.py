@@ -0,0 +1,27 @@
+"""Seed schedule version
+
+Revision ID: d1fd5d8a6d4e
+Revises: a96a9e7213cf
+Create Date: 2026-10-18 16:00:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1fd5d8a6d4e'
+down_revision: Union[str, Sequence[str], None] = 'a96a9e7213cf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("INSERT INTO cache_versions (name, version) VALUES ('schedule', 0)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM cache_versions WHERE name = 'schedule'")
@@ -0,0 +1,79 @@
+from functools import partial
+
+from aiogram import Bot, Dispatcher
+from aiogram.client.default import DefaultBotProperties
+from aiogram.enums import ParseMode
+
+from core.config import settings
+from core.db_helper import db_helper
+from app.handlers import all_routers
+from app.middlewares.access_middleware import AccessMiddleware
+from app.middlewares.media_group_middleware import MediaGroupMiddleware
+from app.middlewares.db_session_middleware import DbSessionMiddleware, ReleaseReadOnlySessionMiddleware
+from app.jobs.supervisor import JobRegistry, JobSupervisor
+from app.fsm.sql_storage import SqlStorage
+from app.services.deadline_scheduler import deadline_scheduler
+from app.services.sector_roster import sector_roster
+from app.services.message_sender import message_sender
+from app.services.user_cache import user_cache
+from app.services.notification_outbox import notification_outbox
+from app.services.schedule_sync import schedule_sync
+
+
+def create_bot() -> Bot:
+    bot = Bot(
+        token=settings.tg.token,
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML)
+    )
+    bot.session.middleware(ReleaseReadOnlySessionMiddleware())
+    return bot
+
+
+def create_storage(pinned_chats: bool = True) -> SqlStorage:
+    return SqlStorage(
+        flush_interval=settings.fsm.flush_interval,
+        batch_size=settings.fsm.batch_size,
+        cache_ttl=settings.fsm.cache_ttl,
+        state_ttl=settings.fsm.state_ttl,
+        purge_interval=settings.fsm.purge_interval,
+        pinned_chats=pinned_chats,
+    )
+
+
+def setup_dispatcher(dp: Dispatcher, bot: Bot):
+    dp.update.middleware(DbSessionMiddleware(db_helper.session_factory))
+
+    access_middleware = AccessMiddleware()
+    dp.message.middleware(access_middleware)
+    dp.callback_query.middleware(access_middleware)
+
+    dp.include_routers(all_routers)
+
+
+def setup_update_middlewares(dp: Dispatcher):
+    media_group_middleware = MediaGroupMiddleware(dp, settings.media_groups.window)
+    dp.update.outer_middleware(media_group_middleware)
+    dp.shutdown.register(media_group_middleware.close)
+
+
+def register_local_jobs(job_registry: JobRegistry, storage: SqlStorage):
+    job_registry.register("fsm_storage", storage.run)
+    job_registry.register("sector_roster", sector_roster.run)
+    job_registry.register("sender_metrics", partial(message_sender.report_metrics, settings.sender.metrics_interval))
+    job_registry.register("user_cache_metrics", partial(user_cache.report_metrics, settings.cache.metrics_interval))
+
+
+def register_leader_jobs(job_registry: JobRegistry, bot: Bot):
+    job_registry.register("deadline_scheduler", deadline_scheduler.run)
+    job_registry.register("notification_outbox", partial(notification_outbox.run, bot))
+    job_registry.register("schedule_sync", partial(schedule_sync.run, settings.scheduler.signal_poll_interval))
+
+
+def build_job_supervisor(job_registry: JobRegistry) -> JobSupervisor:
+    return JobSupervisor(
+        job_registry,
+        restart_delay=settings.jobs.restart_delay,
+        max_restart_delay=settings.jobs.max_restart_delay,
+        jitter=settings.jobs.restart_jitter,
+        shutdown_timeout=settings.jobs.shutdown_timeout,
+    )
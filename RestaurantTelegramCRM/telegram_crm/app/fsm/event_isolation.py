@@ -0,0 +1,40 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Hashable
+
+from aiogram.fsm.storage.base import BaseEventIsolation, StorageKey
+
+
+class ChatLocks:
+    def __init__(self):
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        self._pending: dict[Hashable, int] = {}
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable) -> AsyncIterator[None]:
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._pending[key] = self._pending.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._pending[key] -= 1
+            if not self._pending[key]:
+                del self._pending[key]
+                del self._locks[key]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+class ChatEventIsolation(BaseEventIsolation):
+    def __init__(self, chat_locks: ChatLocks | None = None):
+        self.chat_locks = chat_locks or ChatLocks()
+
+    @asynccontextmanager
+    async def lock(self, key: StorageKey) -> AsyncIterator[None]:
+        async with self.chat_locks.hold((key.bot_id, key.chat_id)):
+            yield
+
+    async def close(self) -> None:
+        pass
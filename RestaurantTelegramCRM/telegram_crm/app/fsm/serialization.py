@@ -0,0 +1,49 @@
+import json
+from datetime import datetime, date
+from enum import Enum
+from typing import Any
+
+from core.models.base_model import UserRole, TaskStatus, SectorStatus
+
+TYPE_TAG = "__type__"
+
+ENUM_TYPES: dict[str, type[Enum]] = {
+    enum_type.__name__: enum_type for enum_type in (UserRole, TaskStatus, SectorStatus)
+}
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Enum):
+        if ENUM_TYPES.get(type(value).__name__) is not type(value):
+            raise TypeError(f"Перечисление {type(value).__name__} не поддерживается хранилищем состояний")
+        return {TYPE_TAG: f"enum:{type(value).__name__}", "value": value.name}
+    if isinstance(value, datetime):
+        return {TYPE_TAG: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {TYPE_TAG: "date", "value": value.isoformat()}
+    if isinstance(value, dict):
+        return {str(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(obj: dict) -> Any:
+    tag = obj.get(TYPE_TAG)
+    if tag is None or len(obj) != 2:
+        return obj
+    if tag == "datetime":
+        return datetime.fromisoformat(obj["value"])
+    if tag == "date":
+        return date.fromisoformat(obj["value"])
+    if tag.startswith("enum:"):
+        return ENUM_TYPES[tag[5:]][obj["value"]]
+    return obj
+
+
+def dumps_data(data: dict[str, Any]) -> str:
+    return json.dumps(_encode(data), ensure_ascii=False, separators=(",", ":"))
+
+
+def loads_data(payload: str) -> dict[str, Any]:
+    return json.loads(payload, object_hook=_decode)
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Mapping
+from zoneinfo import ZoneInfo
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StorageKey, StateType, DefaultKeyBuilder, KeyBuilder
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db_helper import db_helper
+from app.middlewares.db_session_middleware import current_session
+from app.fsm.serialization import dumps_data, loads_data
+from app.repository.fsm_repository import FsmRepository
+
+logger = logging.getLogger(__name__)
+
+ERROR_RETRY_DELAY = 5
+
+EMPTY_PAYLOAD = "{}"
+
+
+@dataclass
+class StateEntry:
+    state: str | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+    payload: str = EMPTY_PAYLOAD
+    touched_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.state is None and not self.data
+
+
+class SqlStorage(BaseStorage):
+    def __init__(
+            self,
+            flush_interval: float,
+            batch_size: int,
+            cache_ttl: int,
+            state_ttl: int,
+            purge_interval: int,
+            pinned_chats: bool = True,
+            key_builder: KeyBuilder | None = None,
+    ):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.cache_ttl = cache_ttl
+        self.state_ttl = timedelta(seconds=state_ttl)
+        self.purge_interval = purge_interval
+        self.pinned_chats = pinned_chats
+        self.key_builder = key_builder or DefaultKeyBuilder(with_bot_id=True, with_destiny=True)
+        self.kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
+        self._entries: dict[str, StateEntry] = {}
+        self._dirty: set[str] = set()
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._last_purge = 0.0
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        entry = await self._get_entry(key)
+        entry.state = state.state if isinstance(state, State) else state
+        await self._save(key)
+
+    async def get_state(self, key: StorageKey) -> str | None:
+        entry = await self._get_entry(key)
+        return entry.state
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        data = dict(data)
+        payload = dumps_data(data)
+        entry = await self._get_entry(key)
+        entry.data = data
+        entry.payload = payload
+        await self._save(key)
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        entry = await self._get_entry(key)
+        return entry.data.copy()
+
+    async def close(self) -> None:
+        while self._dirty:
+            await self.flush()
+
+    async def run(self):
+        logger.info("Хранилище состояний FSM запущено")
+
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+                await self.flush()
+                self._evict_idle()
+                if time.monotonic() - self._last_purge >= self.purge_interval:
+                    await self.purge_expired()
+            except asyncio.CancelledError:
+                logger.info("Хранилище состояний FSM остановлено")
+                raise
+            except Exception as e:
+                logger.error(f"Ошибка в хранилище состояний FSM: {e}")
+                await asyncio.sleep(ERROR_RETRY_DELAY)
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            if not self._dirty:
+                return 0
+            return await self._write(list(self._dirty)[:self.batch_size])
+
+    async def purge_expired(self) -> int:
+        self._last_purge = time.monotonic()
+        async with db_helper.session_scope() as session:
+            fsm_repository = FsmRepository(session)
+            deleted = await fsm_repository.delete_expired_states(self._now() - self.state_ttl)
+        if deleted:
+            logger.info(f"Удалено {deleted} заброшенных состояний FSM")
+        return deleted
+
+    async def _get_entry(self, key: StorageKey) -> StateEntry:
+        storage_key = self.key_builder.build(key)
+        entry = self._entries.get(storage_key)
+        if entry is None:
+            entry = self._entries.setdefault(storage_key, await self._load_entry(storage_key))
+        elif not self.pinned_chats and storage_key not in self._dirty:
+            entry = self._entries[storage_key] = await self._load_entry(storage_key, current_session.get())
+        entry.touched_at = time.monotonic()
+        return entry
+
+    async def _load_entry(self, storage_key: str, session: AsyncSession | None = None) -> StateEntry:
+        async with db_helper.session_scope(session) as session:
+            fsm_repository = FsmRepository(session)
+            row = await fsm_repository.get_state(storage_key)
+
+        if row is None or row.updated_at < self._now() - self.state_ttl:
+            return StateEntry()
+        return StateEntry(state=row.state, data=loads_data(row.data), payload=row.data)
+
+    async def _write(self, keys: list[str], session: AsyncSession | None = None) -> int:
+        self._dirty.difference_update(keys)
+
+        current_time = self._now()
+        rows = []
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.is_empty:
+                rows.append({"key": key, "state": entry.state, "data": entry.payload, "updated_at": current_time})
+
+        try:
+            async with db_helper.session_scope(session) as session:
+                fsm_repository = FsmRepository(session)
+                await fsm_repository.replace_states(keys, rows)
+        except Exception:
+            self._dirty.update(keys)
+            raise
+
+        logger.debug(f"Сохранено {len(rows)} состояний FSM, удалено {len(keys) - len(rows)}")
+        return len(keys)
+
+    async def _save(self, key: StorageKey):
+        storage_key = self.key_builder.build(key)
+        self._dirty.add(storage_key)
+        if not self.pinned_chats:
+            await self._write([storage_key], current_session.get())
+        elif len(self._dirty) >= self.batch_size:
+            self._wakeup.set()
+
+    def _evict_idle(self):
+        expired_before = time.monotonic() - self.cache_ttl
+        for storage_key in [
+            storage_key for storage_key, entry in self._entries.items()
+            if entry.touched_at < expired_before and storage_key not in self._dirty
+        ]:
+            del self._entries[storage_key]
+
+    def _now(self) -> datetime:
+        return datetime.now(self.kemerovo_tz).replace(tzinfo=None)
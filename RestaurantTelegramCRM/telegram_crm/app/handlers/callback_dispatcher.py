@@ -0,0 +1,69 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from aiogram import Router
+from aiogram.dispatcher.event.bases import SkipHandler
+from aiogram.dispatcher.event.handler import HandlerObject, FilterObject
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import CallbackQuery
+
+logger = logging.getLogger(__name__)
+
+SEPARATOR = ":"
+
+
+@dataclass(frozen=True)
+class CallbackRoute:
+    factory: type[CallbackData]
+    handler: HandlerObject
+
+
+class CallbackDispatcher:
+    def __init__(self, name: str | None = None):
+        self.router = Router(name=name)
+        self.router.callback_query.register(self._dispatch)
+        self._routes: dict[str, list[CallbackRoute]] = {}
+
+    def register(self, factory: type[CallbackData], *filters: Any) -> Callable:
+        if factory.__separator__ != SEPARATOR:
+            raise ValueError(f"Фабрика {factory.__name__} использует неподдерживаемый разделитель")
+
+        routes = self._routes.get(factory.__prefix__)
+        if routes and routes[0].factory is not factory:
+            raise ValueError(f"Префикс {factory.__prefix__} уже занят фабрикой {routes[0].factory.__name__}")
+
+        def decorator(callback: Callable) -> Callable:
+            handler = HandlerObject(callback=callback, filters=[FilterObject(f) for f in filters])
+            self._routes.setdefault(factory.__prefix__, []).append(CallbackRoute(factory, handler))
+            return callback
+
+        return decorator
+
+    def prefixes(self) -> set[str]:
+        return set(self._routes)
+
+    async def _dispatch(self, callback_query: CallbackQuery, **kwargs: Any) -> Any:
+        data = callback_query.data or ""
+        prefix, _, _ = data.partition(SEPARATOR)
+        routes = self._routes.get(prefix)
+        if not routes:
+            raise SkipHandler()
+
+        try:
+            callback_data = routes[0].factory.unpack(data)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Некорректные данные кнопки {data!r}: {e}")
+            await callback_query.answer("Ошибка обработки запроса.", show_alert=True)
+            return
+
+        kwargs["callback_data"] = callback_data
+        for route in routes:
+            passed, filter_data = await route.handler.check(callback_query, **kwargs)
+            if passed:
+                return await route.handler.call(callback_query, **{**kwargs, **filter_data})
+
+        raise SkipHandler()
+
+
+callback_dispatcher = CallbackDispatcher(name="callbacks")
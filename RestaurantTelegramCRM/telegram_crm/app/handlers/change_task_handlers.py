@@ -6,9 +6,18 @@ from aiogram.filters import Command, StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import StatesGroup, State
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.keyboards.deadline_keyboars import create_deadline_keyboard, calculate_deadline_from_callback
-from app.keyboards.change_task_keyboars import build_delete_tasks_keyboard, build_update_tasks_keyboard
+from app.keyboards.change_task_keyboars import (
+    build_delete_tasks_keyboard,
+    build_update_tasks_keyboard,
+)
+from app.handlers.callback_dispatcher import callback_dispatcher
+from app.keyboards.callbacks import (
+    MainActionCallback, DeleteTasksPageCallback, UpdateTasksPageCallback, UpdateTaskCallback, FieldCallback,
+    DeadlineCallback, TaskSectorCallback, ContinueCallback, DeleteTaskCallback, ConfirmDeleteCallback,
+)
 from app.services.task_service import TaskService
 from app.services.user_service import UserService
 from core.models import SectorStatus
@@ -44,43 +53,69 @@ def format_deadline(deadline: datetime | None) -> str:
 @change_task_router.message(Command("change_task"))
 async def get_change_task_keyboard(message: Message):
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="✏️ Изменить задачу", callback_data="action:update")],
-        [InlineKeyboardButton(text="❌ Удалить задачу", callback_data="action:delete")]
+        [InlineKeyboardButton(text="✏️ Изменить задачу", callback_data=MainActionCallback(action="update").pack())],
+        [InlineKeyboardButton(text="❌ Удалить задачу", callback_data=MainActionCallback(action="delete").pack())]
     ])
     await message.answer("Изменение существующей задачи", reply_markup=keyboard)
 
 
-@change_task_router.callback_query(lambda c: c.data and c.data.startswith('action:'))
-async def process_main_action(callback_query: CallbackQuery, state: FSMContext):
-    action = callback_query.data.split(':')[1]
+@callback_dispatcher.register(MainActionCallback)
+async def process_main_action(callback_query: CallbackQuery, callback_data: MainActionCallback, state: FSMContext,
+                              session: AsyncSession):
+    action = callback_data.action
 
     if action == 'delete':
-        tasks = await TaskService.get_all_task()
-        if not tasks:
+        page = await TaskService.get_all_task_page(session=session)
+        if not page.items:
             await callback_query.message.edit_text("Нет задач для удаления")
             await callback_query.answer()
             return
-        task_keyboard = build_delete_tasks_keyboard(tasks)
+        task_keyboard = build_delete_tasks_keyboard(page.items, page)
         await callback_query.message.edit_text("Выберите задачу для удаления:", reply_markup=task_keyboard)
 
     elif action == 'update':
-        tasks = await TaskService.get_all_task()
-        if not tasks:
+        page = await TaskService.get_all_task_page(session=session)
+        if not page.items:
             await callback_query.message.edit_text("Нет задач для изменения")
             await callback_query.answer()
             return
-        task_keyboard = build_update_tasks_keyboard(tasks)
+        task_keyboard = build_update_tasks_keyboard(page.items, page)
         await callback_query.message.edit_text("Выберите задачу для изменения:", reply_markup=task_keyboard)
         await state.set_state(UpdateTaskStates.waiting_for_field_choice)
 
     await callback_query.answer()
 
 
-@change_task_router.callback_query(lambda c: c.data and c.data.startswith('update_task:'))
-async def start_change_task(callback_query: CallbackQuery, state: FSMContext):
-    task_id_str = callback_query.data.split(':')[1]
-    task_id = int(task_id_str)
-    selected_task = await TaskService.get_task_by_id(task_id)
+async def paginate_tasks(callback_query: CallbackQuery,
+                         callback_data: DeleteTasksPageCallback | UpdateTasksPageCallback,
+                         build_keyboard, session: AsyncSession):
+    page = await TaskService.get_all_task_page(callback_data.cursor, callback_data.direction == "prev",
+                                               session=session)
+
+    if not page.items:
+        await callback_query.message.edit_text("Нет задач для изменения")
+    else:
+        await callback_query.message.edit_reply_markup(reply_markup=build_keyboard(page.items, page))
+    await callback_query.answer()
+
+
+@callback_dispatcher.register(DeleteTasksPageCallback)
+async def paginate_delete_tasks(callback_query: CallbackQuery, callback_data: DeleteTasksPageCallback,
+                                session: AsyncSession):
+    await paginate_tasks(callback_query, callback_data, build_delete_tasks_keyboard, session)
+
+
+@callback_dispatcher.register(UpdateTasksPageCallback)
+async def paginate_update_tasks(callback_query: CallbackQuery, callback_data: UpdateTasksPageCallback,
+                                session: AsyncSession):
+    await paginate_tasks(callback_query, callback_data, build_update_tasks_keyboard, session)
+
+
+@callback_dispatcher.register(UpdateTaskCallback)
+async def start_change_task(callback_query: CallbackQuery, callback_data: UpdateTaskCallback, state: FSMContext,
+                            session: AsyncSession):
+    task_id = callback_data.task_id
+    selected_task = await TaskService.get_task_by_id(task_id, session=session)
 
     await state.update_data(task_id=task_id)
 
@@ -111,12 +146,12 @@ async def start_change_task(callback_query: CallbackQuery, state: FSMContext):
     await callback_query.message.answer(task_info)
 
     field_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="📝 Название", callback_data="field:title")],
-        [InlineKeyboardButton(text="📄 Описание", callback_data="field:description")],
-        [InlineKeyboardButton(text="👤 Сотрудник", callback_data="field:executor")],
-        [InlineKeyboardButton(text="⏰ Дедлайн", callback_data="field:deadline")],
-        [InlineKeyboardButton(text="🏢 Назначить сектору", callback_data="field:sector_assignment")],
-        [InlineKeyboardButton(text="❌ Отмена", callback_data="field:cancel")]
+        [InlineKeyboardButton(text="📝 Название", callback_data=FieldCallback(field="title").pack())],
+        [InlineKeyboardButton(text="📄 Описание", callback_data=FieldCallback(field="description").pack())],
+        [InlineKeyboardButton(text="👤 Сотрудник", callback_data=FieldCallback(field="executor").pack())],
+        [InlineKeyboardButton(text="⏰ Дедлайн", callback_data=FieldCallback(field="deadline").pack())],
+        [InlineKeyboardButton(text="🏢 Назначить сектору", callback_data=FieldCallback(field="sector_assignment").pack())],
+        [InlineKeyboardButton(text="❌ Отмена", callback_data=FieldCallback(field="cancel").pack())]
     ])
 
     await callback_query.message.answer("Что вы хотите изменить?", reply_markup=field_keyboard)
@@ -124,18 +159,18 @@ async def start_change_task(callback_query: CallbackQuery, state: FSMContext):
     await callback_query.answer()
 
 
-@change_task_router.callback_query(UpdateTaskStates.waiting_for_field_choice,
-                                   lambda c: c.data and c.data.startswith('field:'))
-async def process_field_choice(callback_query: CallbackQuery, state: FSMContext):
-    field = callback_query.data.split(':')[1]
+@callback_dispatcher.register(FieldCallback, StateFilter(UpdateTaskStates.waiting_for_field_choice))
+async def process_field_choice(callback_query: CallbackQuery, callback_data: FieldCallback, state: FSMContext,
+                               session: AsyncSession):
+    field = callback_data.field
     await state.update_data(field_to_update=field)
 
     if field == 'cancel':
         await callback_query.message.edit_text("Редактирование задачи отменено.")
         await state.clear()
         main_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="✏️ Изменить задачу", callback_data="action:update")],
-            [InlineKeyboardButton(text="❌ Удалить задачу", callback_data="action:delete")]
+            [InlineKeyboardButton(text="✏️ Изменить задачу", callback_data=MainActionCallback(action="update").pack())],
+            [InlineKeyboardButton(text="❌ Удалить задачу", callback_data=MainActionCallback(action="delete").pack())]
         ])
         await callback_query.message.answer("Изменение существующей задачи", reply_markup=main_keyboard)
         return
@@ -156,7 +191,7 @@ async def process_field_choice(callback_query: CallbackQuery, state: FSMContext)
         }
 
         if field == 'executor':
-            employees = await UserService.get_all_users()
+            employees = await UserService.get_all_users(session=session)
             if employees:
                 employee_list = "\n".join([
                     f"{emp.telegram_id} - {emp.full_name} ({emp.position})"
@@ -176,9 +211,9 @@ async def process_field_choice(callback_query: CallbackQuery, state: FSMContext)
     await callback_query.answer()
 
 
-@change_task_router.callback_query(StateFilter(UpdateTaskStates.waiting_for_new_value),
-                                   lambda c: c.data and c.data.startswith('deadline:'))
-async def process_deadline_callback(callback_query: CallbackQuery, state: FSMContext):
+@callback_dispatcher.register(DeadlineCallback, StateFilter(UpdateTaskStates.waiting_for_new_value))
+async def process_deadline_callback(callback_query: CallbackQuery, callback_data: DeadlineCallback, state: FSMContext,
+                                    session: AsyncSession):
     await callback_query.answer()
 
     user_data = await state.get_data()
@@ -190,20 +225,20 @@ async def process_deadline_callback(callback_query: CallbackQuery, state: FSMCon
         await state.clear()
         return
 
-    data = callback_query.data
+    choice = callback_data.choice
 
-    if data == "deadline:manual":
+    if choice == "manual":
         await callback_query.message.edit_text(
             "Укажите новую дату и время окончания задачи в формате: 01.01.2025 - 22:30"
         )
         return
 
-    new_deadline = calculate_deadline_from_callback(data)
+    new_deadline = calculate_deadline_from_callback(choice)
 
-    result = await TaskService.update_task_field(task_id, 'deadline', new_deadline)
+    result = await TaskService.update_task_field(task_id, 'deadline', new_deadline, session=session)
 
     if result["success"]:
-        updated_task = await TaskService.get_task_by_id(task_id)
+        updated_task = result["task"]
 
         if updated_task.executor:
             executor_info = f"{updated_task.executor.full_name} - {updated_task.executor.position}"
@@ -230,8 +265,8 @@ async def process_deadline_callback(callback_query: CallbackQuery, state: FSMCon
         )
 
         continue_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="✅ Продолжить редактирование", callback_data="continue:yes")],
-            [InlineKeyboardButton(text="⏹️ Завершить", callback_data="continue:no")]
+            [InlineKeyboardButton(text="✅ Продолжить редактирование", callback_data=ContinueCallback(answer="yes").pack())],
+            [InlineKeyboardButton(text="⏹️ Завершить", callback_data=ContinueCallback(answer="no").pack())]
         ])
 
         await callback_query.message.answer(
@@ -244,35 +279,36 @@ async def process_deadline_callback(callback_query: CallbackQuery, state: FSMCon
         await state.clear()
 
 
-async def show_all_tasks(message: Message):
-    tasks = await TaskService.get_all_task()
-    if not tasks:
+async def show_all_tasks(message: Message, session: AsyncSession):
+    page = await TaskService.get_all_task_page(session=session)
+    if not page.items:
         await message.answer("Нет задач для изменения")
         return
 
-    task_keyboard = build_update_tasks_keyboard(tasks)
+    task_keyboard = build_update_tasks_keyboard(page.items, page)
     await message.answer("Выберите задачу для изменения:", reply_markup=task_keyboard)
 
 
 def sector_selection_keyboard():
     keyboard = [
-        [InlineKeyboardButton(text="🍸 Бар", callback_data="task_sector:bar_ch")],
-        [InlineKeyboardButton(text="🍽️ Зал", callback_data="task_sector:hall_ch")],
-        [InlineKeyboardButton(text="👨‍🍳 Кухня", callback_data="task_sector:kitchen_ch")],
-        [InlineKeyboardButton(text="❌ Отмена", callback_data="task_sector:cancel_ch")]
+        [InlineKeyboardButton(text="🍸 Бар", callback_data=TaskSectorCallback(sector="bar_ch").pack())],
+        [InlineKeyboardButton(text="🍽️ Зал", callback_data=TaskSectorCallback(sector="hall_ch").pack())],
+        [InlineKeyboardButton(text="👨‍🍳 Кухня", callback_data=TaskSectorCallback(sector="kitchen_ch").pack())],
+        [InlineKeyboardButton(text="❌ Отмена", callback_data=TaskSectorCallback(sector="cancel_ch").pack())]
     ]
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
-@change_task_router.callback_query(UpdateTaskStates.waiting_for_sector_choice)
-async def process_sector_choice(callback_query: CallbackQuery, state: FSMContext):
+@callback_dispatcher.register(TaskSectorCallback, StateFilter(UpdateTaskStates.waiting_for_sector_choice))
+async def process_sector_choice(callback_query: CallbackQuery, callback_data: TaskSectorCallback, state: FSMContext,
+                                session: AsyncSession):
     user_data = await state.get_data()
     task_id = user_data.get('task_id')
 
-    if callback_query.data == "task_sector:cancel_ch":
+    if callback_data.sector == "cancel_ch":
         await callback_query.message.edit_text("Назначение сектору отменено.")
         await state.set_state(UpdateTaskStates.waiting_for_field_choice)
-        selected_task = await TaskService.get_task_by_id(task_id)
+        selected_task = await TaskService.get_task_by_id(task_id, session=session)
 
         if selected_task.executor:
             executor_info = f"{selected_task.executor.full_name} - {selected_task.executor.position}"
@@ -299,12 +335,12 @@ async def process_sector_choice(callback_query: CallbackQuery, state: FSMContext
         )
 
         field_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="📝 Название", callback_data="field:title")],
-            [InlineKeyboardButton(text="📄 Описание", callback_data="field:description")],
-            [InlineKeyboardButton(text="👤 Сотрудник", callback_data="field:executor")],
-            [InlineKeyboardButton(text="⏰ Дедлайн", callback_data="field:deadline")],
-            [InlineKeyboardButton(text="🏢 Назначить сектору", callback_data="field:sector_assignment")],
-            [InlineKeyboardButton(text="❌ Отмена", callback_data="field:cancel")]
+            [InlineKeyboardButton(text="📝 Название", callback_data=FieldCallback(field="title").pack())],
+            [InlineKeyboardButton(text="📄 Описание", callback_data=FieldCallback(field="description").pack())],
+            [InlineKeyboardButton(text="👤 Сотрудник", callback_data=FieldCallback(field="executor").pack())],
+            [InlineKeyboardButton(text="⏰ Дедлайн", callback_data=FieldCallback(field="deadline").pack())],
+            [InlineKeyboardButton(text="🏢 Назначить сектору", callback_data=FieldCallback(field="sector_assignment").pack())],
+            [InlineKeyboardButton(text="❌ Отмена", callback_data=FieldCallback(field="cancel").pack())]
         ])
 
         await callback_query.message.edit_text(task_info + "\nЧто вы хотите изменить?", reply_markup=field_keyboard)
@@ -312,21 +348,21 @@ async def process_sector_choice(callback_query: CallbackQuery, state: FSMContext
         return
 
     sector_map = {
-        "task_sector:bar_ch": SectorStatus.BAR,
-        "task_sector:hall_ch": SectorStatus.HALL,
-        "task_sector:kitchen_ch": SectorStatus.KITCHEN
+        "bar_ch": SectorStatus.BAR,
+        "hall_ch": SectorStatus.HALL,
+        "kitchen_ch": SectorStatus.KITCHEN
     }
 
-    sector = sector_map.get(callback_query.data)
+    sector = sector_map.get(callback_data.sector)
 
     if not sector:
         await callback_query.answer("Ошибка при выборе сектора.", show_alert=True)
         return
 
-    result = await TaskService.update_task_field(task_id, 'sector_task', sector)
+    result = await TaskService.update_task_field(task_id, 'sector_task', sector, session=session)
 
     if result["success"]:
-        updated_task = await TaskService.get_task_by_id(task_id)
+        updated_task = result["task"]
 
         sector_names = {
             SectorStatus.BAR: "Бар",
@@ -346,8 +382,8 @@ async def process_sector_choice(callback_query: CallbackQuery, state: FSMContext
         )
 
         continue_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="✅ Продолжить редактирование", callback_data="continue:yes")],
-            [InlineKeyboardButton(text="⏹️ Завершить", callback_data="continue:no")]
+            [InlineKeyboardButton(text="✅ Продолжить редактирование", callback_data=ContinueCallback(answer="yes").pack())],
+            [InlineKeyboardButton(text="⏹️ Завершить", callback_data=ContinueCallback(answer="no").pack())]
         ])
 
         await callback_query.message.answer(
@@ -363,7 +399,7 @@ async def process_sector_choice(callback_query: CallbackQuery, state: FSMContext
 
 
 @change_task_router.message(UpdateTaskStates.waiting_for_new_value)
-async def process_new_value(message: Message, state: FSMContext):
+async def process_new_value(message: Message, state: FSMContext, session: AsyncSession):
     user_data = await state.get_data()
     task_id = user_data.get('task_id')
     field_to_update = user_data.get('field_to_update')
@@ -383,11 +419,10 @@ async def process_new_value(message: Message, state: FSMContext):
         elif field_to_update == 'executor':
             try:
                 new_value = int(new_value)
-                employee = await UserService.get_user_by_telegram_id(new_value)
+                employee = await UserService.get_user_by_telegram_id(new_value, session=session)
                 if not employee:
                     await message.answer("Сотрудник с таким Telegram ID не найден")
                     return
-                await TaskService.update_task_field(task_id, 'sector_task', None)
             except ValueError:
                 await message.answer("Введите корректный Telegram ID (число)")
                 return
@@ -402,10 +437,10 @@ async def process_new_value(message: Message, state: FSMContext):
         else:
             pass
 
-        result = await TaskService.update_task_field(task_id, field_to_update, new_value)
+        result = await TaskService.update_task_field(task_id, field_to_update, new_value, session=session)
 
         if result["success"]:
-            updated_task = await TaskService.get_task_by_id(task_id)
+            updated_task = result["task"]
 
             if updated_task.executor:
                 executor_info = f"{updated_task.executor.full_name} - {updated_task.executor.position}"
@@ -432,8 +467,8 @@ async def process_new_value(message: Message, state: FSMContext):
             )
 
             continue_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(text="✅ Продолжить редактирование", callback_data="continue:yes")],
-                [InlineKeyboardButton(text="⏹️ Завершить", callback_data="continue:no")]
+                [InlineKeyboardButton(text="✅ Продолжить редактирование", callback_data=ContinueCallback(answer="yes").pack())],
+                [InlineKeyboardButton(text="⏹️ Завершить", callback_data=ContinueCallback(answer="no").pack())]
             ])
 
             await message.answer(
@@ -450,13 +485,14 @@ async def process_new_value(message: Message, state: FSMContext):
         await state.clear()
 
 
-@change_task_router.callback_query(UpdateTaskStates.waiting_for_continue)
-async def process_continue_editing(callback_query: CallbackQuery, state: FSMContext):
+@callback_dispatcher.register(ContinueCallback, StateFilter(UpdateTaskStates.waiting_for_continue))
+async def process_continue_editing(callback_query: CallbackQuery, callback_data: ContinueCallback, state: FSMContext,
+                                   session: AsyncSession):
     user_data = await state.get_data()
     task_id = user_data.get('task_id')
 
-    if callback_query.data == "continue:yes":
-        selected_task = await TaskService.get_task_by_id(task_id)
+    if callback_data.answer == "yes":
+        selected_task = await TaskService.get_task_by_id(task_id, session=session)
 
         if selected_task.executor:
             executor_info = f"{selected_task.executor.full_name} - {selected_task.executor.position}"
@@ -483,22 +519,22 @@ async def process_continue_editing(callback_query: CallbackQuery, state: FSMCont
         )
 
         field_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="📝 Название", callback_data="field:title")],
-            [InlineKeyboardButton(text="📄 Описание", callback_data="field:description")],
-            [InlineKeyboardButton(text="👤 Сотрудник", callback_data="field:executor")],
-            [InlineKeyboardButton(text="⏰ Дедлайн", callback_data="field:deadline")],
-            [InlineKeyboardButton(text="🏢 Назначить сектору", callback_data="field:sector_assignment")],
-            [InlineKeyboardButton(text="❌ Отмена", callback_data="field:cancel")]
+            [InlineKeyboardButton(text="📝 Название", callback_data=FieldCallback(field="title").pack())],
+            [InlineKeyboardButton(text="📄 Описание", callback_data=FieldCallback(field="description").pack())],
+            [InlineKeyboardButton(text="👤 Сотрудник", callback_data=FieldCallback(field="executor").pack())],
+            [InlineKeyboardButton(text="⏰ Дедлайн", callback_data=FieldCallback(field="deadline").pack())],
+            [InlineKeyboardButton(text="🏢 Назначить сектору", callback_data=FieldCallback(field="sector_assignment").pack())],
+            [InlineKeyboardButton(text="❌ Отмена", callback_data=FieldCallback(field="cancel").pack())]
         ])
 
         await callback_query.message.edit_text(task_info + "\nЧто вы хотите изменить?", reply_markup=field_keyboard)
         await state.set_state(UpdateTaskStates.waiting_for_field_choice)
 
-    elif callback_query.data == "continue:no":
+    elif callback_data.answer == "no":
         await callback_query.message.edit_text("Редактирование задачи завершено.")
         main_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="✏️ Изменить задачу", callback_data="action:update")],
-            [InlineKeyboardButton(text="❌ Удалить задачу", callback_data="action:delete")]
+            [InlineKeyboardButton(text="✏️ Изменить задачу", callback_data=MainActionCallback(action="update").pack())],
+            [InlineKeyboardButton(text="❌ Удалить задачу", callback_data=MainActionCallback(action="delete").pack())]
         ])
         await callback_query.message.answer("Изменение существующей задачи", reply_markup=main_keyboard)
         await state.clear()
@@ -506,11 +542,11 @@ async def process_continue_editing(callback_query: CallbackQuery, state: FSMCont
     await callback_query.answer()
 
 
-@change_task_router.callback_query(lambda c: c.data and c.data.startswith('delete_task:'))
-async def start_delete_task(callback_query: CallbackQuery, state: FSMContext):
-    task_id_str = callback_query.data.split(':')[1]
-    task_id = int(task_id_str)
-    selected_task = await TaskService.get_task_by_id(task_id)
+@callback_dispatcher.register(DeleteTaskCallback)
+async def start_delete_task(callback_query: CallbackQuery, callback_data: DeleteTaskCallback, state: FSMContext,
+                            session: AsyncSession):
+    task_id = callback_data.task_id
+    selected_task = await TaskService.get_task_by_id(task_id, session=session)
 
     if selected_task.executor:
         executor_info = f"{selected_task.executor.full_name} - {selected_task.executor.position}"
@@ -536,8 +572,8 @@ async def start_delete_task(callback_query: CallbackQuery, state: FSMContext):
     )
 
     confirm_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="✅ Да, удалить", callback_data=f"confirm_delete:yes:{task_id}")],
-        [InlineKeyboardButton(text="❌ Нет, отменить", callback_data="confirm_delete:no")]
+        [InlineKeyboardButton(text="✅ Да, удалить", callback_data=ConfirmDeleteCallback(answer="yes", task_id=task_id).pack())],
+        [InlineKeyboardButton(text="❌ Нет, отменить", callback_data=ConfirmDeleteCallback(answer="no").pack())]
     ])
 
     await callback_query.message.edit_text(task_info + "\nПодтвердите удаление задачи:", reply_markup=confirm_keyboard)
@@ -545,25 +581,22 @@ async def start_delete_task(callback_query: CallbackQuery, state: FSMContext):
     await state.set_state(TaskDeleteUpdateStates.waiting_for_confirmation)
 
 
-@change_task_router.callback_query(TaskDeleteUpdateStates.waiting_for_confirmation,
-                                   lambda c: c.data and c.data.startswith('confirm_delete:'))
-async def process_delete_task(callback_query: CallbackQuery, state: FSMContext):
-    data_parts = callback_query.data.split(':')
-
-    if data_parts[1] == "yes":
-        task_id = int(data_parts[2])
-        await TaskService.delete_task_for_task_id(task_id)
+@callback_dispatcher.register(ConfirmDeleteCallback, StateFilter(TaskDeleteUpdateStates.waiting_for_confirmation))
+async def process_delete_task(callback_query: CallbackQuery, callback_data: ConfirmDeleteCallback, state: FSMContext,
+                              session: AsyncSession):
+    if callback_data.answer == "yes" and callback_data.task_id is not None:
+        await TaskService.delete_task_for_task_id(callback_data.task_id, session=session)
         await callback_query.message.edit_text("✅ Задача удалена")
         main_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="✏️ Изменить задачу", callback_data="action:update")],
-            [InlineKeyboardButton(text="❌ Удалить задачу", callback_data="action:delete")]
+            [InlineKeyboardButton(text="✏️ Изменить задачу", callback_data=MainActionCallback(action="update").pack())],
+            [InlineKeyboardButton(text="❌ Удалить задачу", callback_data=MainActionCallback(action="delete").pack())]
         ])
         await callback_query.message.answer("Изменение существующей задачи", reply_markup=main_keyboard)
-    elif data_parts[1] == "no":
+    elif callback_data.answer == "no":
         await callback_query.message.edit_text("❌ Задача не была удалена")
         main_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="✏️ Изменить задачу", callback_data="action:update")],
-            [InlineKeyboardButton(text="❌ Удалить задачу", callback_data="action:delete")]
+            [InlineKeyboardButton(text="✏️ Изменить задачу", callback_data=MainActionCallback(action="update").pack())],
+            [InlineKeyboardButton(text="❌ Удалить задачу", callback_data=MainActionCallback(action="delete").pack())]
         ])
         await callback_query.message.answer("Изменение существующей задачи", reply_markup=main_keyboard)
 
@@ -6,9 +6,14 @@ from aiogram.filters import Command, StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import StatesGroup, State
 from aiogram.types import Message, CallbackQuery, InputMediaPhoto, InlineKeyboardMarkup, InlineKeyboardButton
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.keyboards.deadline_keyboars import create_deadline_keyboard, calculate_deadline_from_callback
 from app.services.task_service import TaskService
+from app.handlers.callback_dispatcher import callback_dispatcher
+from app.keyboards.callbacks import (
+    CompletedTasksPageCallback, SelectCompletedTaskCallback, CheckTaskCallback, DeadlineCallback,
+)
 from app.keyboards.select_complete_tasks_keyboards import build_completed_tasks_keyboard
 
 completed_tasks_router = Router()
@@ -20,25 +25,39 @@ class TaskCheckUpdateStates(StatesGroup):
 
 
 @completed_tasks_router.message(Command("completed_tasks"))
-async def get_completed_task(message: Message):
-    completed_tasks = await TaskService.get_completed_tasks()
+async def get_completed_task(message: Message, session: AsyncSession):
+    page = await TaskService.get_completed_tasks_page(session=session)
 
-    if not completed_tasks:
+    if not page.items:
         await message.answer("Выполненных задач нет")
         return
 
-    keyboard = build_completed_tasks_keyboard(completed_tasks)
+    keyboard = build_completed_tasks_keyboard(page.items, page)
     await message.answer("Выберите выполненную задачу для проверки:", reply_markup=keyboard)
 
 
-@completed_tasks_router.callback_query(lambda c: c.data and c.data.startswith('select_completed_tasks:'))
-async def get_completed_task_by_id(callback_query: CallbackQuery, state: FSMContext):
-    task_id_str = callback_query.data.split(':')[1]
-    task_id = int(task_id_str)
+@callback_dispatcher.register(CompletedTasksPageCallback)
+async def paginate_completed_tasks(callback_query: CallbackQuery, callback_data: CompletedTasksPageCallback,
+                                   session: AsyncSession):
+    page = await TaskService.get_completed_tasks_page(callback_data.cursor, callback_data.direction == "prev",
+                                                      session=session)
+
+    if not page.items:
+        await callback_query.message.edit_text("Выполненных задач нет")
+    else:
+        keyboard = build_completed_tasks_keyboard(page.items, page)
+        await callback_query.message.edit_reply_markup(reply_markup=keyboard)
+    await callback_query.answer()
+
+
+@callback_dispatcher.register(SelectCompletedTaskCallback)
+async def get_completed_task_by_id(callback_query: CallbackQuery, callback_data: SelectCompletedTaskCallback,
+                                   state: FSMContext, session: AsyncSession):
+    task_id = callback_data.task_id
 
     await state.update_data(current_task_id=task_id)
 
-    task = await TaskService.get_task_by_id_and_staff(task_id)
+    task = await TaskService.get_task_by_id_and_staff(task_id, session=session)
     if not task:
         await callback_query.message.answer("Ошибка: задача не найдена.")
         await callback_query.answer()
@@ -69,36 +88,36 @@ async def get_completed_task_by_id(callback_query: CallbackQuery, state: FSMCont
     else:
         executor_info = "Исполнитель не назначен"
 
+    if task.manager:
+        manager_info = f"{task.manager.full_name} - {task.manager.position}"
+    else:
+        manager_info = "Менеджер не найден"
+
     response_text = (
         f"«{task.title}»\n"
         f"Описание задачи: {task.description}\n"
         f"Дедлайн: {deadline_str}\n"
         f"\n"
+        f"Поставил: {manager_info}\n"
         f"Сотрудник: {executor_info}\n"
         f"Выполнено: {completed_at_str}\n"
         f"Комментарий к выполненной задачи:\n"
         f"{task.comment or 'Комментарий не был оставлен'}\n"
     )
 
-    if task.photo_url:
-        photo_urls = [url.strip() for url in task.photo_url.split(',') if url.strip()]
-
-        if photo_urls:
-            if len(photo_urls) == 1:
-                await callback_query.message.answer_photo(photo=photo_urls[0], caption=response_text)
-            else:
-                media_group = [InputMediaPhoto(media=url, caption=response_text if i == 0 else None) for i, url in
-                               enumerate(photo_urls)]
-                await callback_query.message.answer_media_group(media=media_group)
-        else:
-            await callback_query.message.answer(response_text)
+    if len(task.photos) == 1:
+        await callback_query.message.answer_photo(photo=task.photos[0].file_id, caption=response_text)
+    elif task.photos:
+        media_group = [InputMediaPhoto(media=photo.file_id, caption=response_text if i == 0 else None) for i, photo in
+                       enumerate(task.photos)]
+        await callback_query.message.answer_media_group(media=media_group)
     else:
         await callback_query.message.answer(response_text)
 
     chek_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="✅ Задача закрыта", callback_data="check_task:closed")],
-        [InlineKeyboardButton(text="❌ Доработать задачу", callback_data="check_task:refine")],
-        [InlineKeyboardButton(text="📋 Вернуться к списку выполненных задач", callback_data="check_task:return")]
+        [InlineKeyboardButton(text="✅ Задача закрыта", callback_data=CheckTaskCallback(action="closed").pack())],
+        [InlineKeyboardButton(text="❌ Доработать задачу", callback_data=CheckTaskCallback(action="refine").pack())],
+        [InlineKeyboardButton(text="📋 Вернуться к списку выполненных задач", callback_data=CheckTaskCallback(action="return").pack())]
     ])
 
     await callback_query.message.answer(
@@ -109,9 +128,10 @@ async def get_completed_task_by_id(callback_query: CallbackQuery, state: FSMCont
     await callback_query.answer()
 
 
-@completed_tasks_router.callback_query(lambda c: c.data and c.data.startswith('check_task:'))
-async def handle_check_task_action(callback_query: CallbackQuery, state: FSMContext):
-    action = callback_query.data.split(':')[1]
+@callback_dispatcher.register(CheckTaskCallback)
+async def handle_check_task_action(callback_query: CallbackQuery, callback_data: CheckTaskCallback, state: FSMContext,
+                                   session: AsyncSession):
+    action = callback_data.action
 
     if action == 'refine':
         user_data = await state.get_data()
@@ -123,7 +143,7 @@ async def handle_check_task_action(callback_query: CallbackQuery, state: FSMCont
             await callback_query.answer()
             return
 
-        refine_task = await TaskService.get_task_by_id(task_id)
+        refine_task = await TaskService.get_task_by_id(task_id, session=session)
         if not refine_task:
             await callback_query.message.edit_text("Ошибка: задача не найдена.")
             await state.clear()
@@ -154,7 +174,7 @@ async def handle_check_task_action(callback_query: CallbackQuery, state: FSMCont
         task_id = user_data.get('current_task_id')
 
         if task_id:
-            await TaskService.delete_task_for_task_id(task_id)
+            await TaskService.delete_task_for_task_id(task_id, session=session)
             await callback_query.message.edit_text(
                 f"Вы закрыли задачу!\n"
                 f"Задача считается выполненной, удалена из списка задач\n",
@@ -163,10 +183,10 @@ async def handle_check_task_action(callback_query: CallbackQuery, state: FSMCont
             await callback_query.message.edit_text("Ошибка: не удалось найти информацию о задаче.")
 
         await state.clear()
-        await get_completed_task(callback_query.message)
+        await get_completed_task(callback_query.message, session)
 
     elif action == 'return':
-        await get_completed_task(callback_query.message)
+        await get_completed_task(callback_query.message, session)
 
     await callback_query.answer()
 
@@ -186,9 +206,9 @@ async def process_new_description(message: Message, state: FSMContext):
     await state.set_state(TaskCheckUpdateStates.waiting_for_deadline)
 
 
-@completed_tasks_router.callback_query(StateFilter(TaskCheckUpdateStates.waiting_for_deadline),
-                                       lambda c: c.data and c.data.startswith('deadline:'))
-async def process_deadline_callback_for_refinement(callback_query: CallbackQuery, state: FSMContext):
+@callback_dispatcher.register(DeadlineCallback, StateFilter(TaskCheckUpdateStates.waiting_for_deadline))
+async def process_deadline_callback_for_refinement(callback_query: CallbackQuery, callback_data: DeadlineCallback,
+                                                   state: FSMContext, session: AsyncSession):
     await callback_query.answer()
 
     user_data = await state.get_data()
@@ -202,28 +222,29 @@ async def process_deadline_callback_for_refinement(callback_query: CallbackQuery
         await state.clear()
         return
 
-    data = callback_query.data
+    choice = callback_data.choice
 
-    if data == "deadline:manual":
+    if choice == "manual":
         await callback_query.message.edit_text(
             "Укажите новую дату и время окончания задачи в формате: 01.01.2025 - 22:30"
         )
         return
 
-    new_deadline = calculate_deadline_from_callback(data)
+    new_deadline = calculate_deadline_from_callback(choice)
 
     result = await TaskService.create_new_task(
         manager_id=manager_id,
         executor_id=executor_id,
         title=new_title,
         description=new_description,
-        deadline=new_deadline
+        deadline=new_deadline,
+        session=session
     )
 
     if result['success']:
         original_task_id = user_data.get('original_task_id')
         if original_task_id:
-            await TaskService.delete_task_for_task_id(original_task_id)
+            await TaskService.delete_task_for_task_id(original_task_id, session=session)
         await callback_query.message.edit_text("✅ Задача пересоздана!")
     else:
         await callback_query.message.edit_text(f"❌ Ошибка: {result['message']}")
@@ -232,7 +253,7 @@ async def process_deadline_callback_for_refinement(callback_query: CallbackQuery
 
 
 @completed_tasks_router.message(TaskCheckUpdateStates.waiting_for_deadline)
-async def process_new_deadline_manual(message: Message, state: FSMContext):
+async def process_new_deadline_manual(message: Message, state: FSMContext, session: AsyncSession):
     input_deadline = message.text.strip()
     try:
         new_deadline = datetime.strptime(input_deadline, "%d.%m.%Y - %H:%M")
@@ -258,13 +279,14 @@ async def process_new_deadline_manual(message: Message, state: FSMContext):
         executor_id=executor_id,
         title=new_title,
         description=new_description,
-        deadline=new_deadline
+        deadline=new_deadline,
+        session=session
     )
 
     if result['success']:
         original_task_id = user_data.get('original_task_id')
         if original_task_id:
-            await TaskService.delete_task_for_task_id(original_task_id)
+            await TaskService.delete_task_for_task_id(original_task_id, session=session)
         await message.answer("✅ Задача пересоздана!")
     else:
         await message.answer(f"❌ Ошибка: {result['message']}")
@@ -6,8 +6,13 @@ from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKe
 from aiogram.filters import Command, StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.task_service import TaskService
+from app.handlers.callback_dispatcher import callback_dispatcher
+from app.keyboards.callbacks import (
+    AssignmentCallback, SelectEmployeeCallback, SelectSectorCallback, EmployeesPageCallback, DeadlineCallback,
+)
 from app.keyboards.create_task_keyboards import create_employee_selection_keyboard
 from core.models.base_model import SectorStatus
 from app.keyboards.deadline_keyboars import create_deadline_keyboard, calculate_deadline_from_callback
@@ -30,30 +35,31 @@ async def start_create_task(message: Message, state: FSMContext):
     await state.update_data(manager_id=manager_id)
 
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="👤 Конкретному сотруднику", callback_data="assignment:employee")],
-        [InlineKeyboardButton(text="🏢 Всему сектору", callback_data="assignment:sector")],
-        [InlineKeyboardButton(text="❌ Отменить создание задачи", callback_data="assignment:cancel")]
+        [InlineKeyboardButton(text="👤 Конкретному сотруднику", callback_data=AssignmentCallback(kind="employee").pack())],
+        [InlineKeyboardButton(text="🏢 Всему сектору", callback_data=AssignmentCallback(kind="sector").pack())],
+        [InlineKeyboardButton(text="❌ Отменить создание задачи", callback_data=AssignmentCallback(kind="cancel").pack())]
     ])
 
     await message.answer("Как вы хотите назначить задачу?", reply_markup=keyboard)
     await state.set_state(CreateTask.waiting_for_assignment_type)
 
 
-@create_task_router.callback_query(lambda c: c.data and c.data.startswith('assignment:'))
-async def process_assignment_type(callback_query: CallbackQuery, state: FSMContext):
-    assignment_type = callback_query.data.split(':')[1]
+@callback_dispatcher.register(AssignmentCallback)
+async def process_assignment_type(callback_query: CallbackQuery, callback_data: AssignmentCallback, state: FSMContext,
+                                  session: AsyncSession):
+    assignment_type = callback_data.kind
 
     if assignment_type == "employee":
-        keyboard = await create_employee_selection_keyboard()
+        keyboard = await create_employee_selection_keyboard(session=session)
         await callback_query.message.edit_text("Выберите сотрудника, которому хотите назначить задачу:",
                                                reply_markup=keyboard)
         await state.set_state(CreateTask.waiting_for_executor_id)
     elif assignment_type == "sector":
         keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="🍸 Бар", callback_data="select_sector:bar")],
-            [InlineKeyboardButton(text="🍽️ Зал", callback_data="select_sector:hall")],
-            [InlineKeyboardButton(text="👨‍🍳 Кухня", callback_data="select_sector:kitchen")],
-            [InlineKeyboardButton(text="❌ Отмена", callback_data="select_sector:cancel")]
+            [InlineKeyboardButton(text="🍸 Бар", callback_data=SelectSectorCallback(sector="bar").pack())],
+            [InlineKeyboardButton(text="🍽️ Зал", callback_data=SelectSectorCallback(sector="hall").pack())],
+            [InlineKeyboardButton(text="👨‍🍳 Кухня", callback_data=SelectSectorCallback(sector="kitchen").pack())],
+            [InlineKeyboardButton(text="❌ Отмена", callback_data=SelectSectorCallback(sector="cancel").pack())]
         ])
 
         await callback_query.message.edit_text("Выберите сектор, которому хотите назначить задачу:",
@@ -66,53 +72,52 @@ async def process_assignment_type(callback_query: CallbackQuery, state: FSMConte
     await callback_query.answer()
 
 
-@create_task_router.callback_query(lambda c: c.data and c.data.startswith('select_employee:'))
-async def process_employee_selection(callback_query: CallbackQuery, state: FSMContext):
-    try:
-        executor_id_str = callback_query.data.split(':')[1]
-        executor_id = int(executor_id_str)
-    except (IndexError, ValueError):
-        await callback_query.answer("Ошибка при обработке выбора сотрудника.", show_alert=True)
-        return
+@callback_dispatcher.register(EmployeesPageCallback)
+async def paginate_employees(callback_query: CallbackQuery, callback_data: EmployeesPageCallback, session: AsyncSession):
+    keyboard = await create_employee_selection_keyboard(callback_data.cursor, callback_data.direction == "prev",
+                                                        session=session)
+    await callback_query.message.edit_reply_markup(reply_markup=keyboard)
+    await callback_query.answer()
+
 
-    await state.update_data(executor_id=executor_id)
+@callback_dispatcher.register(SelectEmployeeCallback)
+async def process_employee_selection(callback_query: CallbackQuery, callback_data: SelectEmployeeCallback,
+                                     state: FSMContext):
+    await state.update_data(executor_id=callback_data.telegram_id)
     await state.update_data(sector_task=None)
     await callback_query.answer()
     await callback_query.message.edit_text("Напишите название задачи")
     await state.set_state(CreateTask.waiting_for_title)
 
 
-@create_task_router.callback_query(lambda c: c.data and c.data.startswith('select_sector:'))
-async def process_sector_selection(callback_query: CallbackQuery, state: FSMContext):
-    try:
-        sector_str = callback_query.data.split(':')[1]
-
-        if sector_str == "cancel":
-            await callback_query.message.edit_text("Создание задачи отменено!")
-            await state.clear()
-            await callback_query.answer()
-            return
-
-        sector_map = {
-            "bar": SectorStatus.BAR,
-            "hall": SectorStatus.HALL,
-            "kitchen": SectorStatus.KITCHEN
-        }
-        sector = sector_map.get(sector_str)
-
-        if not sector:
-            await callback_query.answer("Ошибка при обработке выбора сектора.", show_alert=True)
-            return
-
-        await state.update_data(sector_task=sector)
-        await state.update_data(executor_id=None)
+@callback_dispatcher.register(SelectSectorCallback)
+async def process_sector_selection(callback_query: CallbackQuery, callback_data: SelectSectorCallback,
+                                   state: FSMContext):
+    sector_str = callback_data.sector
+
+    if sector_str == "cancel":
+        await callback_query.message.edit_text("Создание задачи отменено!")
+        await state.clear()
         await callback_query.answer()
-        await callback_query.message.edit_text("Напишите название задачи")
-        await state.set_state(CreateTask.waiting_for_title)
-    except (IndexError, ValueError):
+        return
+
+    sector_map = {
+        "bar": SectorStatus.BAR,
+        "hall": SectorStatus.HALL,
+        "kitchen": SectorStatus.KITCHEN
+    }
+    sector = sector_map.get(sector_str)
+
+    if not sector:
         await callback_query.answer("Ошибка при обработке выбора сектора.", show_alert=True)
         return
 
+    await state.update_data(sector_task=sector)
+    await state.update_data(executor_id=None)
+    await callback_query.answer()
+    await callback_query.message.edit_text("Напишите название задачи")
+    await state.set_state(CreateTask.waiting_for_title)
+
 
 @create_task_router.message(CreateTask.waiting_for_title)
 async def process_title(message: Message, state: FSMContext):
@@ -132,22 +137,22 @@ async def process_description(message: Message, state: FSMContext):
     await state.set_state(CreateTask.waiting_for_deadline)
 
 
-@create_task_router.callback_query(StateFilter(CreateTask.waiting_for_deadline))
-async def process_deadline_callback(callback_query: CallbackQuery, state: FSMContext):
+@callback_dispatcher.register(DeadlineCallback, StateFilter(CreateTask.waiting_for_deadline))
+async def process_deadline_callback(callback_query: CallbackQuery, callback_data: DeadlineCallback, state: FSMContext,
+                                    session: AsyncSession):
     await callback_query.answer()
 
-    data = callback_query.data
-    user_id = callback_query.from_user.id
+    choice = callback_data.choice
 
-    if data == "deadline:manual":
+    if choice == "manual":
         await callback_query.message.edit_text(
             "Укажите дату и время окончания задачи в формате: 01.01.2025 - 22:30"
         )
         return
 
-    deadline_dt = calculate_deadline_from_callback(data)
+    deadline_dt = calculate_deadline_from_callback(choice)
 
-    if data == "deadline:never":
+    if choice == "never":
         await state.update_data(deadline=None)
         await callback_query.message.edit_text("Выбран срок: Бессрочно")
     elif deadline_dt:
@@ -172,7 +177,8 @@ async def process_deadline_callback(callback_query: CallbackQuery, state: FSMCon
         title=title,
         description=description,
         deadline=deadline_dt,
-        sector_task=sector_task
+        sector_task=sector_task,
+        session=session
     )
 
     await state.clear()
@@ -193,7 +199,7 @@ async def process_deadline_callback(callback_query: CallbackQuery, state: FSMCon
 
 
 @create_task_router.message(StateFilter(CreateTask.waiting_for_deadline))
-async def process_deadline_manual(message: Message, state: FSMContext):
+async def process_deadline_manual(message: Message, state: FSMContext, session: AsyncSession):
     deadline_str = message.text.strip()
 
     try:
@@ -220,7 +226,8 @@ async def process_deadline_manual(message: Message, state: FSMContext):
         title=title,
         description=description,
         deadline=deadline_dt,
-        sector_task=sector_task
+        sector_task=sector_task,
+        session=session
     )
 
     await state.clear()
@@ -3,6 +3,7 @@ from aiogram.types import Message
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import StatesGroup, State
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.user_service import UserService
 
@@ -14,8 +15,8 @@ class UserDeleteUpdateStates(StatesGroup):
 
 
 @delete_user_router.message(Command("delete_user"))
-async def start_delete_user(message: Message, state: FSMContext):
-    users_in_db = await UserService.get_all_users()
+async def start_delete_user(message: Message, state: FSMContext, session: AsyncSession):
+    users_in_db = await UserService.get_all_users(session=session)
     if not users_in_db:
         await message.answer("В системе нет сотрудников")
         return
@@ -32,23 +33,23 @@ async def start_delete_user(message: Message, state: FSMContext):
 
 
 @delete_user_router.message(UserDeleteUpdateStates.waiting_for_user_id)
-async def process_delete_user(message: Message, state: FSMContext):
+async def process_delete_user(message: Message, state: FSMContext, session: AsyncSession):
     try:
         id_user_delete = int(message.text)
 
         if id_user_delete == message.from_user.id:
             await message.answer("Вы не можете удалить самого себя!")
-            await start_delete_user(message, state)
+            await start_delete_user(message, state, session)
             return
 
-        result = await UserService.delete_user(id_user_delete)
+        result = await UserService.delete_user(id_user_delete, session=session)
 
         if result["success"]:
             await message.answer(f"✅ {result['message']}")
             await state.clear()
         else:
             await message.answer(f"❌ {result['message']}")
-            await start_delete_user(message, state)
+            await start_delete_user(message, state, session)
 
     except ValueError:
         await message.answer("Пожалуйста, введите корректный числовой ID")
@@ -1,4 +1,3 @@
-from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from aiogram import Router, F
@@ -6,7 +5,10 @@ from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKe
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.handlers.callback_dispatcher import callback_dispatcher
+from app.keyboards.callbacks import SelectTaskCallback, TaskActionCallback, ReportActionCallback, MyTasksPageCallback
 from app.keyboards.select_all_task_keyboard import format_tasks_list, build_tasks_keyboard
 from app.services.task_service import TaskService
 from app.services.user_service import UserService
@@ -20,34 +22,17 @@ class TaskCompletionStates(StatesGroup):
     task_id = State()
 
 
-def is_task_active(task_deadline: datetime | None, current_time: datetime) -> bool:
-    if task_deadline is None:
-        return True
-    kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
-    if task_deadline.tzinfo is None:
-        deadline_with_tz = task_deadline.replace(tzinfo=kemerovo_tz)
-    else:
-        deadline_with_tz = task_deadline.astimezone(kemerovo_tz)
-
-    return deadline_with_tz > current_time
-
-
 @my_task_router.message(Command("my_tasks"))
-async def get_my_tasks(message: Message, state: FSMContext):
+async def get_my_tasks(message: Message, state: FSMContext, session: AsyncSession):
     await state.clear()
-    await show_user_tasks(message)
+    await show_user_tasks(message, session)
 
 
-@my_task_router.callback_query(lambda c: c.data and c.data.startswith('select_tasks:'))
-async def get_task_by_id(callback_query: CallbackQuery, state: FSMContext):
-    try:
-        task_id_str = callback_query.data.split(':')[1]
-        task_id = int(task_id_str)
-    except (IndexError, ValueError):
-        await callback_query.answer("Ошибка обработки запроса.", show_alert=True)
-        return
-
-    task = await TaskService.get_task_by_id(task_id)
+@callback_dispatcher.register(SelectTaskCallback)
+async def get_task_by_id(callback_query: CallbackQuery, callback_data: SelectTaskCallback, state: FSMContext,
+                         session: AsyncSession):
+    task_id = callback_data.task_id
+    task = await TaskService.get_task_by_id(task_id, session=session)
 
     await state.update_data(task_id=task_id)
 
@@ -68,22 +53,23 @@ async def get_task_by_id(callback_query: CallbackQuery, state: FSMContext):
     )
 
     task_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="✅ Задача выполнена", callback_data="task_action:completed")],
-        [InlineKeyboardButton(text="📋 Вернуться к списку задач", callback_data="task_action:return")]
+        [InlineKeyboardButton(text="✅ Задача выполнена", callback_data=TaskActionCallback(action="completed").pack())],
+        [InlineKeyboardButton(text="📋 Вернуться к списку задач", callback_data=TaskActionCallback(action="return").pack())]
     ])
 
     await callback_query.message.answer(response_text, reply_markup=task_keyboard)
     await callback_query.answer()
 
 
-@my_task_router.callback_query(lambda c: c.data and c.data.startswith('task_action:'))
-async def handle_task_action(callback_query: CallbackQuery, state: FSMContext):
-    action = callback_query.data.split(':')[1]
+@callback_dispatcher.register(TaskActionCallback)
+async def handle_task_action(callback_query: CallbackQuery, callback_data: TaskActionCallback, state: FSMContext,
+                             session: AsyncSession):
+    action = callback_data.action
 
     if action == 'completed':
         report_keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="📤 Отправить отчёт", callback_data="report_action:send")],
-            [InlineKeyboardButton(text="❌ Отменить отправку отчёта", callback_data="report_action:cancel")]
+            [InlineKeyboardButton(text="📤 Отправить отчёт", callback_data=ReportActionCallback(action="send").pack())],
+            [InlineKeyboardButton(text="❌ Отменить отправку отчёта", callback_data=ReportActionCallback(action="cancel").pack())]
         ])
 
         await callback_query.message.answer(
@@ -97,14 +83,16 @@ async def handle_task_action(callback_query: CallbackQuery, state: FSMContext):
     elif action == 'return':
         await state.clear()
         await callback_query.message.edit_text("↩️ Возвращаемся к списку задач...")
-        await show_user_tasks(callback_query.message, send_welcome=False)
+        await show_user_tasks(callback_query.message, session, send_welcome=False,
+                              telegram_id=callback_query.from_user.id)
 
     await callback_query.answer()
 
 
-@my_task_router.callback_query(lambda c: c.data and c.data.startswith('report_action:'))
-async def handle_report_action(callback_query: CallbackQuery, state: FSMContext):
-    action = callback_query.data.split(':')[1]
+@callback_dispatcher.register(ReportActionCallback)
+async def handle_report_action(callback_query: CallbackQuery, callback_data: ReportActionCallback, state: FSMContext,
+                               session: AsyncSession):
+    action = callback_data.action
 
     if action == 'send':
         current_state = await state.get_state()
@@ -114,26 +102,24 @@ async def handle_report_action(callback_query: CallbackQuery, state: FSMContext)
         user_data = await state.get_data()
         task_id = user_data.get("task_id")
         comments = user_data.get("comments", [])
-        photos = user_data.get("photos", [])
+        photos = [photo if isinstance(photo, dict) else {"file_id": photo} for photo in user_data.get("photos", [])]
 
         comment = "\n".join(comments) if comments else None
-        photo_url = ",".join(photos) if photos else None
 
-        task = await TaskService.get_task_by_id(task_id)
+        task = await TaskService.get_task_by_id(task_id, session=session)
 
         executor_id = None
         if not task.executor_id:
             executor_id = callback_query.from_user.id
 
-        result = await TaskService.complete_task(task_id, comment, photo_url, executor_id)
+        result = await TaskService.complete_task(task_id, comment, photos, executor_id, session=session)
 
         if result["success"]:
             try:
-                updated_task = await TaskService.get_task_by_id(task_id)
-                employee_user = await UserService.get_user_by_telegram_id(callback_query.from_user.id)
+                employee_user = await UserService.get_user_by_telegram_id(callback_query.from_user.id, session=session)
                 employee_name = f"{employee_user.full_name} - {employee_user.position}" if employee_user else "Неизвестный сотрудник"
 
-                await notify_manager_task_completed(updated_task, employee_name)
+                await notify_manager_task_completed(task, employee_name, session, photo_count=len(photos))
             except Exception as notify_error:
                 print(f"Ошибка при отправке уведомления менеджеру о выполнении задачи {task_id}: {notify_error}")
 
@@ -143,7 +129,8 @@ async def handle_report_action(callback_query: CallbackQuery, state: FSMContext)
             )
 
         await state.clear()
-        await show_user_tasks(callback_query.message, send_welcome=False)
+        await show_user_tasks(callback_query.message, session, send_welcome=False,
+                              telegram_id=callback_query.from_user.id)
 
     elif action == 'cancel':
         current_state = await state.get_state()
@@ -157,8 +144,23 @@ async def handle_report_action(callback_query: CallbackQuery, state: FSMContext)
             "Задача не была выполнена."
         )
 
-        await show_user_tasks(callback_query.message, send_welcome=False)
+        await show_user_tasks(callback_query.message, session, send_welcome=False,
+                              telegram_id=callback_query.from_user.id)
+
+    await callback_query.answer()
+
 
+@callback_dispatcher.register(MyTasksPageCallback)
+async def paginate_user_tasks(callback_query: CallbackQuery, callback_data: MyTasksPageCallback, session: AsyncSession):
+    await show_user_tasks(
+        callback_query.message,
+        session,
+        send_welcome=False,
+        telegram_id=callback_query.from_user.id,
+        cursor=callback_data.cursor,
+        backward=callback_data.direction == "prev",
+        edit=True
+    )
     await callback_query.answer()
 
 
@@ -172,21 +174,29 @@ async def handle_comment(message: Message, state: FSMContext):
 
 
 @my_task_router.message(TaskCompletionStates.waiting_for_report, F.photo)
-async def handle_photo(message: Message, state: FSMContext):
-    photo = message.photo[-1]
-    file_id = photo.file_id
+async def handle_photo(message: Message, state: FSMContext, album: list[Message] | None = None):
+    new_photos = [
+        {"file_id": item.photo[-1].file_id, "file_unique_id": item.photo[-1].file_unique_id,
+         "size": item.photo[-1].file_size}
+        for item in album or [message] if item.photo
+    ]
 
     current_data = await state.get_data()
     photos = current_data.get("photos", [])
-    photos.append(file_id)
+    photos.extend(new_photos)
     await state.update_data(photos=photos)
-    await message.answer("📸 Фотография сохранена. Можете отправить еще материалы или выбрать действие.")
+    if len(new_photos) > 1:
+        await message.answer(f"📸 Сохранено фотографий: {len(new_photos)}. "
+                             f"Можете отправить еще материалы или выбрать действие.")
+    else:
+        await message.answer("📸 Фотография сохранена. Можете отправить еще материалы или выбрать действие.")
 
 
-async def show_user_tasks(message: Message, send_welcome: bool = True):
-    telegram_id = message.from_user.id
+async def show_user_tasks(message: Message, session: AsyncSession, send_welcome: bool = True, telegram_id: int | None = None,
+                          cursor: str | None = None, backward: bool = False, edit: bool = False):
+    telegram_id = telegram_id or message.from_user.id
 
-    user = await UserService.get_user_by_telegram_id(telegram_id)
+    user = await UserService.get_user_by_telegram_id(telegram_id, session=session)
     if not user and send_welcome:
         await message.answer("❌ Пользователь не найден")
         return
@@ -194,32 +204,19 @@ async def show_user_tasks(message: Message, send_welcome: bool = True):
     if not user:
         return
 
-    user_sector = user.sector
-
-    personal_tasks = await TaskService.get_tasks_user(telegram_id)
-
-    sector_tasks = []
-    if user_sector:
-        sector_tasks = await TaskService.get_sector_tasks(user_sector)
-
-    all_tasks = list(personal_tasks)
-    task_ids = {task.task_id for task in personal_tasks}
+    page = await TaskService.get_user_board_page(telegram_id, user.sector, cursor, backward, session=session)
 
-    for sector_task in sector_tasks:
-        if sector_task.task_id not in task_ids:
-            all_tasks.append(sector_task)
-
-    kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
-    current_time = datetime.now(kemerovo_tz)
-
-    active_tasks = [t for t in all_tasks if is_task_active(t.deadline, current_time)]
-    overdue_tasks = [t for t in all_tasks if not is_task_active(t.deadline, current_time) and t.deadline is not None]
+    active_tasks = [task for task, is_overdue in page.items if not is_overdue]
+    overdue_tasks = [task for task, is_overdue in page.items if is_overdue]
 
     active_text = format_tasks_list(active_tasks, "🟢 Активные задачи:")
     overdue_text = format_tasks_list(overdue_tasks, "🔴 Просроченные задачи:")
 
     full_text = active_text + "\n" + overdue_text if (active_text or overdue_text) else "Нет задач для отображения."
 
-    await message.answer(full_text, parse_mode="HTML")
-    keyboard = build_tasks_keyboard(all_tasks)
-    await message.answer("Выберите задачу:", reply_markup=keyboard)
\ No newline at end of file
+    keyboard = build_tasks_keyboard([task for task, _ in page.items], page)
+
+    if edit:
+        await message.edit_text(full_text, parse_mode="HTML", reply_markup=keyboard)
+    else:
+        await message.answer(full_text, parse_mode="HTML", reply_markup=keyboard)
\ No newline at end of file
@@ -1,6 +1,7 @@
 from aiogram import Router
 from aiogram.filters import Command
 from aiogram.types import Message
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.task_service import TaskService
 
@@ -8,8 +9,8 @@ overdue_task = Router()
 
 
 @overdue_task.message(Command("all_overdue_task"))
-async def get_all_overdue_task_staff(message: Message):
-    overdue_tasks_with_users = await TaskService.get_all_overdue_tasks()
+async def get_all_overdue_task_staff(message: Message, session: AsyncSession):
+    overdue_tasks_with_users = await TaskService.get_all_overdue_tasks(session=session)
     if not overdue_tasks_with_users:
         await message.answer("Нет просроченных задач.")
         return
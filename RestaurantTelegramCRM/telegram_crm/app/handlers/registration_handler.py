@@ -3,7 +3,10 @@ from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKe
 from aiogram.filters import CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.handlers.callback_dispatcher import callback_dispatcher
+from app.keyboards.callbacks import RoleCallback, RegSectorCallback
 from app.services.user_service import UserService
 from core.models.base_model import UserRole, SectorStatus
 
@@ -18,8 +21,8 @@ class Registration(StatesGroup):
 
 
 @register_router.message(CommandStart())
-async def start_registration(message: Message, state: FSMContext):
-    existing_user = await UserService.get_user_by_telegram_id(message.from_user.id)
+async def start_registration(message: Message, state: FSMContext, session: AsyncSession):
+    existing_user = await UserService.get_user_by_telegram_id(message.from_user.id, session=session)
     if existing_user:
         await message.answer(f"С возвращением, {existing_user.full_name}!")
         return
@@ -38,17 +41,17 @@ async def process_full_name(message: Message, state: FSMContext):
     await state.update_data(full_name=full_name)
 
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="Менеджер", callback_data="role:manager")],
-        [InlineKeyboardButton(text="Работник", callback_data="role:staff")]
+        [InlineKeyboardButton(text="Менеджер", callback_data=RoleCallback(role="manager").pack())],
+        [InlineKeyboardButton(text="Работник", callback_data=RoleCallback(role="staff").pack())]
     ])
 
     await message.answer("Отлично! Кем вы являетесь в нашем ресторане?", reply_markup=keyboard)
     await state.set_state(Registration.waiting_for_role)
 
 
-@register_router.callback_query(lambda c: c.data and c.data.startswith('role:'))
-async def process_role(callback_query: CallbackQuery, state: FSMContext):
-    role_str = callback_query.data.split(':')[1]
+@callback_dispatcher.register(RoleCallback)
+async def process_role(callback_query: CallbackQuery, callback_data: RoleCallback, state: FSMContext):
+    role_str = callback_data.role
 
     role_mapping = {
         "manager": UserRole.MANAGER,
@@ -63,19 +66,19 @@ async def process_role(callback_query: CallbackQuery, state: FSMContext):
     await callback_query.answer()
 
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="Бар", callback_data="reg_sector:bar")],
-        [InlineKeyboardButton(text="Зал", callback_data="reg_sector:hall")],
-        [InlineKeyboardButton(text="Кухня", callback_data="reg_sector:kitchen")],
-        [InlineKeyboardButton(text="Нет рабочей зоны", callback_data="reg_sector:none")]
+        [InlineKeyboardButton(text="Бар", callback_data=RegSectorCallback(sector="bar").pack())],
+        [InlineKeyboardButton(text="Зал", callback_data=RegSectorCallback(sector="hall").pack())],
+        [InlineKeyboardButton(text="Кухня", callback_data=RegSectorCallback(sector="kitchen").pack())],
+        [InlineKeyboardButton(text="Нет рабочей зоны", callback_data=RegSectorCallback(sector="none").pack())]
     ])
 
     await callback_query.message.edit_text("Укажите рабочую зону:", reply_markup=keyboard)
     await state.set_state(Registration.waiting_for_sector)
 
 
-@register_router.callback_query(lambda c: c.data and c.data.startswith('reg_sector:'))
-async def process_sector(callback_query: CallbackQuery, state: FSMContext):
-    sector_str = callback_query.data.split(':')[1]
+@callback_dispatcher.register(RegSectorCallback)
+async def process_sector(callback_query: CallbackQuery, callback_data: RegSectorCallback, state: FSMContext):
+    sector_str = callback_data.sector
 
     sector_mapping = {
         "bar": SectorStatus.BAR,
@@ -95,7 +98,7 @@ async def process_sector(callback_query: CallbackQuery, state: FSMContext):
 
 
 @register_router.message(Registration.waiting_for_position)
-async def process_position(message: Message, state: FSMContext):
+async def process_position(message: Message, state: FSMContext, session: AsyncSession):
     position = message.text.strip()
     if not position:
         await message.answer("Пожалуйста, укажите вашу должность:")
@@ -107,7 +110,8 @@ async def process_position(message: Message, state: FSMContext):
         full_name=data['full_name'],
         role=data['role'],
         position=position,
-        sector=data['sector']
+        sector=data['sector'],
+        session=session
     )
     await state.clear()
 
@@ -1,16 +1,19 @@
 from aiogram import Router
 from aiogram.filters import Command
-from aiogram.types import Message
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.handlers.callback_dispatcher import callback_dispatcher
+from app.keyboards.callbacks import StaffTasksPageCallback
+from app.keyboards.pagination_keyboard import build_pagination_row
+from app.repository.pagination import Page
 from app.services.task_service import TaskService
 from core.models.base_model import TaskStatus, SectorStatus
 
 staff_tasks_router = Router()
 
 
-@staff_tasks_router.message(Command("staff_tasks"))
-async def get_staff_task(message: Message):
-    staff_tasks = await TaskService.get_staff_tasks()
+def format_staff_tasks_page(page: Page) -> str:
     temp_list = []
 
     sector_names = {
@@ -19,7 +22,7 @@ async def get_staff_task(message: Message):
         SectorStatus.KITCHEN: "Кухня"
     }
 
-    for i, task in enumerate(staff_tasks, 1):
+    for i, task in enumerate(page.items, 1):
         if task.executor:
             executor_info = f"{task.executor.full_name}-{task.executor.position}"
         else:
@@ -35,8 +38,30 @@ async def get_staff_task(message: Message):
 
         temp_list.append(f"{i}. {executor_info}:\n({status_text}) {task.title}\n{task.description}\n\n")
 
-    if temp_list:
-        tasks_str = "\n".join(temp_list)
-        await message.answer(f"Все задачи сотрудников:\n{tasks_str}")
-    else:
-        await message.answer("Нет задач для отображения")
\ No newline at end of file
+    if not temp_list:
+        return "Нет задач для отображения"
+
+    tasks_str = "\n".join(temp_list)
+    return f"Все задачи сотрудников:\n{tasks_str}"
+
+
+def build_staff_tasks_keyboard(page: Page) -> InlineKeyboardMarkup | None:
+    pagination_row = build_pagination_row(StaffTasksPageCallback, page)
+    if not pagination_row:
+        return None
+    return InlineKeyboardMarkup(inline_keyboard=[pagination_row])
+
+
+@staff_tasks_router.message(Command("staff_tasks"))
+async def get_staff_task(message: Message, session: AsyncSession):
+    page = await TaskService.get_staff_tasks_page(session=session)
+    await message.answer(format_staff_tasks_page(page), reply_markup=build_staff_tasks_keyboard(page))
+
+
+@callback_dispatcher.register(StaffTasksPageCallback)
+async def paginate_staff_tasks(callback_query: CallbackQuery, callback_data: StaffTasksPageCallback,
+                               session: AsyncSession):
+    page = await TaskService.get_staff_tasks_page(callback_data.cursor, callback_data.direction == "prev",
+                                                  session=session)
+    await callback_query.message.edit_text(format_staff_tasks_page(page), reply_markup=build_staff_tasks_keyboard(page))
+    await callback_query.answer()
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Job:
+    name: str
+    factory: Callable[[], Awaitable[None]]
+
+
+class JobRegistry:
+    def __init__(self):
+        self._jobs: dict[str, Job] = {}
+
+    def register(self, name: str, factory: Callable[[], Awaitable[None]]):
+        if name in self._jobs:
+            raise ValueError(f"Фоновая задача {name} уже зарегистрирована")
+        self._jobs[name] = Job(name, factory)
+
+    def __iter__(self):
+        return iter(self._jobs.values())
+
+    def __len__(self):
+        return len(self._jobs)
+
+
+class JobSupervisor:
+    def __init__(
+            self,
+            registry: JobRegistry,
+            restart_delay: float = 1.0,
+            max_restart_delay: float = 60.0,
+            jitter: float = 0.1,
+            shutdown_timeout: float = 10.0,
+    ):
+        self.registry = registry
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.jitter = jitter
+        self.shutdown_timeout = shutdown_timeout
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    async def start(self):
+        for job in self.registry:
+            if job.name in self._tasks:
+                continue
+            self._tasks[job.name] = asyncio.create_task(self._supervise(job), name=f"job:{job.name}")
+        logger.info(f"Запущено фоновых задач: {len(self._tasks)}")
+
+    async def stop(self):
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        if not tasks:
+            return
+
+        for task in tasks:
+            task.cancel()
+
+        _, pending = await asyncio.wait(tasks, timeout=self.shutdown_timeout)
+        for task in pending:
+            logger.warning(f"Фоновая задача {task.get_name()} не остановилась за {self.shutdown_timeout} с")
+        logger.info("Фоновые задачи остановлены")
+
+    def _restart_delay(self, failures: int) -> float:
+        delay = min(self.max_restart_delay, self.restart_delay * 2 ** (failures - 1))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def _supervise(self, job: Job):
+        loop = asyncio.get_running_loop()
+        failures = 0
+
+        while True:
+            started_at = loop.time()
+            try:
+                await job.factory()
+                logger.info(f"Фоновая задача {job.name} завершена")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Фоновая задача {job.name} упала: {e}")
+
+            if loop.time() - started_at >= self.max_restart_delay:
+                failures = 0
+            failures += 1
+
+            delay = self._restart_delay(failures)
+            logger.info(f"Перезапуск фоновой задачи {job.name} через {delay:.1f} с (попытка {failures})")
+            await asyncio.sleep(delay)
@@ -0,0 +1,104 @@
+from aiogram.filters.callback_data import CallbackData
+
+
+class RoleCallback(CallbackData, prefix="role"):
+    role: str
+
+
+class RegSectorCallback(CallbackData, prefix="reg_sector"):
+    sector: str
+
+
+class AssignmentCallback(CallbackData, prefix="assignment"):
+    kind: str
+
+
+class SelectEmployeeCallback(CallbackData, prefix="select_employee"):
+    telegram_id: int
+
+
+class SelectSectorCallback(CallbackData, prefix="select_sector"):
+    sector: str
+
+
+class DeadlineCallback(CallbackData, prefix="deadline"):
+    choice: str
+
+
+class SelectTaskCallback(CallbackData, prefix="select_tasks"):
+    task_id: int
+
+
+class TaskActionCallback(CallbackData, prefix="task_action"):
+    action: str
+
+
+class ReportActionCallback(CallbackData, prefix="report_action"):
+    action: str
+
+
+class MainActionCallback(CallbackData, prefix="action"):
+    action: str
+
+
+class UpdateTaskCallback(CallbackData, prefix="update_task"):
+    task_id: int
+
+
+class DeleteTaskCallback(CallbackData, prefix="delete_task"):
+    task_id: int
+
+
+class ConfirmDeleteCallback(CallbackData, prefix="confirm_delete"):
+    answer: str
+    task_id: int | None = None
+
+
+class FieldCallback(CallbackData, prefix="field"):
+    field: str
+
+
+class TaskSectorCallback(CallbackData, prefix="task_sector"):
+    sector: str
+
+
+class ContinueCallback(CallbackData, prefix="continue"):
+    answer: str
+
+
+class SelectCompletedTaskCallback(CallbackData, prefix="select_completed_tasks"):
+    task_id: int
+
+
+class CheckTaskCallback(CallbackData, prefix="check_task"):
+    action: str
+
+
+class MyTasksPageCallback(CallbackData, prefix="my_tasks_page"):
+    direction: str
+    cursor: str
+
+
+class DeleteTasksPageCallback(CallbackData, prefix="delete_tasks_page"):
+    direction: str
+    cursor: str
+
+
+class UpdateTasksPageCallback(CallbackData, prefix="update_tasks_page"):
+    direction: str
+    cursor: str
+
+
+class EmployeesPageCallback(CallbackData, prefix="employees_page"):
+    direction: str
+    cursor: str
+
+
+class CompletedTasksPageCallback(CallbackData, prefix="completed_page"):
+    direction: str
+    cursor: str
+
+
+class StaffTasksPageCallback(CallbackData, prefix="staff_tasks_page"):
+    direction: str
+    cursor: str
@@ -1,8 +1,11 @@
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from core.models import Task, SectorStatus
+from app.keyboards.callbacks import DeleteTaskCallback, UpdateTaskCallback, DeleteTasksPageCallback, UpdateTasksPageCallback
+from app.keyboards.pagination_keyboard import build_pagination_row
+from app.repository.pagination import Page
 
 
-def build_delete_tasks_keyboard(tasks: list[Task]) -> InlineKeyboardMarkup:
+def build_delete_tasks_keyboard(tasks: list[Task], page: Page | None = None) -> InlineKeyboardMarkup:
     keyboard = []
     for task in tasks:
         if task.executor:
@@ -21,14 +24,18 @@ def build_delete_tasks_keyboard(tasks: list[Task]) -> InlineKeyboardMarkup:
 
         button = InlineKeyboardButton(
             text=f"{task.title} - {executor_display}",
-            callback_data=f"delete_task:{task.task_id}"
+            callback_data=DeleteTaskCallback(task_id=task.task_id).pack()
         )
         keyboard.append([button])
 
+    pagination_row = build_pagination_row(DeleteTasksPageCallback, page)
+    if pagination_row:
+        keyboard.append(pagination_row)
+
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
-def build_update_tasks_keyboard(tasks: list[Task]) -> InlineKeyboardMarkup:
+def build_update_tasks_keyboard(tasks: list[Task], page: Page | None = None) -> InlineKeyboardMarkup:
     keyboard = []
     for task in tasks:
         if task.executor:
@@ -47,8 +54,12 @@ def build_update_tasks_keyboard(tasks: list[Task]) -> InlineKeyboardMarkup:
 
         button = InlineKeyboardButton(
             text=f"{task.title} - {executor_display}",
-            callback_data=f"update_task:{task.task_id}"
+            callback_data=UpdateTaskCallback(task_id=task.task_id).pack()
         )
         keyboard.append([button])
 
+    pagination_row = build_pagination_row(UpdateTasksPageCallback, page)
+    if pagination_row:
+        keyboard.append(pagination_row)
+
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
\ No newline at end of file
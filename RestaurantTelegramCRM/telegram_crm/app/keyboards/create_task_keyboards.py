@@ -1,26 +1,34 @@
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.keyboards.callbacks import SelectEmployeeCallback, SelectSectorCallback, EmployeesPageCallback
+from app.keyboards.pagination_keyboard import build_pagination_row
 from app.services.user_service import UserService
 
 
-async def create_employee_selection_keyboard() -> InlineKeyboardMarkup:
-    employees = await UserService.get_all_users()
+async def create_employee_selection_keyboard(cursor: str | None = None, backward: bool = False,
+                                             session: AsyncSession | None = None) -> InlineKeyboardMarkup:
+    page = await UserService.get_users_page(cursor, backward, session=session)
     buttons = []
-    for employee in employees:
+    for employee in page.items:
         button = InlineKeyboardButton(
             text=f"{employee.position} - {employee.full_name}",
-            callback_data=f"select_employee:{employee.telegram_id}"
+            callback_data=SelectEmployeeCallback(telegram_id=employee.telegram_id).pack()
         )
         buttons.append([button])
 
+    pagination_row = build_pagination_row(EmployeesPageCallback, page)
+    if pagination_row:
+        buttons.append(pagination_row)
+
     keyboard = InlineKeyboardMarkup(inline_keyboard=buttons)
     return keyboard
 
 
 def create_sector_selection_keyboard() -> InlineKeyboardMarkup:
     keyboard = [
-        [InlineKeyboardButton(text="🍸 Бар", callback_data="select_sector:bar")],
-        [InlineKeyboardButton(text="🍽️ Зал", callback_data="select_sector:hall")],
-        [InlineKeyboardButton(text="👨‍🍳 Кухня", callback_data="select_sector:kitchen")]
+        [InlineKeyboardButton(text="🍸 Бар", callback_data=SelectSectorCallback(sector="bar").pack())],
+        [InlineKeyboardButton(text="🍽️ Зал", callback_data=SelectSectorCallback(sector="hall").pack())],
+        [InlineKeyboardButton(text="👨‍🍳 Кухня", callback_data=SelectSectorCallback(sector="kitchen").pack())]
     ]
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
\ No newline at end of file
@@ -1,42 +1,45 @@
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from datetime import datetime, timedelta
 
+from app.keyboards.callbacks import DeadlineCallback
+
+
 def create_deadline_keyboard() -> InlineKeyboardMarkup:
     buttons = [
         [
-            InlineKeyboardButton(text="1 день", callback_data="deadline:1d"),
-            InlineKeyboardButton(text="2 дня", callback_data="deadline:2d"),
+            InlineKeyboardButton(text="1 день", callback_data=DeadlineCallback(choice="1d").pack()),
+            InlineKeyboardButton(text="2 дня", callback_data=DeadlineCallback(choice="2d").pack()),
         ],
         [
-            InlineKeyboardButton(text="1 неделя", callback_data="deadline:1w"),
-            InlineKeyboardButton(text="2 недели", callback_data="deadline:2w"),
+            InlineKeyboardButton(text="1 неделя", callback_data=DeadlineCallback(choice="1w").pack()),
+            InlineKeyboardButton(text="2 недели", callback_data=DeadlineCallback(choice="2w").pack()),
         ],
         [
-            InlineKeyboardButton(text="Бессрочно", callback_data="deadline:never"),
+            InlineKeyboardButton(text="Бессрочно", callback_data=DeadlineCallback(choice="never").pack()),
         ],
         [
-            InlineKeyboardButton(text="Указать вручную", callback_data="deadline:manual"),
+            InlineKeyboardButton(text="Указать вручную", callback_data=DeadlineCallback(choice="manual").pack()),
         ],
     ]
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-def calculate_deadline_from_callback(callback_data: str, base_time: datetime = None) -> datetime | None:
+def calculate_deadline_from_callback(choice: str, base_time: datetime = None) -> datetime | None:
     if not base_time:
         from zoneinfo import ZoneInfo
         base_time = datetime.now(ZoneInfo("Asia/Krasnoyarsk"))
 
-    if callback_data == "deadline:1d":
+    if choice == "1d":
         return base_time + timedelta(days=1)
-    elif callback_data == "deadline:2d":
+    elif choice == "2d":
         return base_time + timedelta(days=2)
-    elif callback_data == "deadline:1w":
+    elif choice == "1w":
         return base_time + timedelta(weeks=1)
-    elif callback_data == "deadline:2w":
+    elif choice == "2w":
         return base_time + timedelta(weeks=2)
-    elif callback_data == "deadline:never":
+    elif choice == "never":
         return None
-    elif callback_data == "deadline:manual":
+    elif choice == "manual":
         return None
     else:
         return None
\ No newline at end of file
@@ -0,0 +1,17 @@
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import InlineKeyboardButton
+
+from app.repository.pagination import Page
+
+
+def build_pagination_row(factory: type[CallbackData], page: Page | None) -> list[InlineKeyboardButton]:
+    if page is None:
+        return []
+
+    row = []
+    if page.prev_cursor:
+        row.append(InlineKeyboardButton(text="⬅️ Назад", callback_data=factory(direction="prev", cursor=page.prev_cursor).pack()))
+    if page.next_cursor:
+        row.append(InlineKeyboardButton(text="Вперёд ➡️", callback_data=factory(direction="next", cursor=page.next_cursor).pack()))
+    return row
+
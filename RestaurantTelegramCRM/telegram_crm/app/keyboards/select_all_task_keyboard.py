@@ -1,5 +1,8 @@
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from core.models import Task
+from app.keyboards.callbacks import SelectTaskCallback, MyTasksPageCallback
+from app.keyboards.pagination_keyboard import build_pagination_row
+from app.repository.pagination import Page
 
 
 def format_tasks_list(tasks: list[Task], header: str) -> str:
@@ -22,7 +25,7 @@ def format_tasks_list(tasks: list[Task], header: str) -> str:
     return f"<b>{header}</b>\n" + "\n".join(task_lines) if task_lines else ""
 
 
-def build_tasks_keyboard(tasks: list[Task]) -> InlineKeyboardMarkup:
+def build_tasks_keyboard(tasks: list[Task], page: Page | None = None) -> InlineKeyboardMarkup:
     keyboard = []
     for task in tasks:
         if task.executor:
@@ -32,8 +35,12 @@ def build_tasks_keyboard(tasks: list[Task]) -> InlineKeyboardMarkup:
 
         button = InlineKeyboardButton(
             text=f"{task.title} - {executor_display}",
-            callback_data=f"select_tasks:{task.task_id}"
+            callback_data=SelectTaskCallback(task_id=task.task_id).pack()
         )
         keyboard.append([button])
 
+    pagination_row = build_pagination_row(MyTasksPageCallback, page)
+    if pagination_row:
+        keyboard.append(pagination_row)
+
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
\ No newline at end of file
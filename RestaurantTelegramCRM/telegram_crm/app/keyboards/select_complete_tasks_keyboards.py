@@ -1,8 +1,11 @@
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from core.models import Task
+from app.keyboards.callbacks import SelectCompletedTaskCallback, CompletedTasksPageCallback
+from app.keyboards.pagination_keyboard import build_pagination_row
+from app.repository.pagination import Page
 
 
-def build_completed_tasks_keyboard(tasks: list[Task]) -> InlineKeyboardMarkup:
+def build_completed_tasks_keyboard(tasks: list[Task], page: Page | None = None) -> InlineKeyboardMarkup:
     keyboard = []
     for task in tasks:
         if task.executor:
@@ -14,8 +17,12 @@ def build_completed_tasks_keyboard(tasks: list[Task]) -> InlineKeyboardMarkup:
 
         button = InlineKeyboardButton(
             text=button_text,
-            callback_data=f"select_completed_tasks:{task.task_id}"
+            callback_data=SelectCompletedTaskCallback(task_id=task.task_id).pack()
         )
         keyboard.append([button])
 
+    pagination_row = build_pagination_row(CompletedTasksPageCallback, page)
+    if pagination_row:
+        keyboard.append(pagination_row)
+
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
\ No newline at end of file
@@ -1,76 +1,74 @@
+import logging
 from typing import Any, Awaitable, Callable, Dict
 
 from aiogram import BaseMiddleware
-from aiogram.types import TelegramObject, Message
+from aiogram.types import TelegramObject, Message, CallbackQuery
 
+from app.services.permissions import PermissionTable, permission_table, parse_command, parse_callback_prefix
 from app.services.user_service import UserService
-from core.models.base_model import UserRole
 
-ROLE_STAFF = "STAFF"
-ROLE_MANAGER = "MANAGER"
+logger = logging.getLogger(__name__)
 
-ACCESS_RULES = {
-    ROLE_STAFF: ["my_tasks"],
-}
+NOT_REGISTERED_TEXT = "❌ Вы не зарегистрированы в системе. Обратитесь к администратору."
+ACCESS_ERROR_TEXT = "❌ Ошибка проверки прав доступа. Попробуйте позже."
 
-ALL_PROTECTED_COMMANDS = [
-    "create_task", "my_tasks", "all_overdue_task",
-    "completed_tasks", "change_task", "delete_user", "staff_tasks",
-]
 
-class CommandAccessMiddleware(BaseMiddleware):
+class AccessMiddleware(BaseMiddleware):
+    def __init__(self, permissions: PermissionTable = permission_table):
+        self.permissions = permissions
+
     async def __call__(
             self,
             handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
             event: TelegramObject,
             data: Dict[str, Any]
     ) -> Any:
-
-        if not isinstance(event, Message):
-            return await handler(event, data)
-
-        if not event.text or not event.text.startswith('/'):
+        if isinstance(event, Message):
+            command = parse_command(event.text)
+            if command is None:
+                return await handler(event, data)
+            action = f"/{command}"
+            allowed_roles = self.permissions.roles_for_command(command)
+        elif isinstance(event, CallbackQuery):
+            prefix = parse_callback_prefix(event.data)
+            action = f"callback:{prefix}"
+            allowed_roles = self.permissions.roles_for_callback(prefix)
+        else:
             return await handler(event, data)
 
-        command = event.text[1:].split()[0]
-
-        if command == "start":
+        if allowed_roles is None:
             return await handler(event, data)
 
         user_telegram_id = event.from_user.id
-
         try:
-            user = await UserService.get_user_by_telegram_id(user_telegram_id)
-            data['user'] = user
+            user = await UserService.get_user_by_telegram_id(user_telegram_id, session=data.get('session'))
         except Exception as e:
-            print(f"Ошибка при загрузке пользователя {user_telegram_id}: {e}")
-            await event.answer("❌ Ошибка проверки прав доступа. Попробуйте позже.")
+            logger.error(f"Ошибка при загрузке пользователя {user_telegram_id}: {e}",
+                         extra={"context": {"user_id": user_telegram_id, "action": action}})
+            await self._deny(event, ACCESS_ERROR_TEXT)
             return
 
-        if not user:
-            await event.answer(
-                "❌ Вы не зарегистрированы в системе. "
-                "Обратитесь к администратору."
-            )
+        if user is None:
+            logger.warning(f"Незарегистрированный пользователь запросил {action}",
+                           extra={"context": {"user_id": user_telegram_id, "action": action, "allowed": False}})
+            await self._deny(event, NOT_REGISTERED_TEXT)
             return
 
-        user_role = getattr(user, 'role', None)
-        has_access = False
-        if user_role == UserRole.MANAGER:
-            has_access = True
-        elif user_role == UserRole.STAFF:
-            allowed_commands_for_staff = ACCESS_RULES.get(ROLE_STAFF, [])
-            if command in allowed_commands_for_staff:
-                has_access = True
-
-        if has_access:
-            print(
-                f"Пользователь {user.full_name} (ID: {user.telegram_id}, роль: {user_role}) выполнил команду /{command}")
+        data['user'] = user
+        context = {"user_id": user_telegram_id, "role": user.role.name, "action": action}
+        if user.role in allowed_roles:
+            logger.debug(f"Доступ к {action} разрешён", extra={"context": {**context, "allowed": True}})
             return await handler(event, data)
+
+        logger.warning(f"Доступ к {action} запрещён", extra={"context": {**context, "allowed": False}})
+        if isinstance(event, Message):
+            await self._deny(event, f"❌ У вас нет прав для выполнения команды {action}.")
+        else:
+            await self._deny(event, "❌ У вас нет прав для выполнения этого действия.")
+
+    @staticmethod
+    async def _deny(event: Message | CallbackQuery, text: str):
+        if isinstance(event, CallbackQuery):
+            await event.answer(text, show_alert=True)
         else:
-            print(
-                f"Пользователю {user.full_name} (ID: {user.telegram_id}, роль: {user_role}) отказано в доступе к команде /{command}")
-            await event.answer(
-                f"❌ У вас нет прав для выполнения команды /{command}."
-            )
-            return
\ No newline at end of file
+            await event.answer(text)
@@ -0,0 +1,53 @@
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+from aiogram.types import TelegramObject
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.db_helper import db_helper
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+current_session: ContextVar[AsyncSession | None] = ContextVar("current_session", default=None)
+
+
+class DbSessionMiddleware(BaseMiddleware):
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any]
+    ) -> Any:
+        async with self.session_factory() as session:
+            data['session'] = session
+            token = current_session.set(session)
+            try:
+                result = await handler(event, data)
+            except Exception:
+                await db_helper.rollback(session)
+                raise
+            finally:
+                current_session.reset(token)
+            await db_helper.commit(session)
+            return result
+
+
+class ReleaseReadOnlySessionMiddleware(BaseRequestMiddleware):
+    async def __call__(
+            self,
+            make_request: NextRequestMiddlewareType[TelegramType],
+            bot: "Bot",
+            method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        session = current_session.get()
+        if session is not None and session.in_transaction() and db_helper.is_read_only(session):
+            await session.commit()
+        return await make_request(bot, method)
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import Message, TelegramObject, Update
+
+if TYPE_CHECKING:
+    from aiogram import Bot, Dispatcher
+
+logger = logging.getLogger(__name__)
+
+
+class MediaGroupMiddleware(BaseMiddleware):
+    def __init__(self, dispatcher: "Dispatcher", window: float):
+        self.dispatcher = dispatcher
+        self.window = window
+        self._groups: dict[tuple[int, str], list[Message]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any]
+    ) -> Any:
+        message = event.message if isinstance(event, Update) else None
+        if message is None or message.media_group_id is None or "album" in data:
+            return await handler(event, data)
+
+        key = (message.chat.id, message.media_group_id)
+        group = self._groups.get(key)
+        if group is not None:
+            group.append(message)
+            return None
+
+        self._groups[key] = [message]
+        task = asyncio.create_task(self._flush(key, data["bot"], event))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return None
+
+    async def _flush(self, key: tuple[int, str], bot: "Bot", update: Update):
+        group = self._groups[key]
+        try:
+            received = 0
+            while received != len(group):
+                received = len(group)
+                await asyncio.sleep(self.window)
+        finally:
+            del self._groups[key]
+
+        chat_id, media_group_id = key
+        logger.info(f"Собран альбом {media_group_id} из {len(group)} сообщений в чате {chat_id}")
+        try:
+            await self.dispatcher.feed_update(bot, update, album=sorted(group, key=lambda item: item.message_id))
+        except Exception as e:
+            logger.error(f"Ошибка обработки альбома {media_group_id} в чате {chat_id}: {e}")
+
+    async def close(self):
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
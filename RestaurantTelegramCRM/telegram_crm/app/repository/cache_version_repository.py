@@ -0,0 +1,31 @@
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.cache_version_model import CacheVersion
+
+
+class CacheVersionRepository:
+    def __init__(self, async_session: AsyncSession):
+        self.session = async_session
+
+    async def get_version(self, name: str) -> int:
+        version = await self.session.scalar(select(CacheVersion.version).where(CacheVersion.name == name))
+        return version or 0
+
+    async def bump_version(self, name: str):
+        stmt = (
+            update(CacheVersion)
+            .where(CacheVersion.name == name)
+            .values(version=CacheVersion.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        if result.rowcount:
+            return
+
+        try:
+            async with self.session.begin_nested():
+                self.session.add(CacheVersion(name=name, version=1))
+        except IntegrityError:
+            await self.session.execute(stmt)
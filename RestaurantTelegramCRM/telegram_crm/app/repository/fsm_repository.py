@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import select, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.fsm_state_model import FsmState
+
+
+class FsmRepository:
+    def __init__(self, async_session: AsyncSession):
+        self.session = async_session
+
+    async def get_state(self, key: str) -> FsmState | None:
+        result = await self.session.execute(select(FsmState).where(FsmState.key == key))
+        return result.scalar_one_or_none()
+
+    async def replace_states(self, keys: list[str], rows: list[dict]):
+        await self.session.execute(delete(FsmState).where(FsmState.key.in_(keys)))
+        if rows:
+            await self.session.execute(insert(FsmState), rows)
+
+    async def delete_expired_states(self, expired_before: datetime) -> int:
+        result = await self.session.execute(
+            delete(FsmState).where(FsmState.updated_at < expired_before)
+        )
+        return result.rowcount
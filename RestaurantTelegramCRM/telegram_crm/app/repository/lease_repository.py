@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from sqlalchemy import update, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.leader_lease_model import LeaderLease
+
+
+class LeaseRepository:
+    def __init__(self, async_session: AsyncSession):
+        self.session = async_session
+
+    async def try_acquire(self, name: str, holder: str, current_time: datetime, expires_at: datetime) -> bool:
+        stmt = (
+            update(LeaderLease)
+            .where(
+                LeaderLease.name == name,
+                or_(LeaderLease.holder == holder, LeaderLease.expires_at < current_time)
+            )
+            .values(holder=holder, expires_at=expires_at)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        if result.rowcount:
+            return True
+
+        try:
+            async with self.session.begin_nested():
+                self.session.add(LeaderLease(name=name, holder=holder, expires_at=expires_at))
+        except IntegrityError:
+            return False
+        return True
+
+    async def release(self, name: str, holder: str, current_time: datetime):
+        await self.session.execute(
+            update(LeaderLease)
+            .where(LeaderLease.name == name, LeaderLease.holder == holder)
+            .values(expires_at=current_time)
+            .execution_options(synchronize_session=False)
+        )
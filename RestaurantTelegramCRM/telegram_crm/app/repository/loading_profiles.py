@@ -0,0 +1,8 @@
+from sqlalchemy.orm import joinedload, selectinload
+
+from core.models import Task
+
+LEAN_USER = ()
+LEAN_TASK = ()
+TASK_WITH_EXECUTOR = (joinedload(Task.executor),)
+TASK_FULL_GRAPH = (joinedload(Task.executor), joinedload(Task.manager), selectinload(Task.photos))
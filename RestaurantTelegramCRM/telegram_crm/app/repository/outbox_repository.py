@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.outbox_model import OutboxMessage
+from core.models.base_model import OutboxStatus
+
+
+class OutboxRepository:
+    def __init__(self, async_session: AsyncSession):
+        self.session = async_session
+
+    def add_messages(self, chat_ids: list[int], text: str, parse_mode: str | None, next_attempt_at: datetime):
+        self.session.add_all([
+            OutboxMessage(chat_id=chat_id, text=text, parse_mode=parse_mode, next_attempt_at=next_attempt_at)
+            for chat_id in chat_ids
+        ])
+
+    async def claim_batch(self, current_time: datetime, lease_until: datetime, limit: int) -> list[OutboxMessage]:
+        due_ids = (
+            select(OutboxMessage.message_id)
+            .where(OutboxMessage.status == OutboxStatus.PENDING, OutboxMessage.next_attempt_at <= current_time)
+            .order_by(OutboxMessage.message_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxMessage)
+            .where(OutboxMessage.message_id.in_(due_ids.scalar_subquery()))
+            .values(attempts=OutboxMessage.attempts + 1, next_attempt_at=lease_until)
+            .returning(OutboxMessage)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return sorted(result.scalars().all(), key=lambda message: message.message_id)
+
+    async def delete_messages(self, message_ids: list[int]):
+        if not message_ids:
+            return
+        await self.session.execute(delete(OutboxMessage).where(OutboxMessage.message_id.in_(message_ids)))
+
+    async def reschedule_message(self, message_id: int, next_attempt_at: datetime, error: str):
+        stmt = (
+            update(OutboxMessage)
+            .where(OutboxMessage.message_id == message_id)
+            .values(next_attempt_at=next_attempt_at, last_error=error)
+        )
+        await self.session.execute(stmt)
+
+    async def mark_dead(self, message_id: int, error: str):
+        stmt = (
+            update(OutboxMessage)
+            .where(OutboxMessage.message_id == message_id)
+            .values(status=OutboxStatus.DEAD, last_error=error)
+        )
+        await self.session.execute(stmt)
+
+    async def get_next_attempt_at(self) -> datetime | None:
+        stmt = select(func.min(OutboxMessage.next_attempt_at)).where(OutboxMessage.status == OutboxStatus.PENDING)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
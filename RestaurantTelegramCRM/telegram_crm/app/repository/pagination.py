@@ -0,0 +1,86 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass
+class Page:
+    items: list[Any] = field(default_factory=list)
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+def encode_cursor(values: tuple) -> str:
+    parts = []
+    for value in values:
+        if isinstance(value, datetime):
+            value = (value.replace(tzinfo=None) - _EPOCH) // _MICROSECOND
+        parts.append(str(value))
+    return ".".join(parts)
+
+
+def decode_cursor(raw: str | None, kinds: tuple[type, ...]) -> tuple | None:
+    if not raw:
+        return None
+    parts = raw.split(".")
+    if len(parts) != len(kinds):
+        raise ValueError(f"Некорректный курсор: {raw}")
+
+    values = []
+    for part, kind in zip(parts, kinds):
+        if kind is datetime:
+            values.append(_EPOCH + int(part) * _MICROSECOND)
+        else:
+            values.append(kind(part))
+    return tuple(values)
+
+
+def parse_cursor(raw: str | None, kinds: tuple[type, ...]) -> tuple | None:
+    try:
+        return decode_cursor(raw, kinds)
+    except ValueError:
+        return None
+
+
+async def fetch_keyset_page(session: AsyncSession, stmt: Select, keys: tuple, cursor: tuple | None,
+                            backward: bool, limit: int) -> Page:
+    keyed_stmt = stmt.add_columns(*[key.label(f"_keyset_{i}") for i, key in enumerate(keys)])
+
+    if cursor is not None:
+        if backward:
+            keyed_stmt = keyed_stmt.where(tuple_(*keys) < tuple_(*cursor))
+        else:
+            keyed_stmt = keyed_stmt.where(tuple_(*keys) > tuple_(*cursor))
+
+    ordering = [key.desc() for key in keys] if backward else [key.asc() for key in keys]
+    result = await session.execute(keyed_stmt.order_by(*ordering).limit(limit + 1))
+    rows = result.all()
+
+    if not rows and cursor is not None:
+        return await fetch_keyset_page(session, stmt, keys, None, False, limit)
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backward:
+        rows.reverse()
+
+    key_count = len(keys)
+    items = [row[0] if len(row) - key_count == 1 else tuple(row[:-key_count]) for row in rows]
+
+    if backward:
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = cursor is not None, has_more
+
+    page = Page(items=items)
+    if rows and has_next:
+        page.next_cursor = encode_cursor(tuple(rows[-1][-key_count:]))
+    if rows and has_prev:
+        page.prev_cursor = encode_cursor(tuple(rows[0][-key_count:]))
+    return page
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.task_reminder_model import TaskReminder
+
+
+class ReminderRepository:
+    def __init__(self, async_session: AsyncSession):
+        self.session = async_session
+
+    async def replace_reminders(self, task_id: int, reminders: list[tuple[int, datetime]],
+                                keep_sent: bool = True) -> list[datetime]:
+        stmt = delete(TaskReminder).where(TaskReminder.task_id == task_id)
+        sent_offsets = set()
+        if keep_sent:
+            stmt = stmt.where(TaskReminder.sent_at.is_(None))
+            result = await self.session.execute(
+                select(TaskReminder.offset_minutes).where(
+                    TaskReminder.task_id == task_id,
+                    TaskReminder.sent_at.isnot(None)
+                )
+            )
+            sent_offsets = set(result.scalars().all())
+        await self.session.execute(stmt)
+
+        self.session.add_all([
+            TaskReminder(task_id=task_id, offset_minutes=offset_minutes, fire_at=fire_at)
+            for offset_minutes, fire_at in reminders
+            if offset_minutes not in sent_offsets
+        ])
+        await self.session.flush()
+        return [fire_at for offset_minutes, fire_at in reminders if offset_minutes not in sent_offsets]
+
+    async def delete_reminders(self, task_id: int, pending_only: bool = False):
+        stmt = delete(TaskReminder).where(TaskReminder.task_id == task_id)
+        if pending_only:
+            stmt = stmt.where(TaskReminder.sent_at.is_(None))
+        await self.session.execute(stmt)
+
+    async def claim_due_reminders(self, current_time: datetime) -> list[TaskReminder]:
+        current_time = current_time.replace(tzinfo=None)
+        stmt = (
+            update(TaskReminder)
+            .where(TaskReminder.fire_at <= current_time, TaskReminder.sent_at.is_(None))
+            .values(sent_at=current_time)
+            .returning(TaskReminder)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return sorted(result.scalars().all(), key=lambda reminder: (reminder.fire_at, reminder.reminder_id))
+
+    async def get_pending_reminders(self):
+        stmt = select(TaskReminder.task_id, TaskReminder.fire_at).where(TaskReminder.sent_at.is_(None))
+        result = await self.session.execute(stmt)
+        return result.all()
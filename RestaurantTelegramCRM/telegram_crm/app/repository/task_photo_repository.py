@@ -0,0 +1,27 @@
+from sqlalchemy import insert, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.task_photo_model import TaskPhoto
+
+
+class TaskPhotoRepository:
+    def __init__(self, async_session: AsyncSession):
+        self.session = async_session
+
+    async def replace_photos(self, task_id: int, photos: list[dict]):
+        await self.delete_photos(task_id)
+        if not photos:
+            return
+        await self.session.execute(insert(TaskPhoto), [
+            {
+                "task_id": task_id,
+                "file_id": photo["file_id"],
+                "file_unique_id": photo.get("file_unique_id"),
+                "ordinal": ordinal,
+                "size": photo.get("size"),
+            }
+            for ordinal, photo in enumerate(photos)
+        ])
+
+    async def delete_photos(self, task_id: int):
+        await self.session.execute(delete(TaskPhoto).where(TaskPhoto.task_id == task_id))
@@ -1,15 +1,20 @@
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select, update, delete, or_, literal
+from sqlalchemy import select, update, delete, or_, and_, case, func, literal, DateTime
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from core.models import Task, TaskStatus, User
 from core.models.base_model import SectorStatus
+from app.repository.loading_profiles import TASK_WITH_EXECUTOR, TASK_FULL_GRAPH
+from app.repository.pagination import Page, fetch_keyset_page
 
 logger = logging.getLogger(__name__)
 
+NO_DEADLINE_SORT_KEY = literal(datetime(9999, 12, 31), DateTime)
+
 class TaskRepository:
     def __init__(self, async_session: AsyncSession):
         self.session = async_session
@@ -25,25 +30,40 @@ class TaskRepository:
             sector_task=sector_task
         )
         self.session.add(new_task)
-        await self.session.commit()
+        await self.session.flush()
 
-    async def get_all_task_for_executor(self, executor_id: int):
-        result = await self.session.execute(select(Task).where(Task.executor_id == executor_id))
+    async def get_all_task_for_executor(self, executor_id: int, profile: tuple = TASK_WITH_EXECUTOR):
+        result = await self.session.execute(
+            select(Task).where(Task.executor_id == executor_id).options(*profile)
+        )
         return result.scalars().all()
 
-    async def get_task_by_id(self, task_id: int):
-        result = await self.session.execute(select(Task).where(Task.task_id == task_id))
+    async def get_task_by_id(self, task_id: int, profile: tuple = TASK_WITH_EXECUTOR):
+        result = await self.session.execute(select(Task).where(Task.task_id == task_id).options(*profile))
         return result.scalars().first()
 
-    async def update_status_task(self, current_time):
+    async def claim_overdue_tasks(self, current_time: datetime):
+        executor_name = (
+            select(User.full_name).where(User.telegram_id == Task.executor_id).scalar_subquery().label('executor_name')
+        )
+        executor_position = (
+            select(User.position).where(User.telegram_id == Task.executor_id).scalar_subquery()
+            .label('executor_position')
+        )
         stmt = (
             update(Task)
-            .where(Task.status == TaskStatus.ACTIVE, Task.deadline < current_time)
-            .values(status=TaskStatus.OVERDUE)
+            .where(
+                or_(
+                    and_(Task.status == TaskStatus.ACTIVE, Task.deadline < current_time.replace(tzinfo=None)),
+                    and_(Task.status == TaskStatus.OVERDUE, Task.notified_overdue == False)
+                )
+            )
+            .values(status=TaskStatus.OVERDUE, notified_overdue=True)
+            .returning(Task, executor_name, executor_position)
+            .execution_options(synchronize_session=False)
         )
         result = await self.session.execute(stmt)
-        await self.session.commit()
-        return result.rowcount
+        return sorted(result.all(), key=lambda row: row.Task.task_id)
 
     async def get_all_overdue_tasks_command(self):
         stmt_with_executor = (
@@ -72,54 +92,14 @@ class TaskRepository:
 
         return all_overdue_tasks
 
-    async def get_all_overdue_tasks(self):
-        stmt_with_executor = (
-            select(Task, User)
-            .join(User, Task.executor_id == User.telegram_id)
-            .where(
-                Task.status == TaskStatus.OVERDUE,
-                Task.executor_id.isnot(None),
-                Task.notified_overdue == False
-            )
-        )
-        result_with_executor = await self.session.execute(stmt_with_executor)
-        overdue_tasks_with_users = result_with_executor.all()
-
-        stmt_for_sector = (
-            select(Task)
-            .where(
-                Task.status == TaskStatus.OVERDUE,
-                Task.executor_id.is_(None),
-                Task.sector_task.isnot(None),
-                Task.notified_overdue == False
-            )
-        )
-        result_for_sector = await self.session.execute(stmt_for_sector)
-        overdue_tasks_for_sector = result_for_sector.scalars().all()
-
-        return overdue_tasks_with_users, overdue_tasks_for_sector
-
-    async def mark_tasks_as_notified_overdue(self, task_ids: list[int]):
-        if not task_ids:
-            return
-        stmt = (
-            update(Task)
-            .where(Task.task_id.in_(task_ids))
-            .values(notified_overdue=True)
-        )
-        await self.session.execute(stmt)
-        await self.session.commit()
-        logger.info(f"Marked {len(task_ids)} tasks as notified overdue.")
-
-    async def complete_task(self, task_id: int, comment: str = None, photo_url: str = None, executor_id: int = None):
+    async def complete_task(self, task_id: int, comment: str = None, executor_id: int = None):
         kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
         completed_at = datetime.now(kemerovo_tz)
 
         update_values = {
             'status': TaskStatus.COMPLETED,
             'completed_at': completed_at,
-            'comment': comment,
-            'photo_url': photo_url
+            'comment': comment
         }
 
         if executor_id is not None:
@@ -131,84 +111,137 @@ class TaskRepository:
             .values(**update_values)
         )
         result = await self.session.execute(stmt)
-        await self.session.commit()
         return result.rowcount
 
-    async def get_completed_tasks(self):
-        result = await self.session.execute(select(Task).where(Task.status == TaskStatus.COMPLETED))
-        return result.scalars().all()
+    async def get_completed_tasks_page(self, cursor: tuple | None = None, backward: bool = False, limit: int = 10,
+                                       profile: tuple = TASK_WITH_EXECUTOR) -> Page:
+        stmt = select(Task).where(Task.status == TaskStatus.COMPLETED).options(*profile)
+        return await fetch_keyset_page(self.session, stmt, (Task.task_id,), cursor, backward, limit)
 
-    async def get_task_by_id_and_staff(self, task_id: int):
+    async def get_task_by_id_and_staff(self, task_id: int, profile: tuple = TASK_FULL_GRAPH):
         stmt = (
-            select(Task, User)
+            select(Task)
             .join(User, Task.executor_id == User.telegram_id)
-            .where(Task.task_id == task_id, Task.executor_id.isnot(None))
+            .where(Task.task_id == task_id)
+            .options(*profile)
         )
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
     async def delete_task_for_task_id(self, task_id):
         await self.session.execute(delete(Task).where(Task.task_id == task_id))
-        await self.session.commit()
 
-    async def get_activ_and_overdue_tasks(self):
-        result = await self.session.execute(select(Task).where(Task.status != TaskStatus.COMPLETED))
-        return result.scalars().all()
+    async def get_activ_and_overdue_tasks_page(self, cursor: tuple | None = None, backward: bool = False,
+                                               limit: int = 10, profile: tuple = TASK_WITH_EXECUTOR) -> Page:
+        stmt = select(Task).where(Task.status != TaskStatus.COMPLETED).options(*profile)
+        return await fetch_keyset_page(self.session, stmt, (Task.task_id,), cursor, backward, limit)
 
-    async def update_task_field(self, task_id: int, field: str, new_value):
+    async def update_task_fields(self, task_id: int, changes: dict) -> tuple[Task | None, Task | None]:
         field_mapping = {
             'title': Task.title,
             'description': Task.description,
             'executor_id': Task.executor_id,
             'deadline': Task.deadline,
-            'sector_task': Task.sector_task
+            'sector_task': Task.sector_task,
+            'status': Task.status,
+            'notified_overdue': Task.notified_overdue
         }
 
-        if field not in field_mapping:
-            raise ValueError(f"Недопустимое поле для обновления: {field}")
+        for field in changes:
+            if field not in field_mapping:
+                raise ValueError(f"Недопустимое поле для обновления: {field}")
+
+        old_task = await self.get_task_by_id(task_id)
+        if old_task is None:
+            return None, None
+        self.session.expunge(old_task)
 
         stmt = (
             update(Task)
             .where(Task.task_id == task_id)
-            .values({field_mapping[field]: new_value})
+            .values({field_mapping[field]: value for field, value in changes.items()})
+            .returning(Task)
         )
-
         result = await self.session.execute(stmt)
-        await self.session.commit()
+        updated_task = result.scalars().one()
+
+        executor = old_task.executor
+        if updated_task.executor_id != old_task.executor_id:
+            executor = await self.session.get(User, updated_task.executor_id) if updated_task.executor_id else None
+        set_committed_value(updated_task, 'executor', executor)
 
-        if result.rowcount == 0:
-            raise ValueError("Задача не найдена")
+        return old_task, updated_task
 
-    async def get_staff_tasks(self):
+    async def get_staff_tasks_page(self, cursor: tuple | None = None, backward: bool = False, limit: int = 10,
+                                   profile: tuple = TASK_WITH_EXECUTOR) -> Page:
         stmt = select(Task).where(
             or_(
                 Task.executor_id.isnot(None),
                 Task.sector_task.isnot(None)
             )
-        )
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        ).options(*profile)
+        return await fetch_keyset_page(self.session, stmt, (Task.task_id,), cursor, backward, limit)
 
-    async def get_sector_tasks(self, sector: SectorStatus):
+    async def get_sector_tasks(self, sector: SectorStatus, profile: tuple = TASK_WITH_EXECUTOR):
         result = await self.session.execute(
             select(Task).where(
                 Task.sector_task == sector,
-                Task.status != TaskStatus.COMPLETED
-            )
+                Task.status.in_([TaskStatus.ACTIVE, TaskStatus.OVERDUE])
+            ).options(*profile)
         )
         return result.scalars().all()
 
-    async def get_active_tasks_for_notification(self) -> list[Task]:
-        kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
-        current_time = datetime.now(kemerovo_tz)
-        future_time = current_time + timedelta(hours=48)
+    async def get_user_board_page(self, executor_id: int, sector: SectorStatus | None, current_time: datetime,
+                                  cursor: tuple | None = None, backward: bool = False, limit: int = 10,
+                                  profile: tuple = TASK_WITH_EXECUTOR) -> Page:
+        current_time = current_time.replace(tzinfo=None)
+        assignment = Task.executor_id == executor_id
+        if sector is not None:
+            assignment = or_(assignment, Task.sector_task == sector)
+
+        is_overdue = case(
+            (and_(Task.deadline.isnot(None), Task.deadline <= current_time), True),
+            else_=False
+        ).label("is_overdue")
+
+        stmt = (
+            select(Task, is_overdue)
+            .where(
+                assignment,
+                Task.status.in_([TaskStatus.ACTIVE, TaskStatus.OVERDUE])
+            )
+            .options(*profile)
+        )
+        keys = (func.coalesce(Task.deadline, NO_DEADLINE_SORT_KEY), Task.task_id)
+        page = await fetch_keyset_page(self.session, stmt, keys, cursor, backward, limit)
+        page.items = [(task, bool(overdue)) for task, overdue in page.items]
+        return page
+
+    async def get_active_tasks_by_ids(self, task_ids: list[int], profile: tuple = TASK_WITH_EXECUTOR) -> list[Task]:
+        if not task_ids:
+            return []
         stmt = (
             select(Task)
+            .where(Task.task_id.in_(task_ids), Task.status == TaskStatus.ACTIVE)
+            .options(*profile)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def get_schedulable_tasks(self):
+        stmt = (
+            select(
+                Task.task_id,
+                Task.deadline,
+                Task.notified_overdue
+            )
             .where(
-                Task.status == TaskStatus.ACTIVE,
-                Task.deadline >= current_time.replace(tzinfo=None),
-                Task.deadline <= future_time.replace(tzinfo=None)
+                Task.deadline.isnot(None),
+                or_(
+                    Task.status == TaskStatus.ACTIVE,
+                    and_(Task.status == TaskStatus.OVERDUE, Task.notified_overdue == False)
+                )
             )
         )
         result = await self.session.execute(stmt)
-        return result.scalars().all()
\ No newline at end of file
+        return result.all()
\ No newline at end of file
@@ -3,6 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.models.user_model import User
 from core.models.base_model import UserRole, SectorStatus
+from app.repository.loading_profiles import LEAN_USER
+from app.repository.pagination import Page, fetch_keyset_page
 
 class UserRepository:
     def __init__(self, async_session: AsyncSession):
@@ -17,21 +19,25 @@ class UserRepository:
             sector=sector
         )
         self.session.add(new_user)
-        await self.session.commit()
+        await self.session.flush()
 
-    async def get_user(self, telegram_id: int):
-        result = await self.session.execute(select(User).where(User.telegram_id == telegram_id))
+    async def get_user(self, telegram_id: int, profile: tuple = LEAN_USER):
+        result = await self.session.execute(select(User).where(User.telegram_id == telegram_id).options(*profile))
         return result.scalars().first()
 
-    async def get_all_users(self):
-        result = await self.session.execute(select(User))
+    async def get_all_users(self, profile: tuple = LEAN_USER, limit: int | None = None):
+        result = await self.session.execute(select(User).options(*profile).limit(limit))
         return result.scalars().all()
 
+    async def get_users_page(self, cursor: tuple | None = None, backward: bool = False, limit: int = 10,
+                             profile: tuple = LEAN_USER) -> Page:
+        stmt = select(User).options(*profile)
+        return await fetch_keyset_page(self.session, stmt, (User.telegram_id,), cursor, backward, limit)
+
     async def delete_user(self, telegram_id: int):
         result = await self.session.execute(delete(User).where(User.telegram_id == telegram_id))
-        await self.session.commit()
         return result.rowcount
 
-    async def get_users_by_sector(self, sector: SectorStatus):
-        result = await self.session.execute(select(User).where(User.sector == sector))
-        return result.scalars().all()
\ No newline at end of file
+    async def get_sector_members(self) -> list[tuple[int, SectorStatus]]:
+        result = await self.session.execute(select(User.telegram_id, User.sector).where(User.sector.isnot(None)))
+        return [tuple(row) for row in result.all()]
\ No newline at end of file
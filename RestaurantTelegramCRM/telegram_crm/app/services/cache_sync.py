@@ -0,0 +1,42 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db_helper import db_helper
+from app.repository.cache_version_repository import CacheVersionRepository
+from app.services.sector_roster import sector_roster
+from app.services.user_cache import user_cache
+
+logger = logging.getLogger(__name__)
+
+USERS_CACHE = "users"
+
+
+class UserCacheSync:
+    def __init__(self, name: str = USERS_CACHE):
+        self.name = name
+        self.version: int | None = None
+
+    async def check(self):
+        async with db_helper.session_scope() as session:
+            cache_version_repository = CacheVersionRepository(session)
+            version = await cache_version_repository.get_version(self.name)
+
+        if self.version is not None and version != self.version:
+            user_cache.clear()
+            await sector_roster.reconcile(force=True)
+            logger.info(f"Кеш пользователей сброшен: версия {self.version} -> {version}")
+        self.version = version
+
+    async def run(self, interval: float):
+        while True:
+            await self.check()
+            await asyncio.sleep(interval)
+
+    async def bump(self, session: AsyncSession):
+        cache_version_repository = CacheVersionRepository(session)
+        await cache_version_repository.bump_version(self.name)
+
+
+user_cache_sync = UserCacheSync()
@@ -1,23 +1,22 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from typing import TYPE_CHECKING
 
 from core.db_helper import db_helper
 from core.models import Task
-from core.models.base_model import SectorStatus, TaskStatus
+from core.models.base_model import SectorStatus
 from app.repository.task_repository import TaskRepository
+from app.repository.reminder_repository import ReminderRepository
+from app.repository.loading_profiles import LEAN_TASK
 from app.services.user_service import UserService
-
-if TYPE_CHECKING:
-    from aiogram import Bot
+from app.services.notification_outbox import notification_outbox, NotificationBatch
+from app.services.reminder_policy import reminder_policy, format_offset
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 class DeadlineNotificationService:
-    def __init__(self, bot: "Bot"):
-        self.bot = bot
+    def __init__(self):
         self.kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
 
     async def check_and_notify(self):
@@ -25,74 +24,41 @@ class DeadlineNotificationService:
             current_time = datetime.now(self.kemerovo_tz)
             logger.info(f"Проверка уведомлений о дедлайне: {current_time}")
 
-            async with db_helper.session_factory() as session:
-                task_repository = TaskRepository(session)
-                tasks = await task_repository.get_active_tasks_for_notification()
-
-                tasks_to_update = []
+            batch = notification_outbox.batch()
+            async with db_helper.session_scope() as session:
+                reminder_repository = ReminderRepository(session)
+                reminders = await reminder_repository.claim_due_reminders(current_time)
+                if not reminders:
+                    return
 
-                for task in tasks:
-                    try:
-                        notification_sent = await self._process_task_notification(task, current_time)
-                        if notification_sent:
-                            tasks_to_update.append(task)
-                    except Exception as e:
-                        logger.error(f"Ошибка обработки задачи {task.task_id} для уведомления: {e}")
-
-                if tasks_to_update:
-                    for task in tasks_to_update:
-                        session.add(task)
-                    await session.commit()
-                    logger.info(f"Обновлены флаги уведомлений для {len(tasks_to_update)} задач(и).")
+                task_repository = TaskRepository(session)
+                tasks = await task_repository.get_active_tasks_by_ids(
+                    sorted({reminder.task_id for reminder in reminders}), profile=LEAN_TASK
+                )
+                tasks_by_id = {task.task_id: task for task in tasks}
+
+                notified_count = 0
+                for reminder in reminders:
+                    task = tasks_by_id.get(reminder.task_id)
+                    if task is None or reminder_policy.is_stale(reminder.fire_at, current_time):
+                        continue
+                    await self._notify_claimed(batch, task, format_offset(reminder.offset_minutes))
+                    notified_count += 1
+                batch.flush(session)
+
+            logger.info(f"Отмечено {len(reminders)} напоминаний, из них отправляется {notified_count}.")
 
         except Exception as e:
             logger.error(f"Критическая ошибка в check_and_notify: {e}")
 
-    async def _process_task_notification(self, task: Task, current_time: datetime) -> bool:
-        if task.status != TaskStatus.ACTIVE:
-            logger.debug(f"Пропущена задача {task.task_id} со статусом {task.status} для уведомления о дедлайне.")
-            return False
-
-        if task.deadline is None:
-            logger.debug(f"Пропущена задача {task.task_id} без дедлайна.")
-            return False
-
-        if task.deadline.tzinfo is None:
-            deadline_aware = task.deadline.replace(tzinfo=self.kemerovo_tz)
-        else:
-            deadline_aware = task.deadline.astimezone(self.kemerovo_tz)
-
-        time_left = deadline_aware - current_time
-        hours_left = time_left.total_seconds() / 3600
-
-        logger.debug(f"Задача {task.task_id}: hours_left = {hours_left:.2f}, "
-                    f"24h notified: {task.notified_24_hours}, "
-                    f"10h notified: {task.notified_10_hours}, "
-                    f"2h notified: {task.notified_2_hours}")
-
-        notification_sent = False
-
-        if 23.0 <= hours_left <= 25.0 and not task.notified_24_hours:
-            await self._send_notification(task, "за 24 часа")
-            task.notified_24_hours = True
-            notification_sent = True
-            logger.info(f"Отправлено уведомление 'за 24 часа' по задаче {task.task_id}")
-
-        elif 9.0 <= hours_left <= 11.0 and not task.notified_10_hours:
-            await self._send_notification(task, "за 10 часов")
-            task.notified_10_hours = True
-            notification_sent = True
-            logger.info(f"Отправлено уведомление 'за 10 часов' по задаче {task.task_id}")
-
-        elif 1.0 <= hours_left <= 3.0 and not task.notified_2_hours:
-            await self._send_notification(task, "за 2 часа")
-            task.notified_2_hours = True
-            notification_sent = True
-            logger.info(f"Отправлено уведомление 'за 2 часа' по задаче {task.task_id}")
-
-        return notification_sent
+    async def _notify_claimed(self, batch: NotificationBatch, task: Task, timeframe: str):
+        try:
+            await self._send_notification(batch, task, timeframe)
+            logger.info(f"Поставлено в очередь уведомление '{timeframe}' по задаче {task.task_id}")
+        except Exception as e:
+            logger.error(f"Ошибка обработки задачи {task.task_id} для уведомления: {e}")
 
-    async def _send_notification(self, task: Task, timeframe: str):
+    async def _send_notification(self, batch: NotificationBatch, task: Task, timeframe: str):
         if task.deadline.tzinfo is None:
             deadline_str = task.deadline.replace(tzinfo=self.kemerovo_tz).strftime('%d.%m.%Y %H:%M')
         else:
@@ -106,20 +72,17 @@ class DeadlineNotificationService:
         )
 
         if task.executor_id:
-            await self._send_to_user(task.executor_id, message)
+            self._send_to_user(batch, task.executor_id, message)
         elif task.sector_task:
-            await self._send_to_sector(task.sector_task, message)
+            await self._send_to_sector(batch, task.sector_task, message)
 
-    async def _send_to_user(self, user_id: int, message: str):
-        try:
-            await self.bot.send_message(user_id, message)
-            logger.info(f"Уведомление отправлено пользователю {user_id}")
-        except Exception as e:
-            logger.error(f"Ошибка отправки пользователю {user_id}: {e}")
+    def _send_to_user(self, batch: NotificationBatch, user_id: int, message: str):
+        batch.add([user_id], message)
+        logger.info(f"Уведомление поставлено в очередь для пользователя {user_id}")
 
-    async def _send_to_sector(self, sector: SectorStatus, message: str):
+    async def _send_to_sector(self, batch: NotificationBatch, sector: SectorStatus, message: str):
         try:
-            users = await UserService.get_users_by_sector(sector)
+            chat_ids = await UserService.get_sector_chat_ids(sector)
             sector_names = {
                 SectorStatus.BAR: "бару",
                 SectorStatus.HALL: "залу",
@@ -127,11 +90,7 @@ class DeadlineNotificationService:
             }
             sector_name = sector_names.get(sector, "сектору")
 
-            for user in users:
-                try:
-                    await self.bot.send_message(user.telegram_id, message)
-                    logger.info(f"Уведомление отправлено пользователю сектора {sector_name} ({user.telegram_id})")
-                except Exception as e:
-                    logger.error(f"Ошибка отправки пользователю сектора {sector_name} ({user.telegram_id}): {e}")
+            batch.add(chat_ids, message)
+            logger.info(f"Уведомление поставлено в очередь для {len(chat_ids)} пользователей сектора {sector_name}")
         except Exception as e:
-            logger.error(f"Ошибка получения пользователей сектора {sector} или отправки уведомлений: {e}")
\ No newline at end of file
+            logger.error(f"Ошибка получения пользователей сектора {sector} или постановки уведомлений в очередь: {e}")
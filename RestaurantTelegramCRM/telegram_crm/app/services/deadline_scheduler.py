@@ -0,0 +1,194 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable
+from zoneinfo import ZoneInfo
+
+from core.config import settings
+from core.db_helper import db_helper
+from app.repository.task_repository import TaskRepository
+from app.repository.reminder_repository import ReminderRepository
+from app.services.deadline_notification_service import DeadlineNotificationService
+from app.services.overdue_notification_service import OverdueNotificationService
+
+logger = logging.getLogger(__name__)
+
+REMINDER = "reminder"
+OVERDUE = "overdue"
+
+ERROR_RETRY_DELAY = 5
+
+
+class DeadlineScheduler:
+    def __init__(self, resync_interval: float):
+        self.resync_interval = resync_interval
+        self.kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
+        self._heap: list[tuple[float, int, int, str]] = []
+        self._generations: dict[int, int] = {}
+        self._generation_counter = itertools.count(1)
+        self._touched: set[int] | None = None
+        self._next_resync_at = 0.0
+        self._resync_requested = False
+        self._wakeup = asyncio.Event()
+        self._running = False
+
+    def schedule_task(self, task_id: int, deadline: datetime | None, reminder_times: Iterable[datetime] = (),
+                      overdue_notified: bool = False):
+        if not self._running:
+            return
+        if self._touched is not None:
+            self._touched.add(task_id)
+        self._push_events(task_id, deadline, reminder_times, overdue_notified)
+        self._wakeup.set()
+
+    def unschedule_task(self, task_id: int):
+        if not self._running:
+            return
+        if self._touched is not None:
+            self._touched.add(task_id)
+        self._generations.pop(task_id, None)
+
+    def request_resync(self):
+        self._resync_requested = True
+        self._wakeup.set()
+
+    def pending_events(self) -> int:
+        return sum(1 for entry in self._heap if self._is_current(entry))
+
+    async def run(self):
+        deadline_notification_service = DeadlineNotificationService()
+        overdue_notification_service = OverdueNotificationService()
+        logger.info("Планировщик дедлайнов запущен")
+        self._running = True
+        self._next_resync_at = 0.0
+
+        try:
+            while True:
+                try:
+                    if self._resync_requested or time.time() >= self._next_resync_at:
+                        await self.resync()
+
+                    due_events = self._pop_due(time.time())
+                    if due_events:
+                        await self._fire(due_events, deadline_notification_service, overdue_notification_service)
+                        continue
+
+                    await self._sleep_until_next_event()
+                except asyncio.CancelledError:
+                    logger.info("Планировщик дедлайнов остановлен")
+                    raise
+                except Exception as e:
+                    logger.error(f"Ошибка в планировщике дедлайнов: {e}")
+                    await asyncio.sleep(ERROR_RETRY_DELAY)
+        finally:
+            self._running = False
+
+    async def resync(self):
+        self._resync_requested = False
+        self._touched = set()
+        try:
+            async with db_helper.session_scope() as session:
+                task_repository = TaskRepository(session)
+                rows = await task_repository.get_schedulable_tasks()
+                reminder_repository = ReminderRepository(session)
+                reminder_rows = await reminder_repository.get_pending_reminders()
+        except Exception:
+            self._touched = None
+            self._resync_requested = True
+            raise
+
+        touched, self._touched = self._touched, None
+        self._generations = {task_id: generation for task_id, generation in self._generations.items()
+                             if task_id in touched}
+        self._heap = [entry for entry in self._heap if self._is_current(entry)]
+
+        reminder_times = defaultdict(list)
+        for reminder_row in reminder_rows:
+            reminder_times[reminder_row.task_id].append(reminder_row.fire_at)
+
+        for row in rows:
+            if row.task_id in touched:
+                continue
+            self._push_events(row.task_id, row.deadline, reminder_times.pop(row.task_id, ()), row.notified_overdue)
+
+        for task_id, fire_times in reminder_times.items():
+            if task_id not in touched:
+                self._push_events(task_id, None, fire_times, True)
+
+        heapq.heapify(self._heap)
+        self._next_resync_at = time.time() + self.resync_interval
+        logger.info(f"Планировщик дедлайнов синхронизирован: {len(rows)} задач(и), "
+                    f"{self.pending_events()} событий в очереди")
+
+    def _push_events(self, task_id: int, deadline: datetime | None, reminder_times: Iterable[datetime],
+                     overdue_notified: bool):
+        generation = next(self._generation_counter)
+        self._generations[task_id] = generation
+
+        for fire_at in reminder_times:
+            heapq.heappush(self._heap, (self._timestamp(fire_at), task_id, generation, REMINDER))
+
+        if deadline is not None and not overdue_notified:
+            heapq.heappush(self._heap, (self._timestamp(deadline), task_id, generation, OVERDUE))
+
+    def _timestamp(self, value: datetime) -> float:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=self.kemerovo_tz)
+        return value.timestamp()
+
+    def _is_current(self, entry: tuple[float, int, int, str]) -> bool:
+        _, task_id, generation, _ = entry
+        return self._generations.get(task_id) == generation
+
+    def _drop_stale_head(self):
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _pop_due(self, now: float) -> list[tuple[float, int, int, str]]:
+        due_events = []
+        self._drop_stale_head()
+        while self._heap and self._heap[0][0] <= now:
+            due_events.append(heapq.heappop(self._heap))
+            self._drop_stale_head()
+        return due_events
+
+    async def _sleep_until_next_event(self):
+        self._wakeup.clear()
+        if self._resync_requested:
+            return
+        self._drop_stale_head()
+
+        now = time.time()
+        timeout = self._next_resync_at - now
+        if self._heap:
+            timeout = min(timeout, self._heap[0][0] - now)
+
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=max(timeout, 0))
+        except asyncio.TimeoutError:
+            pass
+
+    async def _fire(self, due_events: list[tuple[float, int, int, str]],
+                    deadline_notification_service: DeadlineNotificationService,
+                    overdue_notification_service: OverdueNotificationService):
+        reminder_task_ids = sorted({task_id for _, task_id, _, kind in due_events if kind != OVERDUE})
+        has_overdue = any(kind == OVERDUE for _, _, _, kind in due_events)
+
+        for _, task_id, _, kind in due_events:
+            if kind == OVERDUE:
+                self._generations.pop(task_id, None)
+
+        if reminder_task_ids:
+            logger.info(f"Срабатывание напоминаний о дедлайне для задач {reminder_task_ids}")
+            await deadline_notification_service.check_and_notify()
+
+        if has_overdue:
+            logger.info("Срабатывание проверки просроченных задач")
+            await overdue_notification_service.check_and_notify()
+
+
+deadline_scheduler = DeadlineScheduler(settings.scheduler.resync_interval)
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Iterable
+
+from aiogram.exceptions import TelegramAPIError, TelegramNetworkError, TelegramRetryAfter, TelegramServerError
+
+from core.config import settings
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+logger = logging.getLogger(__name__)
+
+NETWORK_RETRY_DELAY = 1.0
+
+
+class DeliveryError(Exception):
+    def __init__(self, message: str, permanent: bool = False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def is_idle(self) -> bool:
+        return self.tokens + (time.monotonic() - self.updated_at) * self.rate >= self.capacity
+
+
+class MessageSender:
+    def __init__(
+            self,
+            max_concurrency: int,
+            global_rate: float,
+            global_burst: int,
+            per_chat_rate: float,
+            per_chat_burst: int,
+            max_retries: int,
+    ):
+        self.per_chat_rate = per_chat_rate
+        self.per_chat_burst = per_chat_burst
+        self.max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._global_bucket = TokenBucket(global_rate, global_burst)
+        self._chat_buckets: dict[int, TokenBucket] = {}
+        self._paused_until = 0.0
+        self._started_at = time.monotonic()
+        self.in_flight = 0
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+
+    async def send_message(self, bot: "Bot", chat_id: int, text: str, **kwargs) -> bool:
+        try:
+            await self.deliver(bot, chat_id, text, **kwargs)
+            return True
+        except DeliveryError:
+            return False
+
+    async def deliver(self, bot: "Bot", chat_id: int, text: str, **kwargs):
+        await self._send_with_retries(bot, chat_id, text, **kwargs)
+
+    async def send_many(self, bot: "Bot", chat_ids: Iterable[int], text: str, **kwargs) -> int:
+        results = await asyncio.gather(*(self.send_message(bot, chat_id, text, **kwargs) for chat_id in chat_ids))
+        return sum(results)
+
+    def metrics(self) -> dict:
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        return {
+            "sent": self.sent,
+            "failed": self.failed,
+            "retries": self.retries,
+            "in_flight": self.in_flight,
+            "throughput": self.sent / elapsed,
+        }
+
+    async def report_metrics(self, interval: float):
+        last_sent = self.sent
+        last_reported_at = time.monotonic()
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            sent = self.sent - last_sent
+            if sent:
+                metrics = self.metrics()
+                logger.info(
+                    f"Отправлено сообщений: {sent} за {now - last_reported_at:.0f} с "
+                    f"({sent / (now - last_reported_at):.2f}/с), всего {metrics['sent']}, "
+                    f"ошибок {metrics['failed']}, повторов {metrics['retries']}"
+                )
+            last_sent = self.sent
+            last_reported_at = now
+
+    async def _send_with_retries(self, bot: "Bot", chat_id: int, text: str, **kwargs):
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(chat_id)
+            try:
+                await self._send(bot, chat_id, text, **kwargs)
+                self.sent += 1
+                return
+            except TelegramRetryAfter as e:
+                last_error = e
+                self.retries += 1
+                self._paused_until = max(self._paused_until, time.monotonic() + e.retry_after)
+                logger.warning(f"Telegram просит подождать {e.retry_after} с перед отправкой в чат {chat_id}")
+            except (TelegramNetworkError, TelegramServerError) as e:
+                last_error = e
+                self.retries += 1
+                logger.warning(f"Сетевая ошибка при отправке в чат {chat_id} (попытка {attempt + 1}): {e}")
+                await asyncio.sleep(NETWORK_RETRY_DELAY * 2 ** attempt)
+            except TelegramAPIError as e:
+                self.failed += 1
+                logger.error(f"Не удалось отправить сообщение в чат {chat_id}: {e}")
+                raise DeliveryError(str(e), permanent=True) from e
+
+        self.failed += 1
+        logger.error(f"Сообщение в чат {chat_id} не отправлено после {self.max_retries + 1} попыток")
+        raise DeliveryError(str(last_error)) from last_error
+
+    async def _send(self, bot: "Bot", chat_id: int, text: str, **kwargs):
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+            finally:
+                self.in_flight -= 1
+
+    async def _acquire(self, chat_id: int):
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+        chat_bucket = self._chat_buckets.get(chat_id)
+        if chat_bucket is None:
+            if len(self._chat_buckets) >= 1024:
+                self._prune_idle_buckets()
+            chat_bucket = self._chat_buckets[chat_id] = TokenBucket(self.per_chat_rate, self.per_chat_burst)
+
+        delay = chat_bucket.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+        delay = self._global_bucket.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _prune_idle_buckets(self):
+        self._chat_buckets = {chat_id: bucket for chat_id, bucket in self._chat_buckets.items()
+                              if not bucket.is_idle()}
+
+
+message_sender = MessageSender(
+    max_concurrency=settings.sender.max_concurrency,
+    global_rate=settings.sender.global_rate,
+    global_burst=settings.sender.global_burst,
+    per_chat_rate=settings.sender.per_chat_rate,
+    per_chat_burst=settings.sender.per_chat_burst,
+    max_retries=settings.sender.max_retries,
+)
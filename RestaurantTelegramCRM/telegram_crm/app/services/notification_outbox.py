@@ -0,0 +1,215 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from typing import TYPE_CHECKING, Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.db_helper import db_helper
+from core.models import OutboxMessage
+from app.repository.outbox_repository import OutboxRepository
+from app.services.message_sender import message_sender, DeliveryError
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+logger = logging.getLogger(__name__)
+
+ERROR_RETRY_DELAY = 5
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+COALESCE_SEPARATOR = "\n\n"
+
+
+def split_message(text: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> list[str]:
+    chunks = []
+    while len(text) > limit:
+        cut = text.rfind("\n", 0, limit)
+        if cut <= 0:
+            cut = limit
+        chunks.append(text[:cut])
+        text = text[cut:].lstrip("\n")
+    if text:
+        chunks.append(text)
+    return chunks
+
+
+def coalesce_texts(texts: list[str], limit: int = TELEGRAM_MESSAGE_LIMIT) -> list[str]:
+    messages = []
+    current = ""
+    for text in texts:
+        for part in split_message(text, limit):
+            if current and len(current) + len(COALESCE_SEPARATOR) + len(part) <= limit:
+                current += COALESCE_SEPARATOR + part
+            else:
+                if current:
+                    messages.append(current)
+                current = part
+    if current:
+        messages.append(current)
+    return messages
+
+
+class NotificationBatch:
+    def __init__(self, outbox: "NotificationOutbox"):
+        self.outbox = outbox
+        self._texts: dict[tuple[int, str | None], list[str]] = defaultdict(list)
+
+    def add(self, chat_ids: Iterable[int], text: str, parse_mode: str | None = None):
+        for chat_id in chat_ids:
+            self._texts[(chat_id, parse_mode)].append(text)
+
+    def flush(self, session: AsyncSession) -> int:
+        queued = 0
+        for (chat_id, parse_mode), texts in self._texts.items():
+            for message in coalesce_texts(texts):
+                self.outbox.enqueue(session, [chat_id], message, parse_mode)
+                queued += 1
+        if queued:
+            logger.info(f"Объединено {sum(len(texts) for texts in self._texts.values())} уведомлений "
+                        f"в {queued} сообщений для {len(self._texts)} получателей")
+        self._texts.clear()
+        return queued
+
+
+class NotificationOutbox:
+    def __init__(
+            self,
+            batch_size: int,
+            poll_interval: float,
+            lease_timeout: float,
+            max_attempts: int,
+            retry_base_delay: float,
+            retry_max_delay: float,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
+        self._wakeup = asyncio.Event()
+
+    def enqueue(self, session: AsyncSession, chat_ids: Iterable[int], text: str, parse_mode: str | None = None):
+        chat_ids = list(chat_ids)
+        if not chat_ids:
+            return
+        outbox_repository = OutboxRepository(session)
+        outbox_repository.add_messages(chat_ids, text, parse_mode, self._now())
+        db_helper.after_commit(session, self.wake)
+
+    def batch(self) -> NotificationBatch:
+        return NotificationBatch(self)
+
+    def wake(self):
+        self._wakeup.set()
+
+    def wake_if_due(self, next_attempt_at: datetime | None):
+        if next_attempt_at is not None and next_attempt_at <= self._now():
+            self.wake()
+
+    async def run(self, bot: "Bot"):
+        logger.info("Обработчик очереди уведомлений запущен")
+
+        while True:
+            try:
+                self._wakeup.clear()
+                processed = await self.drain_batch(bot)
+                if processed >= self.batch_size:
+                    continue
+
+                await self._sleep_until_next_attempt()
+            except asyncio.CancelledError:
+                logger.info("Обработчик очереди уведомлений остановлен")
+                raise
+            except Exception as e:
+                logger.error(f"Ошибка в обработчике очереди уведомлений: {e}")
+                await asyncio.sleep(ERROR_RETRY_DELAY)
+
+    async def drain_batch(self, bot: "Bot") -> int:
+        current_time = self._now()
+        async with db_helper.session_scope() as session:
+            outbox_repository = OutboxRepository(session)
+            messages = await outbox_repository.claim_batch(
+                current_time, current_time + timedelta(seconds=self.lease_timeout), self.batch_size
+            )
+
+        if not messages:
+            return 0
+
+        by_chat: dict[int, list[OutboxMessage]] = defaultdict(list)
+        for message in messages:
+            by_chat[message.chat_id].append(message)
+
+        results = await asyncio.gather(*(self._deliver_chat(bot, chat_messages) for chat_messages in by_chat.values()))
+
+        sent_ids = []
+        failures = []
+        for chat_results in results:
+            for message, error in chat_results:
+                if error is None:
+                    sent_ids.append(message.message_id)
+                else:
+                    failures.append((message, error))
+
+        current_time = self._now()
+        async with db_helper.session_scope() as session:
+            outbox_repository = OutboxRepository(session)
+            await outbox_repository.delete_messages(sent_ids)
+            for message, error in failures:
+                if error.permanent or message.attempts >= self.max_attempts:
+                    await outbox_repository.mark_dead(message.message_id, str(error))
+                    logger.error(f"Уведомление {message.message_id} для чата {message.chat_id} "
+                                 f"перемещено в недоставленные после {message.attempts} попыток: {error}")
+                else:
+                    await outbox_repository.reschedule_message(
+                        message.message_id, current_time + self._retry_delay(message.attempts), str(error)
+                    )
+
+        logger.info(f"Очередь уведомлений: отправлено {len(sent_ids)} из {len(messages)}")
+        return len(messages)
+
+    async def _deliver_chat(self, bot: "Bot", messages: list[OutboxMessage]) -> list[tuple[OutboxMessage, DeliveryError | None]]:
+        results = []
+        for message in messages:
+            kwargs = {"parse_mode": message.parse_mode} if message.parse_mode else {}
+            try:
+                await message_sender.deliver(bot, message.chat_id, message.text, **kwargs)
+                results.append((message, None))
+            except DeliveryError as e:
+                results.append((message, e))
+        return results
+
+    def _retry_delay(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(self.retry_base_delay * 2 ** (attempts - 1), self.retry_max_delay))
+
+    async def _sleep_until_next_attempt(self):
+        async with db_helper.session_scope() as session:
+            outbox_repository = OutboxRepository(session)
+            next_attempt_at = await outbox_repository.get_next_attempt_at()
+
+        timeout = self.poll_interval
+        if next_attempt_at is not None:
+            timeout = min(timeout, (next_attempt_at - self._now()).total_seconds())
+
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=max(timeout, 0))
+        except asyncio.TimeoutError:
+            pass
+
+    def _now(self) -> datetime:
+        return datetime.now(self.kemerovo_tz).replace(tzinfo=None)
+
+
+notification_outbox = NotificationOutbox(
+    batch_size=settings.outbox.batch_size,
+    poll_interval=settings.outbox.poll_interval,
+    lease_timeout=settings.outbox.lease_timeout,
+    max_attempts=settings.outbox.max_attempts,
+    retry_base_delay=settings.outbox.retry_base_delay,
+    retry_max_delay=settings.outbox.retry_max_delay,
+)
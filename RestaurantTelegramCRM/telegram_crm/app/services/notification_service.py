@@ -1,37 +1,22 @@
 import logging
-from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.models import Task, SectorStatus
 from app.services.user_service import UserService
-
-if TYPE_CHECKING:
-    from aiogram import Bot
+from app.services.notification_outbox import notification_outbox
 
 logger = logging.getLogger(__name__)
 
-_bot_instance: 'Bot | None' = None
-
-def init_notifier(bot: 'Bot'):
-    global _bot_instance
-    _bot_instance = bot
-    logger.info("Notifier service initialized with bot instance.")
-
-async def _send_message(chat_id: int, text: str):
-    if not _bot_instance:
-        logger.error("Bot instance is not initialized. Cannot send message.")
-        return
-
-    try:
-        await _bot_instance.send_message(chat_id=chat_id, text=text, parse_mode="HTML")
-        logger.info(f"Notification sent successfully to user {chat_id}.")
-    except Exception as e:
-        logger.error(f"Failed to send notification to user {chat_id}: {e}")
+def _enqueue_message(session: AsyncSession, chat_id: int, text: str):
+    notification_outbox.enqueue(session, [chat_id], text, parse_mode="HTML")
+    logger.info(f"Notification queued for user {chat_id}.")
 
-async def notify_new_task(task: Task):
-    if not _bot_instance:
-        logger.warning("Bot instance not initialized, skipping new task notification.")
-        return
+def _enqueue_for_chats(session: AsyncSession, chat_ids: list[int], text: str):
+    notification_outbox.enqueue(session, chat_ids, text, parse_mode="HTML")
+    logger.info(f"Notification queued for {len(chat_ids)} users.")
 
+async def notify_new_task(task: Task, session: AsyncSession):
     try:
         if task.deadline is not None:
             deadline_str = task.deadline.strftime('%d.%m.%Y - %H:%M')
@@ -46,12 +31,12 @@ async def notify_new_task(task: Task):
                 f"<b>Описание:</b> {task.description}\n"
                 f"<b>Дедлайн:</b> {deadline_str}"
             )
-            await _send_message(task.executor_id, message_text)
+            _enqueue_message(session, task.executor_id, message_text)
 
         elif task.sector_task:
             logger.info(f"Sending new task notification to sector {task.sector_task}.")
 
-            users_in_sector = await UserService.get_users_by_sector(task.sector_task)
+            chat_ids = await UserService.get_sector_chat_ids(task.sector_task)
 
             sector_display_names = {
                 SectorStatus.BAR: "Бар",
@@ -67,8 +52,7 @@ async def notify_new_task(task: Task):
                 f"<b>Дедлайн:</b> {deadline_str}"
             )
 
-            for user in users_in_sector:
-                await _send_message(user.telegram_id, message_text)
+            _enqueue_for_chats(session, chat_ids, message_text)
 
         else:
             logger.info("New task created without executor or sector. No notification sent.")
@@ -76,11 +60,7 @@ async def notify_new_task(task: Task):
     except Exception as e:
         logger.error(f"Error in notify_new_task for task {task.task_id}: {e}")
 
-async def notify_updated_task(old_task: Task, new_task: Task):
-    if not _bot_instance:
-        logger.warning("Bot instance not initialized, skipping updated task notification.")
-        return
-
+async def notify_updated_task(old_task: Task, new_task: Task, session: AsyncSession):
     try:
         if (old_task.executor_id and old_task.executor_id != new_task.executor_id) or \
                 (old_task.sector_task and old_task.sector_task != new_task.sector_task):
@@ -88,11 +68,11 @@ async def notify_updated_task(old_task: Task, new_task: Task):
             if old_task.executor_id:
                 logger.info(f"Sending reassignment notification to old executor {old_task.executor_id}.")
                 message_text = f"ℹ️ Задача <b>\"{old_task.title}\"</b> была переназначена с вас."
-                await _send_message(old_task.executor_id, message_text)
+                _enqueue_message(session, old_task.executor_id, message_text)
 
             elif old_task.sector_task:
                 logger.info(f"Sending reassignment notification to old sector {old_task.sector_task}.")
-                users_in_old_sector = await UserService.get_users_by_sector(old_task.sector_task)
+                chat_ids = await UserService.get_sector_chat_ids(old_task.sector_task)
                 sector_display_names = {
                     SectorStatus.BAR: "Бар",
                     SectorStatus.HALL: "Зал",
@@ -101,8 +81,7 @@ async def notify_updated_task(old_task: Task, new_task: Task):
                 old_sector_name = sector_display_names.get(old_task.sector_task, str(old_task.sector_task))
                 message_text = f"ℹ️ Задача <b>\"{old_task.title}\"</b> была переназначена с вашего сектора ({old_sector_name})."
 
-                for user in users_in_old_sector:
-                    await _send_message(user.telegram_id, message_text)
+                _enqueue_for_chats(session, chat_ids, message_text)
 
         if new_task.executor_id:
             logger.info(f"Sending updated task notification to new executor {new_task.executor_id}.")
@@ -116,11 +95,11 @@ async def notify_updated_task(old_task: Task, new_task: Task):
                 f"<b>Новое описание:</b> {new_task.description}\n"
                 f"<b>Новый дедлайн:</b> {deadline_str}"
             )
-            await _send_message(new_task.executor_id, message_text)
+            _enqueue_message(session, new_task.executor_id, message_text)
 
         elif new_task.sector_task:
             logger.info(f"Sending updated task notification to new sector {new_task.sector_task}.")
-            users_in_new_sector = await UserService.get_users_by_sector(new_task.sector_task)
+            chat_ids = await UserService.get_sector_chat_ids(new_task.sector_task)
             sector_display_names = {
                 SectorStatus.BAR: "Бар",
                 SectorStatus.HALL: "Зал",
@@ -138,26 +117,21 @@ async def notify_updated_task(old_task: Task, new_task: Task):
                 f"<b>Новый дедлайн:</b> {deadline_str}"
             )
 
-            for user in users_in_new_sector:
-                await _send_message(user.telegram_id, message_text)
+            _enqueue_for_chats(session, chat_ids, message_text)
 
     except Exception as e:
         logger.error(f"Error in notify_updated_task for task {new_task.task_id}: {e}")
 
-async def notify_deleted_task(task: Task):
-    if not _bot_instance:
-        logger.warning("Bot instance not initialized, skipping deleted task notification.")
-        return
-
+async def notify_deleted_task(task: Task, session: AsyncSession):
     try:
         if task.executor_id:
             logger.info(f"Sending deleted task notification to executor {task.executor_id}.")
             message_text = f"🗑️ Задача <b>\"{task.title}\"</b> была удалена."
-            await _send_message(task.executor_id, message_text)
+            _enqueue_message(session, task.executor_id, message_text)
 
         elif task.sector_task:
             logger.info(f"Sending deleted task notification to sector {task.sector_task}.")
-            users_in_sector = await UserService.get_users_by_sector(task.sector_task)
+            chat_ids = await UserService.get_sector_chat_ids(task.sector_task)
             sector_display_names = {
                 SectorStatus.BAR: "Бар",
                 SectorStatus.HALL: "Зал",
@@ -166,8 +140,7 @@ async def notify_deleted_task(task: Task):
             sector_name = sector_display_names.get(task.sector_task, str(task.sector_task))
             message_text = f"🗑️ Задача <b>\"{task.title}\"</b>, назначенная вашему сектору ({sector_name}), была удалена."
 
-            for user in users_in_sector:
-                await _send_message(user.telegram_id, message_text)
+            _enqueue_for_chats(session, chat_ids, message_text)
 
         else:
             logger.info("Deleted task had no executor or sector. No notification sent.")
@@ -175,11 +148,8 @@ async def notify_deleted_task(task: Task):
     except Exception as e:
         logger.error(f"Error in notify_deleted_task for task {task.task_id}: {e}")
 
-async def notify_manager_task_completed(task: Task, employee_full_name: str):
-    if not _bot_instance:
-        logger.warning("Bot instance not initialized, skipping manager task completion notification.")
-        return
-
+async def notify_manager_task_completed(task: Task, employee_full_name: str, session: AsyncSession,
+                                        photo_count: int = 0):
     if not task.manager_id:
         logger.info(f"Task {task.task_id} has no manager assigned. No manager notification sent.")
         return
@@ -197,16 +167,11 @@ async def notify_manager_task_completed(task: Task, employee_full_name: str):
         else:
             message_text += f"<b>Комментарий:</b> Нет комментария\n"
 
-        photo_count = 0
-        if task.photo_url:
-            photo_urls = [url.strip() for url in task.photo_url.split(',') if url.strip()]
-            photo_count = len(photo_urls)
-
         if photo_count > 0:
             message_text += f"\n📸 <b>Прикреплено {photo_count} фото.</b>"
 
         logger.info(f"Sending task completion notification to manager {task.manager_id}.")
-        await _send_message(task.manager_id, message_text)
+        _enqueue_message(session, task.manager_id, message_text)
 
     except Exception as e:
         logger.error(f"Error in notify_manager_task_completed for task {task.task_id}: {e}")
\ No newline at end of file
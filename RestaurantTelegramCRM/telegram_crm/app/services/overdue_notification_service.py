@@ -1,33 +1,46 @@
 import logging
-from typing import TYPE_CHECKING
+from datetime import datetime
+from zoneinfo import ZoneInfo
 
+from core.db_helper import db_helper
 from core.models import Task, SectorStatus
+from app.repository.task_repository import TaskRepository
 from app.services.user_service import UserService
-
-if TYPE_CHECKING:
-    from aiogram import Bot
+from app.services.notification_outbox import notification_outbox, NotificationBatch
 
 logger = logging.getLogger(__name__)
 
 class OverdueNotificationService:
-    def __init__(self, bot: "Bot"):
-        self.bot = bot
+    def __init__(self):
+        self.kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
 
-    async def _send_message(self, chat_id: int, text: str):
-        if not self.bot:
-            logger.error("Bot instance is not provided to OverdueNotificationService. Cannot send message.")
-            return
-        try:
-            await self.bot.send_message(chat_id=chat_id, text=text, parse_mode="HTML")
-            logger.info(f"Overdue notification sent successfully to user {chat_id}.")
-        except Exception as e:
-            logger.error(f"Failed to send overdue notification to user {chat_id}: {e}")
+    def _send_message(self, batch: NotificationBatch, chat_id: int, text: str):
+        batch.add([chat_id], text, parse_mode="HTML")
+        logger.info(f"Overdue notification queued for user {chat_id}.")
+
+    async def check_and_notify(self) -> int:
+        current_time = datetime.now(self.kemerovo_tz)
+        async with db_helper.session_scope() as session:
+            task_repository = TaskRepository(session)
+            claimed_rows = await task_repository.claim_overdue_tasks(current_time)
+
+            overdue_rows = [row for row in claimed_rows if row.Task.executor_id or row.Task.sector_task]
+            if not overdue_rows:
+                logger.debug("Нет новых просроченных задач для уведомления.")
+                return len(claimed_rows)
+
+            logger.info(f"Найдено {len(overdue_rows)} новых просроченных задач для уведомления.")
+
+            batch = notification_outbox.batch()
+            for row in overdue_rows:
+                await self.notify_overdue_task(batch, row.Task, row.executor_name, row.executor_position)
+            batch.flush(session)
+            logger.info(f"Поставлены в очередь уведомления о просрочке по {len(overdue_rows)} новым задачам.")
 
-    async def notify_overdue_task(self, task: Task):
-        if not self.bot:
-            logger.warning("Bot instance not provided to OverdueNotificationService, skipping overdue task notification.")
-            return
+        return len(claimed_rows)
 
+    async def notify_overdue_task(self, batch: NotificationBatch, task: Task, executor_name: str | None = None,
+                                  executor_position: str | None = None):
         try:
             if task.manager_id:
                 manager_message = (
@@ -35,8 +48,8 @@ class OverdueNotificationService:
                     f"<b>Задача:</b> {task.title}\n"
                     f"<b>Назначена:</b> "
                 )
-                if task.executor:
-                    manager_message += f"{task.executor.full_name or task.executor.full_name or 'N/A'} ({task.executor.position})"
+                if task.executor_id and executor_name:
+                    manager_message += f"{executor_name} ({executor_position})"
                 elif task.sector_task:
                     sector_names = {
                         SectorStatus.BAR: "Бар",
@@ -48,20 +61,20 @@ class OverdueNotificationService:
                     manager_message += "неизвестно"
                 manager_message += "\nПожалуйста, примите меры."
 
-                await self._send_message(task.manager_id, manager_message)
-                logger.info(f"Overdue notification sent to manager {task.manager_id} for task {task.task_id}")
+                self._send_message(batch, task.manager_id, manager_message)
+                logger.info(f"Overdue notification queued for manager {task.manager_id} for task {task.task_id}")
             else:
                 logger.warning(f"Task {task.task_id} has no manager assigned for overdue notification.")
 
             overdue_message = f"⚠️ <b>Задача просрочена!</b>\n<b>Задача:</b> {task.title}"
 
-            if task.executor_id and task.executor:
-                await self._send_message(task.executor_id, overdue_message)
-                logger.info(f"Overdue notification sent to executor {task.executor_id} for task {task.task_id}")
+            if task.executor_id and executor_name:
+                self._send_message(batch, task.executor_id, overdue_message)
+                logger.info(f"Overdue notification queued for executor {task.executor_id} for task {task.task_id}")
             elif task.sector_task:
                 try:
-                    users_in_sector = await UserService.get_users_by_sector(task.sector_task)
-                    if users_in_sector:
+                    chat_ids = await UserService.get_sector_chat_ids(task.sector_task)
+                    if chat_ids:
                         sector_display_names = {
                             SectorStatus.BAR: "Бар",
                             SectorStatus.HALL: "Зал",
@@ -70,9 +83,8 @@ class OverdueNotificationService:
                         sector_name = sector_display_names.get(task.sector_task, str(task.sector_task))
                         sector_message = f"{overdue_message}\n(Для сектора: {sector_name})"
 
-                        for user in users_in_sector:
-                            await self._send_message(user.telegram_id, sector_message)
-                            logger.info(f"Overdue notification sent to sector user {user.telegram_id} for task {task.task_id}")
+                        batch.add(chat_ids, sector_message, parse_mode="HTML")
+                        logger.info(f"Overdue notification queued for {len(chat_ids)} sector users for task {task.task_id}")
                     else:
                         logger.info(f"No users found in sector {task.sector_task} for overdue notification of task {task.task_id}")
                 except Exception as e:
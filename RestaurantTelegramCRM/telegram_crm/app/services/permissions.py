@@ -0,0 +1,84 @@
+from aiogram.filters.callback_data import CallbackData
+
+from core.models.base_model import UserRole
+from app.keyboards.callbacks import (
+    RoleCallback, RegSectorCallback, SelectTaskCallback, TaskActionCallback, ReportActionCallback, MyTasksPageCallback,
+    AssignmentCallback, SelectEmployeeCallback, SelectSectorCallback, EmployeesPageCallback, DeadlineCallback,
+    MainActionCallback, UpdateTaskCallback, DeleteTaskCallback, ConfirmDeleteCallback, FieldCallback,
+    TaskSectorCallback, ContinueCallback, DeleteTasksPageCallback, UpdateTasksPageCallback,
+    SelectCompletedTaskCallback, CheckTaskCallback, CompletedTasksPageCallback, StaffTasksPageCallback,
+)
+
+PUBLIC = None
+
+ALL_ROLES = frozenset(UserRole)
+MANAGER_ONLY = frozenset({UserRole.MANAGER})
+
+COMMAND_ROLES: dict[str, frozenset[UserRole] | None] = {
+    "start": PUBLIC,
+    "my_tasks": ALL_ROLES,
+    "create_task": MANAGER_ONLY,
+    "change_task": MANAGER_ONLY,
+    "completed_tasks": MANAGER_ONLY,
+    "all_overdue_task": MANAGER_ONLY,
+    "staff_tasks": MANAGER_ONLY,
+    "delete_user": MANAGER_ONLY,
+}
+
+CALLBACK_ROLES: dict[type[CallbackData], frozenset[UserRole] | None] = {
+    RoleCallback: PUBLIC,
+    RegSectorCallback: PUBLIC,
+    SelectTaskCallback: ALL_ROLES,
+    TaskActionCallback: ALL_ROLES,
+    ReportActionCallback: ALL_ROLES,
+    MyTasksPageCallback: ALL_ROLES,
+    AssignmentCallback: MANAGER_ONLY,
+    SelectEmployeeCallback: MANAGER_ONLY,
+    SelectSectorCallback: MANAGER_ONLY,
+    EmployeesPageCallback: MANAGER_ONLY,
+    DeadlineCallback: MANAGER_ONLY,
+    MainActionCallback: MANAGER_ONLY,
+    UpdateTaskCallback: MANAGER_ONLY,
+    DeleteTaskCallback: MANAGER_ONLY,
+    ConfirmDeleteCallback: MANAGER_ONLY,
+    FieldCallback: MANAGER_ONLY,
+    TaskSectorCallback: MANAGER_ONLY,
+    ContinueCallback: MANAGER_ONLY,
+    DeleteTasksPageCallback: MANAGER_ONLY,
+    UpdateTasksPageCallback: MANAGER_ONLY,
+    SelectCompletedTaskCallback: MANAGER_ONLY,
+    CheckTaskCallback: MANAGER_ONLY,
+    CompletedTasksPageCallback: MANAGER_ONLY,
+    StaffTasksPageCallback: MANAGER_ONLY,
+}
+
+
+def parse_command(text: str | None) -> str | None:
+    if not text or not text.startswith("/"):
+        return None
+    command, _, _ = text[1:].partition(" ")
+    command, _, _ = command.partition("@")
+    return command.lower()
+
+
+def parse_callback_prefix(data: str | None) -> str:
+    prefix, _, _ = (data or "").partition(":")
+    return prefix
+
+
+class PermissionTable:
+    def __init__(self, command_roles: dict[str, frozenset[UserRole] | None],
+                 callback_roles: dict[type[CallbackData], frozenset[UserRole] | None],
+                 default_roles: frozenset[UserRole] = MANAGER_ONLY):
+        self.command_roles = dict(command_roles)
+        self.callback_roles = {factory.__prefix__: roles for factory, roles in callback_roles.items()}
+        self.default_roles = default_roles
+
+    def roles_for_command(self, command: str) -> frozenset[UserRole] | None:
+        return self.command_roles.get(command, self.default_roles)
+
+    def roles_for_callback(self, prefix: str) -> frozenset[UserRole] | None:
+        return self.callback_roles.get(prefix, self.default_roles)
+
+
+permission_table = PermissionTable(COMMAND_ROLES, CALLBACK_ROLES)
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from core.config import settings
+from core.models.base_model import SectorStatus
+
+
+def _plural(number: int, forms: tuple[str, str, str]) -> str:
+    if number % 10 == 1 and number % 100 != 11:
+        return forms[0]
+    if 2 <= number % 10 <= 4 and not 12 <= number % 100 <= 14:
+        return forms[1]
+    return forms[2]
+
+
+def format_offset(offset_minutes: int) -> str:
+    if offset_minutes % 60 == 0:
+        hours = offset_minutes // 60
+        return f"за {hours} {_plural(hours, ('час', 'часа', 'часов'))}"
+    return f"за {offset_minutes} {_plural(offset_minutes, ('минуту', 'минуты', 'минут'))}"
+
+
+class ReminderPolicy:
+    def __init__(self, default_offsets: list[int], sector_offsets: dict[str, list[int]], grace_period: int):
+        self.default_offsets = tuple(sorted(set(default_offsets), reverse=True))
+        self.sector_offsets = {
+            SectorStatus[sector]: tuple(sorted(set(offsets), reverse=True))
+            for sector, offsets in sector_offsets.items()
+        }
+        self.grace_period = timedelta(minutes=grace_period)
+        self.kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
+
+    def offsets_for(self, sector: SectorStatus | None) -> tuple[int, ...]:
+        if sector is not None:
+            return self.sector_offsets.get(sector, self.default_offsets)
+        return self.default_offsets
+
+    def build_reminders(self, deadline: datetime | None, sector: SectorStatus | None,
+                        current_time: datetime) -> list[tuple[int, datetime]]:
+        if deadline is None:
+            return []
+
+        deadline = self._to_local(deadline)
+        not_before = self._to_local(current_time) - self.grace_period
+        reminders = []
+        for offset_minutes in self.offsets_for(sector):
+            fire_at = deadline - timedelta(minutes=offset_minutes)
+            if fire_at >= not_before:
+                reminders.append((offset_minutes, fire_at))
+        return reminders
+
+    def is_stale(self, fire_at: datetime, current_time: datetime) -> bool:
+        return self._to_local(fire_at) < self._to_local(current_time) - self.grace_period
+
+    def _to_local(self, value: datetime) -> datetime:
+        if value.tzinfo is not None:
+            value = value.astimezone(self.kemerovo_tz)
+        return value.replace(tzinfo=None)
+
+
+reminder_policy = ReminderPolicy(
+    default_offsets=settings.reminders.default_offsets,
+    sector_offsets=settings.reminders.sector_offsets,
+    grace_period=settings.reminders.grace_period,
+)
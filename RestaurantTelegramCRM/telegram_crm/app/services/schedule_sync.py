@@ -0,0 +1,47 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db_helper import db_helper
+from app.repository.cache_version_repository import CacheVersionRepository
+from app.repository.outbox_repository import OutboxRepository
+from app.services.deadline_scheduler import deadline_scheduler
+from app.services.notification_outbox import notification_outbox
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_VERSION = "schedule"
+
+
+class ScheduleSync:
+    def __init__(self, name: str = SCHEDULE_VERSION):
+        self.name = name
+        self.version: int | None = None
+
+    async def check(self):
+        async with db_helper.session_scope() as session:
+            cache_version_repository = CacheVersionRepository(session)
+            version = await cache_version_repository.get_version(self.name)
+            outbox_repository = OutboxRepository(session)
+            next_attempt_at = await outbox_repository.get_next_attempt_at()
+
+        if self.version is not None and version != self.version:
+            deadline_scheduler.request_resync()
+            logger.info(f"Расписание задач изменено другим процессом: версия {self.version} -> {version}")
+        self.version = version
+
+        notification_outbox.wake_if_due(next_attempt_at)
+
+    async def run(self, interval: float):
+        self.version = None
+        while True:
+            await self.check()
+            await asyncio.sleep(interval)
+
+    async def bump(self, session: AsyncSession):
+        cache_version_repository = CacheVersionRepository(session)
+        await cache_version_repository.bump_version(self.name)
+
+
+schedule_sync = ScheduleSync()
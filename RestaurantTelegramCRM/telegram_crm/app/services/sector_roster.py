@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.db_helper import db_helper
+from core.models.base_model import SectorStatus
+from app.repository.user_repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SectorRoster:
+    def __init__(self, reconcile_interval: float):
+        self.reconcile_interval = reconcile_interval
+        self._chat_ids: dict[SectorStatus, set[int]] = {}
+        self._sector_by_chat_id: dict[int, SectorStatus] = {}
+        self._reconciled_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def is_stale(self) -> bool:
+        return self._reconciled_at is None or time.monotonic() - self._reconciled_at >= self.reconcile_interval
+
+    async def get_chat_ids(self, sector: SectorStatus) -> list[int]:
+        if self.is_stale():
+            await self.reconcile()
+        return list(self._chat_ids.get(sector, ()))
+
+    async def reconcile(self, session: AsyncSession | None = None, force: bool = False):
+        async with self._lock:
+            if not force and not self.is_stale():
+                return
+
+            async with db_helper.session_scope(session) as session:
+                user_repository = UserRepository(session)
+                members = await user_repository.get_sector_members()
+
+            chat_ids: dict[SectorStatus, set[int]] = {}
+            for telegram_id, sector in members:
+                chat_ids.setdefault(sector, set()).add(telegram_id)
+
+            self._chat_ids = chat_ids
+            self._sector_by_chat_id = {telegram_id: sector for telegram_id, sector in members}
+            self._reconciled_at = time.monotonic()
+            logger.info(f"Состав секторов обновлён: {len(members)} сотрудник(ов)")
+
+    async def run(self):
+        while True:
+            await self.reconcile(force=True)
+            await asyncio.sleep(self.reconcile_interval)
+
+    def add(self, telegram_id: int, sector: SectorStatus | None):
+        self.remove(telegram_id)
+        if sector is None:
+            return
+        self._chat_ids.setdefault(sector, set()).add(telegram_id)
+        self._sector_by_chat_id[telegram_id] = sector
+
+    def remove(self, telegram_id: int):
+        sector = self._sector_by_chat_id.pop(telegram_id, None)
+        if sector is not None:
+            self._chat_ids.get(sector, set()).discard(telegram_id)
+
+
+sector_roster = SectorRoster(settings.cache.roster_reconcile_interval)
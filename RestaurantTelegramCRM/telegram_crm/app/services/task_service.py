@@ -1,16 +1,29 @@
 from datetime import datetime
+from functools import partial
 from zoneinfo import ZoneInfo
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
 from core.db_helper import db_helper
-from core.models import Task, TaskStatus
-from core.models.base_model import SectorStatus
+from core.models import Task
+from core.models.base_model import SectorStatus, TaskStatus
 from app.repository.task_repository import TaskRepository
+from app.repository.reminder_repository import ReminderRepository
+from app.repository.task_photo_repository import TaskPhotoRepository
+from app.repository.loading_profiles import LEAN_TASK
+from app.repository.pagination import Page, parse_cursor
+from app.services.deadline_scheduler import deadline_scheduler
+from app.services.reminder_policy import reminder_policy
+from app.services.schedule_sync import schedule_sync
+from app.services.notification_service import notify_new_task, notify_deleted_task, notify_updated_task
 
 class TaskService:
     @staticmethod
     async def create_new_task(manager_id: int, executor_id: int | None, title: str, description: str,
                               deadline: datetime | None,
-                              sector_task: SectorStatus | None = None) -> dict:
+                              sector_task: SectorStatus | None = None,
+                              session: AsyncSession | None = None) -> dict:
         kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
 
         aware_deadline = None
@@ -20,142 +33,191 @@ class TaskService:
             else:
                 aware_deadline = deadline.astimezone(kemerovo_tz)
 
-        async with db_helper.session_factory() as session:
+        async with db_helper.session_scope(session) as session:
             try:
-                new_task = Task(
-                    manager_id=manager_id,
-                    executor_id=executor_id,
-                    title=title,
-                    description=description,
-                    deadline=aware_deadline,
-                    sector_task=sector_task
-                )
-                session.add(new_task)
-                await session.commit()
-                await session.refresh(new_task)
-
-                try:
-                    from app.services.notification_service import notify_new_task
-                    await notify_new_task(new_task)
-                except Exception as notify_error:
-                    print(f"Предупреждение: Ошибка при отправке уведомления о новой задаче: {notify_error}")
-
-                return {"success": True, "message": "Задача создана", "task": new_task}
+                async with db_helper.savepoint(session):
+                    new_task = Task(
+                        manager_id=manager_id,
+                        executor_id=executor_id,
+                        title=title,
+                        description=description,
+                        deadline=aware_deadline,
+                        sector_task=sector_task
+                    )
+                    session.add(new_task)
+                    await session.flush()
+
+                    reminder_repository = ReminderRepository(session)
+                    reminder_times = await reminder_repository.replace_reminders(
+                        new_task.task_id,
+                        reminder_policy.build_reminders(new_task.deadline, sector_task, datetime.now(kemerovo_tz))
+                    )
+                    db_helper.after_commit(
+                        session,
+                        partial(deadline_scheduler.schedule_task, new_task.task_id, new_task.deadline, reminder_times)
+                    )
+                    await schedule_sync.bump(session)
+
+                    try:
+                        await notify_new_task(new_task, session)
+                    except Exception as notify_error:
+                        print(f"Предупреждение: Ошибка при отправке уведомления о новой задаче: {notify_error}")
+
+                    return {"success": True, "message": "Задача создана", "task": new_task}
 
             except Exception as e:
-                await session.rollback()
                 return {"success": False, "message": f"Ошибка при создании задачи: {str(e)}"}
 
     @staticmethod
-    async def get_tasks_user(telegram_id: int) -> list[Task]:
-        async with db_helper.session_factory() as session:
+    async def get_user_board_page(telegram_id: int, sector: SectorStatus | None, cursor: str | None = None,
+                                  backward: bool = False, session: AsyncSession | None = None) -> Page:
+        current_time = datetime.now(ZoneInfo("Asia/Krasnoyarsk"))
+        async with db_helper.session_scope(session) as session:
             task_repository = TaskRepository(session)
-            tasks = await task_repository.get_all_task_for_executor(telegram_id)
-            active_and_overdue_tasks = [task for task in tasks if task.status != TaskStatus.COMPLETED]
-            return active_and_overdue_tasks
+            return await task_repository.get_user_board_page(
+                telegram_id, sector, current_time,
+                cursor=parse_cursor(cursor, (datetime, int)),
+                backward=backward,
+                limit=settings.tg.page_size
+            )
 
     @staticmethod
-    async def get_task_by_id(task_id: int) -> Task:
-        async with db_helper.session_factory() as session:
+    async def get_task_by_id(task_id: int, session: AsyncSession | None = None) -> Task:
+        async with db_helper.session_scope(session) as session:
             task_repository = TaskRepository(session)
             return await task_repository.get_task_by_id(task_id)
 
     @staticmethod
-    async def get_all_overdue_tasks():
-        async with db_helper.session_factory() as session:
+    async def get_all_overdue_tasks(session: AsyncSession | None = None):
+        async with db_helper.session_scope(session) as session:
             task_repository = TaskRepository(session)
             return await task_repository.get_all_overdue_tasks_command()
 
     @staticmethod
-    async def complete_task(task_id: int, comment: str = None, photo_url: str = None, executor_id: int = None) -> dict:
-        async with db_helper.session_factory() as session:
+    async def complete_task(task_id: int, comment: str = None, photos: list[dict] | None = None,
+                            executor_id: int = None, session: AsyncSession | None = None) -> dict:
+        async with db_helper.session_scope(session) as session:
             task_repository = TaskRepository(session)
             try:
-                result = await task_repository.complete_task(task_id, comment, photo_url, executor_id)
-                if result > 0:
-                    return {"success": True, "message": "Задача успешно завершена"}
-                else:
-                    return {"success": False, "message": "Задача не найдена"}
+                async with db_helper.savepoint(session):
+                    result = await task_repository.complete_task(task_id, comment, executor_id)
+                    if result > 0:
+                        task_photo_repository = TaskPhotoRepository(session)
+                        await task_photo_repository.replace_photos(task_id, photos or [])
+                        reminder_repository = ReminderRepository(session)
+                        await reminder_repository.delete_reminders(task_id, pending_only=True)
+                        db_helper.after_commit(session, partial(deadline_scheduler.unschedule_task, task_id))
+                        await schedule_sync.bump(session)
+                        return {"success": True, "message": "Задача успешно завершена"}
+                    else:
+                        return {"success": False, "message": "Задача не найдена"}
             except Exception as e:
                 return {"success": False, "message": f"Ошибка при завершении задачи: {str(e)}"}
 
     @staticmethod
-    async def get_completed_tasks() -> list[Task]:
-        async with db_helper.session_factory() as session:
+    async def get_completed_tasks_page(cursor: str | None = None, backward: bool = False,
+                                       session: AsyncSession | None = None) -> Page:
+        async with db_helper.session_scope(session) as session:
             task_repository = TaskRepository(session)
-            return await task_repository.get_completed_tasks()
+            return await task_repository.get_completed_tasks_page(
+                cursor=parse_cursor(cursor, (int,)), backward=backward, limit=settings.tg.page_size
+            )
 
     @staticmethod
-    async def get_task_by_id_and_staff(task_id: int) -> Task:
-        async with db_helper.session_factory() as session:
+    async def get_task_by_id_and_staff(task_id: int, session: AsyncSession | None = None) -> Task:
+        async with db_helper.session_scope(session) as session:
             task_repository = TaskRepository(session)
             return await task_repository.get_task_by_id_and_staff(task_id)
 
     @staticmethod
-    async def delete_task_for_task_id(task_id: int):
-        async with db_helper.session_factory() as session:
+    async def delete_task_for_task_id(task_id: int, session: AsyncSession | None = None):
+        async with db_helper.session_scope(session) as session:
             try:
-                task_repository = TaskRepository(session)
-                task_to_delete = await task_repository.get_task_by_id(task_id)
-
-                if task_to_delete:
-                    await task_repository.delete_task_for_task_id(task_id)
-
-                    try:
-                        from app.services.notification_service import notify_deleted_task
-                        await notify_deleted_task(task_to_delete)
-                    except Exception as notify_error:
-                        print(f"Предупреждение: Ошибка при отправке уведомления об удалении задачи: {notify_error}")
-                else:
-                    print(f"Попытка удаления несуществующей задачи с ID {task_id}")
+                async with db_helper.savepoint(session):
+                    task_repository = TaskRepository(session)
+                    task_to_delete = await task_repository.get_task_by_id(task_id, profile=LEAN_TASK)
+
+                    if task_to_delete:
+                        reminder_repository = ReminderRepository(session)
+                        await reminder_repository.delete_reminders(task_id)
+                        task_photo_repository = TaskPhotoRepository(session)
+                        await task_photo_repository.delete_photos(task_id)
+                        await task_repository.delete_task_for_task_id(task_id)
+                        db_helper.after_commit(session, partial(deadline_scheduler.unschedule_task, task_id))
+                        await schedule_sync.bump(session)
+
+                        try:
+                            await notify_deleted_task(task_to_delete, session)
+                        except Exception as notify_error:
+                            print(f"Предупреждение: Ошибка при отправке уведомления об удалении задачи: {notify_error}")
+                    else:
+                        print(f"Попытка удаления несуществующей задачи с ID {task_id}")
 
             except Exception as e:
                 print(f"Ошибка при удалении задачи {task_id}: {e}")
 
     @staticmethod
-    async def get_all_task() -> list[Task]:
-        async with db_helper.session_factory() as session:
+    async def get_all_task_page(cursor: str | None = None, backward: bool = False,
+                                session: AsyncSession | None = None) -> Page:
+        async with db_helper.session_scope(session) as session:
             task_repository = TaskRepository(session)
-            return await task_repository.get_activ_and_overdue_tasks()
+            return await task_repository.get_activ_and_overdue_tasks_page(
+                cursor=parse_cursor(cursor, (int,)), backward=backward, limit=settings.tg.page_size
+            )
 
     @staticmethod
-    async def update_task_field(task_id: int, field: str, new_value) -> dict:
-        async with db_helper.session_factory() as session:
+    async def update_task_field(task_id: int, field: str, new_value, session: AsyncSession | None = None) -> dict:
+        if field == 'executor':
+            changes = {'executor_id': new_value, 'sector_task': None}
+        elif field == 'sector_task':
+            changes = {'sector_task': new_value, 'executor_id': None}
+        elif field == 'deadline':
+            changes = {
+                'deadline': new_value,
+                'status': TaskStatus.ACTIVE,
+                'notified_overdue': False
+            }
+        else:
+            changes = {field: new_value}
+
+        async with db_helper.session_scope(session) as session:
             try:
-                task_repository = TaskRepository(session)
-                old_task = await task_repository.get_task_by_id(task_id)
-                if not old_task:
-                    return {"success": False, "message": "Задача не найдена"}
-
-                if field == 'executor':
-                    await task_repository.update_task_field(task_id, 'executor_id', new_value)
-                    await task_repository.update_task_field(task_id, 'sector_task', None)
-                elif field == 'sector_task':
-                    await task_repository.update_task_field(task_id, 'sector_task', new_value)
-                    await task_repository.update_task_field(task_id, 'executor_id', None)
-                else:
-                    await task_repository.update_task_field(task_id, field, new_value)
-
-                updated_task = await task_repository.get_task_by_id(task_id)
-
-                try:
-                    from app.services.notification_service import notify_updated_task
-                    await notify_updated_task(old_task, updated_task)
-                except Exception as notify_error:
-                    print(f"Предупреждение: Ошибка при отправке уведомления об изменении задачи: {notify_error}")
-
-                return {"success": True, "message": "Задача успешно обновлена"}
+                async with db_helper.savepoint(session):
+                    task_repository = TaskRepository(session)
+                    old_task, updated_task = await task_repository.update_task_fields(task_id, changes)
+                    if not updated_task:
+                        return {"success": False, "message": "Задача не найдена"}
+
+                    if field in ('deadline', 'executor', 'sector_task') and updated_task.status == TaskStatus.ACTIVE:
+                        reminder_repository = ReminderRepository(session)
+                        reminder_times = await reminder_repository.replace_reminders(
+                            task_id,
+                            reminder_policy.build_reminders(
+                                updated_task.deadline, updated_task.sector_task,
+                                datetime.now(ZoneInfo("Asia/Krasnoyarsk"))
+                            ),
+                            keep_sent=field != 'deadline'
+                        )
+                        db_helper.after_commit(
+                            session,
+                            partial(deadline_scheduler.schedule_task, task_id, updated_task.deadline, reminder_times)
+                        )
+                        await schedule_sync.bump(session)
+
+                    try:
+                        await notify_updated_task(old_task, updated_task, session)
+                    except Exception as notify_error:
+                        print(f"Предупреждение: Ошибка при отправке уведомления об изменении задачи: {notify_error}")
+
+                    return {"success": True, "message": "Задача успешно обновлена", "task": updated_task}
             except Exception as e:
                 return {"success": False, "message": f"Ошибка при обновлении задачи: {str(e)}"}
 
     @staticmethod
-    async def get_staff_tasks():
-        async with db_helper.session_factory() as session:
-            task_repository = TaskRepository(session)
-            return await task_repository.get_staff_tasks()
-
-    @staticmethod
-    async def get_sector_tasks(sector: SectorStatus) -> list[Task]:
-        async with db_helper.session_factory() as session:
+    async def get_staff_tasks_page(cursor: str | None = None, backward: bool = False,
+                                   session: AsyncSession | None = None) -> Page:
+        async with db_helper.session_scope(session) as session:
             task_repository = TaskRepository(session)
-            return await task_repository.get_sector_tasks(sector)
\ No newline at end of file
+            return await task_repository.get_staff_tasks_page(
+                cursor=parse_cursor(cursor, (int,)), backward=backward, limit=settings.tg.page_size
+            )
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from core.config import settings
+from core.models import User
+from core.models.base_model import UserRole, SectorStatus
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedUser:
+    telegram_id: int
+    full_name: str
+    role: UserRole
+    position: str
+    sector: SectorStatus | None
+
+    @classmethod
+    def from_model(cls, user: User) -> "CachedUser":
+        return cls(
+            telegram_id=user.telegram_id,
+            full_name=user.full_name,
+            role=user.role,
+            position=user.position,
+            sector=user.sector
+        )
+
+
+class UserCache:
+    def __init__(self, ttl: float, negative_ttl: float, max_size: int):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[int, tuple[float, CachedUser | None]] = OrderedDict()
+
+    def get(self, telegram_id: int):
+        entry = self._entries.get(telegram_id)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[telegram_id]
+            self.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(telegram_id)
+        self.hits += 1
+        return user
+
+    def set(self, telegram_id: int, user: CachedUser | None, version: int | None = None):
+        if version is not None and version != self.version:
+            return
+
+        ttl = self.ttl if user is not None else self.negative_ttl
+        self._entries[telegram_id] = (time.monotonic() + ttl, user)
+        self._entries.move_to_end(telegram_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, telegram_id: int):
+        self.version += 1
+        self._entries.pop(telegram_id, None)
+
+    def clear(self):
+        self.version += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    async def report_metrics(self, interval: float):
+        last_hits, last_misses = self.hits, self.misses
+        while True:
+            await asyncio.sleep(interval)
+            stats = self.stats()
+            hits = stats["hits"] - last_hits
+            misses = stats["misses"] - last_misses
+            if hits or misses:
+                logger.info(
+                    f"Кеш пользователей: попаданий {hits}, промахов {misses} "
+                    f"({hits / (hits + misses):.0%} попаданий), записей {stats['size']}, "
+                    f"всего попаданий {stats['hits']}, промахов {stats['misses']}"
+                )
+            last_hits, last_misses = stats["hits"], stats["misses"]
+
+
+user_cache = UserCache(
+    settings.cache.user_ttl,
+    settings.cache.user_negative_ttl,
+    settings.cache.user_max_size,
+)
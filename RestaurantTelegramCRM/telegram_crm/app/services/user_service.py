@@ -1,47 +1,93 @@
+from functools import partial
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
 from core.db_helper import db_helper
 from app.repository.user_repository import UserRepository
+from app.repository.pagination import Page, parse_cursor
+from app.services.user_cache import user_cache, CachedUser, MISSING
+from app.services.sector_roster import sector_roster
+from app.services.cache_sync import user_cache_sync
 from core.models import User
 from core.models.base_model import UserRole, SectorStatus
 
 class UserService:
     @staticmethod
-    async def get_user_by_telegram_id(telegram_id: int):
-        async with db_helper.session_factory() as session:
+    async def get_user_by_telegram_id(telegram_id: int, session: AsyncSession | None = None) -> CachedUser | None:
+        cached_user = user_cache.get(telegram_id)
+        if cached_user is not MISSING:
+            return cached_user
+
+        version = user_cache.version
+        async with db_helper.session_scope(session) as session:
             user_repository = UserRepository(session)
-            return await user_repository.get_user(telegram_id)
+            user = await user_repository.get_user(telegram_id)
+
+        cached_user = CachedUser.from_model(user) if user else None
+        user_cache.set(telegram_id, cached_user, version)
+        return cached_user
 
     @staticmethod
-    async def create_new_user(telegram_id: int, full_name: str, role: UserRole, position: str, sector: SectorStatus) -> dict:
-        async with db_helper.session_factory() as session:
+    async def create_new_user(telegram_id: int, full_name: str, role: UserRole, position: str, sector: SectorStatus,
+                              session: AsyncSession | None = None) -> dict:
+        async with db_helper.session_scope(session) as session:
             user_repository = UserRepository(session)
             user = await user_repository.get_user(telegram_id)
             if user is None:
                 await user_repository.create_user(telegram_id, full_name, role, position, sector)
+                await user_cache_sync.bump(session)
+                user_cache.invalidate(telegram_id)
+                db_helper.after_commit(session, partial(user_cache.invalidate, telegram_id))
+                db_helper.after_commit(session, partial(sector_roster.add, telegram_id, sector))
                 return {"success": True, "message": "Пользователь успешно создан"}
             return {"success": False, "message": "Пользователь уже существует"}
 
     @staticmethod
-    async def get_all_users() -> list[User]:
-        async with db_helper.session_factory() as session:
+    async def get_all_users(session: AsyncSession | None = None) -> list[User]:
+        async with db_helper.session_scope(session) as session:
             user_repository = UserRepository(session)
             return await user_repository.get_all_users()
 
     @staticmethod
-    async def delete_user(telegram_id: int):
-        async with db_helper.session_factory() as session:
+    async def preload_cache(session: AsyncSession | None = None) -> int:
+        version = user_cache.version
+        async with db_helper.session_scope(session) as session:
+            user_repository = UserRepository(session)
+            users = await user_repository.get_all_users(limit=user_cache.max_size)
+
+        for user in users:
+            user_cache.set(user.telegram_id, CachedUser.from_model(user), version)
+        return len(users)
+
+    @staticmethod
+    async def get_users_page(cursor: str | None = None, backward: bool = False,
+                             session: AsyncSession | None = None) -> Page:
+        async with db_helper.session_scope(session) as session:
+            user_repository = UserRepository(session)
+            return await user_repository.get_users_page(
+                cursor=parse_cursor(cursor, (int,)), backward=backward, limit=settings.tg.page_size
+            )
+
+    @staticmethod
+    async def delete_user(telegram_id: int, session: AsyncSession | None = None):
+        async with db_helper.session_scope(session) as session:
             user_repository = UserRepository(session)
             try:
-                deleted_count = await user_repository.delete_user(telegram_id)
-                if deleted_count > 0:
-                    return {"success": True, "message": "Сотрудник успешно удален"}
-                else:
-                    return {"success": False, "message": "Сотрудник не найден"}
+                async with db_helper.savepoint(session):
+                    deleted_count = await user_repository.delete_user(telegram_id)
+                    await user_cache_sync.bump(session)
+                    user_cache.invalidate(telegram_id)
+                    db_helper.after_commit(session, partial(user_cache.invalidate, telegram_id))
+                    db_helper.after_commit(session, partial(sector_roster.remove, telegram_id))
+                    if deleted_count > 0:
+                        return {"success": True, "message": "Сотрудник успешно удален"}
+                    else:
+                        return {"success": False, "message": "Сотрудник не найден"}
             except Exception as e:
                 print(e)
                 return {"success": False, "message": f"Ошибка при удалении: {str(e)}"}
 
     @staticmethod
-    async def get_users_by_sector(sector: SectorStatus):
-        async with db_helper.session_factory() as session:
-            user_repository = UserRepository(session)
-            return await user_repository.get_users_by_sector(sector)
\ No newline at end of file
+    async def get_sector_chat_ids(sector: SectorStatus) -> list[int]:
+        return await sector_roster.get_chat_ids(sector)
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import text
+
+from core.config import settings
+from core.db_helper import db_helper
+from core.models.base_model import SectorStatus
+from app.repository.fsm_repository import FsmRepository
+from app.repository.user_repository import UserRepository
+from app.repository.task_repository import TaskRepository
+from app.services.cache_sync import user_cache_sync
+from app.services.sector_roster import sector_roster
+from app.services.task_service import TaskService
+from app.services.user_service import UserService
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ID = 0
+WARMUP_FSM_KEY = "warmup"
+
+
+class StartupWarmup:
+    def __init__(self, connections: int, preload_users: bool, timeout: float, enabled: bool = True):
+        self.connections = connections
+        self.preload_users = preload_users
+        self.timeout = timeout
+        self.enabled = enabled
+        self.kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
+        self.started_at = time.monotonic()
+
+    async def run(self):
+        if self.enabled:
+            warmup_started_at = time.monotonic()
+            try:
+                await asyncio.wait_for(self.warm_up(), timeout=self.timeout)
+                logger.info(f"Прогрев завершён за {time.monotonic() - warmup_started_at:.2f} с")
+            except asyncio.TimeoutError:
+                logger.warning(f"Прогрев не уложился в {self.timeout} с, бот запускается без него")
+            except Exception as e:
+                logger.warning(f"Ошибка прогрева, бот запускается без него: {e}")
+
+        logger.info(f"Бот готов к работе через {time.monotonic() - self.started_at:.2f} с после запуска")
+
+    async def warm_up(self):
+        await self.open_connections()
+        await self.compile_statements()
+        await self.preload_caches()
+
+    async def open_connections(self):
+        started_at = time.monotonic()
+        async with AsyncExitStack() as stack:
+            for _ in range(self.connections):
+                connection = await stack.enter_async_context(db_helper.engine.connect())
+                await connection.execute(text("SELECT 1"))
+        logger.info(f"Открыто {self.connections} соединений с базой данных за {time.monotonic() - started_at:.2f} с")
+
+    async def compile_statements(self):
+        started_at = time.monotonic()
+        current_time = datetime.now(self.kemerovo_tz)
+        async with db_helper.session_factory() as session:
+            user_repository = UserRepository(session)
+            await user_repository.get_user(WARMUP_ID)
+
+            task_repository = TaskRepository(session)
+            await task_repository.get_task_by_id(WARMUP_ID)
+            await task_repository.get_task_by_id_and_staff(WARMUP_ID)
+            for sector in (None, SectorStatus.BAR):
+                await task_repository.get_user_board_page(WARMUP_ID, sector, current_time,
+                                                          limit=settings.tg.page_size)
+
+            await TaskService.get_completed_tasks_page(session=session)
+            await TaskService.get_all_task_page(session=session)
+            await TaskService.get_staff_tasks_page(session=session)
+            await UserService.get_users_page(session=session)
+
+            fsm_repository = FsmRepository(session)
+            await fsm_repository.get_state(WARMUP_FSM_KEY)
+
+            await db_helper.rollback(session)
+        logger.info(f"Частые запросы скомпилированы за {time.monotonic() - started_at:.2f} с")
+
+    async def preload_caches(self):
+        started_at = time.monotonic()
+        await user_cache_sync.check()
+        await sector_roster.reconcile(force=True)
+        if self.preload_users:
+            loaded = await UserService.preload_cache()
+            logger.info(f"В кеш загружено {loaded} пользователь(ей)")
+        logger.info(f"Кеши заполнены за {time.monotonic() - started_at:.2f} с")
+
+
+startup_warmup = StartupWarmup(
+    connections=settings.db.pool_size,
+    preload_users=settings.warmup.preload_users,
+    timeout=settings.warmup.timeout,
+    enabled=settings.warmup.enabled,
+)
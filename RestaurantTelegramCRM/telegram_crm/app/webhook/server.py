@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import signal
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+from sqlalchemy import text
+
+from core.config import settings
+from core.db_helper import db_helper
+
+logger = logging.getLogger(__name__)
+
+READY_KEY = web.AppKey("ready", bool)
+
+
+class LimitedRequestHandler(SimpleRequestHandler):
+    def __init__(self, dispatcher: Dispatcher, bot: Bot, max_concurrency: int, **kwargs: Any):
+        super().__init__(dispatcher, bot, handle_in_background=False, **kwargs)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        async with self._semaphore:
+            try:
+                return await super().handle(request)
+            except Exception as e:
+                logger.error(f"Ошибка обработки обновления из вебхука: {e}")
+                return web.Response()
+
+
+async def healthz(request: web.Request) -> web.Response:
+    return web.json_response({"status": "ok"})
+
+
+async def readyz(request: web.Request) -> web.Response:
+    if not request.app[READY_KEY]:
+        return web.json_response({"status": "starting"}, status=503)
+    try:
+        async with db_helper.engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.warning(f"Проверка готовности: база данных недоступна: {e}")
+        return web.json_response({"status": "database unavailable"}, status=503)
+    return web.json_response({"status": "ready"})
+
+
+def build_webhook_app(dp: Dispatcher, bot: Bot) -> web.Application:
+    config = settings.webhook
+    if not config.secret_token:
+        raise ValueError("Для режима вебхука необходимо задать WEBHOOK_SECRET")
+
+    app = web.Application()
+    app[READY_KEY] = False
+    app.router.add_get("/healthz", healthz)
+    app.router.add_get("/readyz", readyz)
+
+    LimitedRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        max_concurrency=config.max_concurrency,
+        secret_token=config.secret_token,
+    ).register(app, path=config.path)
+
+    async def on_startup(app: web.Application):
+        if config.register_webhook:
+            if not config.base_url:
+                raise ValueError("Для регистрации вебхука необходимо задать WEBHOOK_URL")
+            await bot.set_webhook(
+                url=f"{config.base_url.rstrip('/')}{config.path}",
+                secret_token=config.secret_token,
+                allowed_updates=dp.resolve_used_update_types(),
+                max_connections=min(config.max_concurrency, 100),
+            )
+            logger.info(f"Вебхук зарегистрирован: {config.base_url.rstrip('/')}{config.path}")
+        app[READY_KEY] = True
+
+    async def on_shutdown(app: web.Application):
+        app[READY_KEY] = False
+
+    setup_application(app, dp, bot=bot)
+    app.on_startup.append(on_startup)
+    app.on_shutdown.insert(0, on_shutdown)
+    return app
+
+
+async def run_webhook(dp: Dispatcher, bot: Bot):
+    config = settings.webhook
+    app = build_webhook_app(dp, bot)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, config.host, config.port)
+    await site.start()
+    logger.info(f"Сервер вебхука запущен на {config.host}:{config.port}")
+
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop_event.set)
+    try:
+        await stop_event.wait()
+        logger.info("Получен сигнал остановки, сервер вебхука завершает работу")
+    finally:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(signum)
+        await runner.cleanup()
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import multiprocessing
+import queue
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import Update
+
+from app.workers.hashing import ConsistentHashRing
+from app.workers.worker import run_worker
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerCluster:
+    def __init__(self, worker_count: int, queue_size: int = 0, hash_replicas: int = 64,
+                 monitor_interval: float = 5.0, shutdown_timeout: float = 30.0,
+                 target: Callable[..., None] = run_worker, target_args: tuple = ()):
+        self.worker_count = worker_count
+        self.monitor_interval = monitor_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.target = target
+        self.target_args = target_args
+        self._context = multiprocessing.get_context("spawn")
+        self.queues = [self._context.Queue(queue_size) for _ in range(worker_count)]
+        self.ring = ConsistentHashRing(list(range(worker_count)), hash_replicas)
+        self._processes: list[multiprocessing.Process | None] = [None] * worker_count
+
+    @property
+    def context(self):
+        return self._context
+
+    async def start(self):
+        for index in range(self.worker_count):
+            self._start_worker(index)
+        logger.info(f"Запущено воркеров: {self.worker_count}")
+
+    async def dispatch(self, shard_key: int, update: dict[str, Any]):
+        update_queue = self.queues[self.ring.get_node(shard_key)]
+        item = (shard_key, update)
+        try:
+            update_queue.put_nowait(item)
+        except queue.Full:
+            await asyncio.get_running_loop().run_in_executor(None, update_queue.put, item)
+
+    async def monitor(self):
+        while True:
+            await asyncio.sleep(self.monitor_interval)
+            for index, process in enumerate(self._processes):
+                if process is not None and not process.is_alive():
+                    logger.error(f"Воркер {index} завершился с кодом {process.exitcode}, перезапуск")
+                    self._start_worker(index)
+
+    async def stop(self):
+        for update_queue in self.queues:
+            update_queue.put(None)
+
+        loop = asyncio.get_running_loop()
+        for index, process in enumerate(self._processes):
+            if process is None:
+                continue
+            await loop.run_in_executor(None, process.join, self.shutdown_timeout)
+            if process.is_alive():
+                logger.warning(f"Воркер {index} не остановился за {self.shutdown_timeout} с, завершаем принудительно")
+                process.terminate()
+                await loop.run_in_executor(None, process.join)
+            self._processes[index] = None
+        logger.info("Воркеры остановлены")
+
+    def _start_worker(self, index: int):
+        process = self._context.Process(
+            target=self.target,
+            args=(index, self.queues[index], *self.target_args),
+            name=f"bot-worker-{index}",
+        )
+        process.start()
+        self._processes[index] = process
+
+
+class ShardRouterMiddleware(BaseMiddleware):
+    def __init__(self, cluster: WorkerCluster):
+        self.cluster = cluster
+
+    async def __call__(
+            self,
+            handler: Callable[[Update, dict[str, Any]], Awaitable[Any]],
+            event: Update,
+            data: dict[str, Any],
+    ) -> Any:
+        chat = data.get("event_chat")
+        user = data.get("event_from_user")
+        if chat is not None:
+            shard_key = chat.id
+        elif user is not None:
+            shard_key = user.id
+        else:
+            shard_key = event.update_id
+
+        await self.cluster.dispatch(
+            shard_key, event.model_dump(mode="json", by_alias=True, exclude_unset=True)
+        )
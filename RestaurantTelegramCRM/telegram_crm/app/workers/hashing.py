@@ -0,0 +1,23 @@
+import bisect
+import hashlib
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    def __init__(self, nodes: list[int], replicas: int = 64):
+        if not nodes:
+            raise ValueError("Кольцо хеширования должно содержать хотя бы один узел")
+        self.replicas = replicas
+        self._ring: list[tuple[int, int]] = sorted(
+            (_hash(f"{node}:{replica}"), node)
+            for node in nodes
+            for replica in range(replicas)
+        )
+        self._hashes = [point for point, _ in self._ring]
+
+    def get_node(self, key: int | str) -> int:
+        index = bisect.bisect(self._hashes, _hash(str(key))) % len(self._ring)
+        return self._ring[index][1]
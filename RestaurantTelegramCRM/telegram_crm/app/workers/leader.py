@@ -0,0 +1,71 @@
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from core.db_helper import db_helper
+from app.jobs.supervisor import JobSupervisor
+from app.repository.lease_repository import LeaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    def __init__(self, name: str, supervisor: JobSupervisor, lease_ttl: int, renew_interval: int,
+                 holder: str | None = None):
+        self.name = name
+        self.supervisor = supervisor
+        self.lease_ttl = timedelta(seconds=lease_ttl)
+        self.renew_interval = renew_interval
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}"
+        self.kemerovo_tz = ZoneInfo("Asia/Krasnoyarsk")
+        self.is_leader = False
+
+    async def run(self):
+        logger.info(f"Выборы лидера {self.name}: участник {self.holder}")
+
+        try:
+            while True:
+                try:
+                    acquired = await asyncio.wait_for(self._try_acquire(), timeout=self.renew_interval)
+                except Exception as e:
+                    logger.error(f"Не удалось продлить аренду лидера {self.name}: {e}")
+                    acquired = False
+
+                if acquired and not self.is_leader:
+                    self.is_leader = True
+                    logger.info(f"{self.holder} стал лидером {self.name}")
+                    await self.supervisor.start()
+                elif not acquired and self.is_leader:
+                    self.is_leader = False
+                    logger.warning(f"{self.holder} потерял лидерство {self.name}")
+                    await self.supervisor.stop()
+
+                await asyncio.sleep(self.renew_interval)
+        finally:
+            if self.is_leader:
+                self.is_leader = False
+                await self.supervisor.stop()
+                await self._release()
+
+    async def _try_acquire(self) -> bool:
+        current_time = self._now()
+        async with db_helper.session_scope() as session:
+            lease_repository = LeaseRepository(session)
+            return await lease_repository.try_acquire(
+                self.name, self.holder, current_time, current_time + self.lease_ttl
+            )
+
+    async def _release(self):
+        try:
+            async with db_helper.session_scope() as session:
+                lease_repository = LeaseRepository(session)
+                await lease_repository.release(self.name, self.holder, self._now())
+            logger.info(f"{self.holder} освободил аренду лидера {self.name}")
+        except Exception as e:
+            logger.error(f"Не удалось освободить аренду лидера {self.name}: {e}")
+
+    def _now(self) -> datetime:
+        return datetime.now(self.kemerovo_tz).replace(tzinfo=None)
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import queue
+import signal
+from functools import partial
+from multiprocessing.queues import Queue
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+
+from core.config import settings
+from core.db_helper import db_helper
+from core.logging_config import setup_logging
+from app.bootstrap import (
+    create_bot, create_storage, setup_dispatcher, setup_update_middlewares,
+    register_local_jobs, register_leader_jobs, build_job_supervisor,
+)
+from app.fsm.event_isolation import ChatEventIsolation, ChatLocks
+from app.jobs.supervisor import JobRegistry
+from app.services.cache_sync import user_cache_sync
+from app.services.warmup import startup_warmup
+from app.workers.leader import LeaderElection
+
+logger = logging.getLogger(__name__)
+
+QUEUE_READ_BATCH = 100
+
+
+class ShardConsumer:
+    def __init__(self, dp: Dispatcher, bot: Bot, update_queue: Queue, max_concurrency: int, max_pending: int = 1000):
+        self.dp = dp
+        self.bot = bot
+        self.update_queue = update_queue
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending = asyncio.Semaphore(max(max_pending, max_concurrency))
+        self._chat_locks = ChatLocks()
+        self._tasks: set[asyncio.Task] = set()
+        self.processed = 0
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            items = await loop.run_in_executor(None, self._read_batch)
+            for item in items:
+                if item is None:
+                    stopping = True
+                    break
+                shard_key, update = item
+                await self._pending.acquire()
+                task = asyncio.create_task(self._process(shard_key, update))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _read_batch(self) -> list[Any]:
+        items = [self.update_queue.get()]
+        while items[-1] is not None and len(items) < QUEUE_READ_BATCH:
+            try:
+                items.append(self.update_queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    async def _process(self, shard_key: int, update: dict[str, Any]):
+        try:
+            async with self._chat_locks.hold(shard_key), self._semaphore:
+                await self.dp.feed_raw_update(self.bot, update)
+        except Exception as e:
+            logger.error(f"Ошибка обработки обновления {update.get('update_id')}: {e}")
+        finally:
+            self.processed += 1
+            self._pending.release()
+
+
+async def _run_worker(index: int, update_queue: Queue):
+    config = settings.workers
+    bot = create_bot()
+    storage = create_storage()
+    dp = Dispatcher(storage=storage, events_isolation=ChatEventIsolation())
+    setup_update_middlewares(dp)
+    setup_dispatcher(dp, bot)
+
+    leader_registry = JobRegistry()
+    register_leader_jobs(leader_registry, bot)
+    leader_election = LeaderElection(
+        config.lease_name,
+        build_job_supervisor(leader_registry),
+        lease_ttl=config.lease_ttl,
+        renew_interval=config.lease_renew_interval,
+    )
+
+    job_registry = JobRegistry()
+    register_local_jobs(job_registry, storage)
+    job_registry.register("leader_election", leader_election.run)
+    job_registry.register("user_cache_sync", partial(user_cache_sync.run, config.cache_sync_interval))
+    job_supervisor = build_job_supervisor(job_registry)
+    dp.startup.register(startup_warmup.run)
+    dp.startup.register(job_supervisor.start)
+    dp.shutdown.register(job_supervisor.stop)
+
+    consumer = ShardConsumer(dp, bot, update_queue, config.max_concurrency, config.max_pending)
+    await dp.emit_startup(bot=bot)
+    logger.info(f"Воркер {index} запущен")
+    try:
+        await consumer.run()
+    finally:
+        await dp.emit_shutdown(bot=bot)
+        await bot.session.close()
+        await db_helper.engine.dispose()
+        logger.info(f"Воркер {index} остановлен, обработано обновлений: {consumer.processed}")
+
+
+def run_worker(index: int, update_queue: Queue):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    setup_logging()
+    try:
+        asyncio.run(_run_worker(index, update_queue))
+    except KeyboardInterrupt:
+        pass
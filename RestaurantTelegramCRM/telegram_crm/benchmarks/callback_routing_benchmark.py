@@ -0,0 +1,98 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+from aiogram import Bot, Dispatcher, Router
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import CallbackQuery, Update
+
+from app.handlers.callback_dispatcher import CallbackDispatcher
+
+BENCH_TOKEN = "42:benchmark"
+
+
+def build_callback_update(update_id: int, data: str) -> Update:
+    return Update.model_validate({
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id),
+            "from": {"id": 1, "is_bot": False, "first_name": "user1"},
+            "chat_instance": "benchmark",
+            "data": data,
+        },
+    })
+
+
+def build_prefix_router(handler_count: int) -> tuple[Router, list[int]]:
+    router = Router()
+    hits = []
+
+    for index in range(handler_count):
+        prefix = f"p{index}:"
+
+        async def handle(callback_query: CallbackQuery, index=index):
+            value = int(callback_query.data.split(':')[1])
+            hits.append(index + value)
+
+        router.callback_query.register(handle, lambda c, prefix=prefix: c.data and c.data.startswith(prefix))
+    return router, hits
+
+
+def build_callback_dispatcher(handler_count: int) -> tuple[Router, list[int]]:
+    dispatcher = CallbackDispatcher()
+    hits = []
+
+    for index in range(handler_count):
+        factory = type(f"Cb{index}", (CallbackData,), {"__annotations__": {"value": int}}, prefix=f"p{index}")
+
+        async def handle(callback_query: CallbackQuery, callback_data: CallbackData, index=index):
+            hits.append(index + callback_data.value)
+
+        dispatcher.register(factory)(handle)
+    return dispatcher.router, hits
+
+
+async def measure(router: Router, hits: list[int], updates: list[Update], rounds: int) -> float:
+    dp = Dispatcher()
+    dp.include_router(router)
+    bot = Bot(BENCH_TOKEN)
+
+    timings = []
+    for _ in range(rounds):
+        hits.clear()
+        started = time.perf_counter()
+        for update in updates:
+            await dp.feed_update(bot, update)
+        timings.append((time.perf_counter() - started) / len(updates))
+        if len(hits) != len(updates):
+            raise RuntimeError(f"Обработано {len(hits)} из {len(updates)} обновлений")
+
+    await bot.session.close()
+    return statistics.median(timings) * 1_000_000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Время маршрутизации callback-запросов в зависимости от числа обработчиков")
+    parser.add_argument("--handlers", default="5,20,50,100,200")
+    parser.add_argument("--updates", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Обновлений: {args.updates}, повторов: {args.rounds}; попадания в первый, средний и последний обработчик")
+    print(f"{'обработчиков':>12} | {'startswith, мкс':>15} | {'таблица, мкс':>12} | {'ускорение':>9}")
+
+    for handler_count in [int(value) for value in args.handlers.split(",")]:
+        targets = [0, handler_count // 2, handler_count - 1]
+        updates = [
+            build_callback_update(update_id, f"p{targets[update_id % len(targets)]}:{update_id}")
+            for update_id in range(args.updates)
+        ]
+
+        linear = await measure(*build_prefix_router(handler_count), updates, args.rounds)
+        table = await measure(*build_callback_dispatcher(handler_count), updates, args.rounds)
+        print(f"{handler_count:>12} | {linear:>15.1f} | {table:>12.1f} | {linear / table:>8.2f}x")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
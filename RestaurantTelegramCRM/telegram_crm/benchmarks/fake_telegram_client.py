@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from collections import Counter
+
+from aiohttp import ClientSession
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+def build_update(update_id: int, chat_id: int, text: str) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": f"user{chat_id}"},
+            "text": text,
+        },
+    }
+
+
+async def check_endpoints(session: ClientSession, base_url: str):
+    for path in ("/healthz", "/readyz"):
+        async with session.get(f"{base_url}{path}") as response:
+            print(f"{path}: {response.status} {await response.text()}")
+
+
+async def post_updates(session: ClientSession, url: str, secret: str, updates: list[dict],
+                       concurrency: int) -> tuple[Counter, list[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses = Counter()
+    latencies = []
+
+    async def post(update: dict):
+        async with semaphore:
+            started = time.perf_counter()
+            async with session.post(url, json=update, headers={SECRET_HEADER: secret}) as response:
+                await response.read()
+                statuses[response.status] += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(post(update) for update in updates))
+    return statuses, latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Фейковый клиент Telegram: отправляет обновления на вебхук бота")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8080")
+    parser.add_argument("--path", default="/webhook")
+    parser.add_argument("--secret", required=True)
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--chats", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--text", default="/start")
+    args = parser.parse_args()
+
+    update_ids = itertools.count(int(time.time()))
+    chat_ids = itertools.cycle(range(1, args.chats + 1))
+    updates = [build_update(next(update_ids), next(chat_ids), args.text) for _ in range(args.updates)]
+
+    async with ClientSession() as session:
+        await check_endpoints(session, args.base_url)
+
+        started = time.perf_counter()
+        statuses, latencies = await post_updates(
+            session, f"{args.base_url}{args.path}", args.secret, updates, args.concurrency
+        )
+        elapsed = time.perf_counter() - started
+
+        async with session.post(f"{args.base_url}{args.path}", json=updates[0],
+                                headers={SECRET_HEADER: "wrong-secret"}) as response:
+            print(f"Запрос с неверным секретом: {response.status}")
+
+    latencies.sort()
+    print(f"Отправлено {len(updates)} обновлений за {elapsed:.2f} с ({len(updates) / elapsed:.1f}/с)")
+    print(f"Коды ответов: {dict(statuses)}")
+    print(f"Задержка, мс: медиана {statistics.median(latencies):.2f}, "
+          f"p95 {latencies[int(len(latencies) * 0.95) - 1]:.2f}, максимум {latencies[-1]:.2f}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,198 @@
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import event, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from core.models import BaseModel, Task, TaskReminder, User, TaskStatus, SectorStatus, UserRole
+
+NEW_INDEXES = (
+    "ix_tasks_executor_id_status",
+    "ix_tasks_sector_task_status",
+    "ix_tasks_status_deadline",
+    "ix_tasks_overdue_unnotified",
+    "ix_task_reminders_due",
+)
+
+REMINDER_OFFSETS = (1440, 600, 120)
+
+
+def build_queries(executor_id: int, now: datetime) -> dict:
+    return {
+        "get_all_task_for_executor": select(Task).where(Task.executor_id == executor_id),
+        "get_sector_tasks": select(Task).where(
+            Task.sector_task == SectorStatus.KITCHEN,
+            Task.status.in_([TaskStatus.ACTIVE, TaskStatus.OVERDUE])
+        ),
+        "get_all_overdue_tasks (executor)": (
+            select(Task, User)
+            .join(User, Task.executor_id == User.telegram_id)
+            .where(
+                Task.status == TaskStatus.OVERDUE,
+                Task.executor_id.isnot(None),
+                Task.notified_overdue == False
+            )
+        ),
+        "get_all_overdue_tasks (sector)": select(Task).where(
+            Task.status == TaskStatus.OVERDUE,
+            Task.executor_id.is_(None),
+            Task.sector_task.isnot(None),
+            Task.notified_overdue == False
+        ),
+        "claim_due_reminders": select(TaskReminder).where(
+            TaskReminder.fire_at <= now,
+            TaskReminder.sent_at.is_(None)
+        ),
+    }
+
+
+async def seed(conn: AsyncConnection, users_count: int, tasks_count: int, now: datetime):
+    rnd = random.Random(42)
+    sectors = list(SectorStatus)
+    users = [
+        {
+            "telegram_id": 100000 + i,
+            "full_name": f"Сотрудник {i}",
+            "role": UserRole.MANAGER if i % 20 == 0 else UserRole.STAFF,
+            "position": "Повар",
+            "sector": sectors[i % len(sectors)],
+        }
+        for i in range(users_count)
+    ]
+    await conn.execute(insert(User), users)
+
+    managers = [u["telegram_id"] for u in users if u["role"] == UserRole.MANAGER]
+    staff = [u["telegram_id"] for u in users if u["role"] == UserRole.STAFF]
+
+    batch = []
+    reminders = []
+    for i in range(tasks_count):
+        roll = rnd.random()
+        if roll < 0.9:
+            status = TaskStatus.COMPLETED
+            deadline = now - timedelta(days=rnd.randint(1, 720))
+        elif roll < 0.95:
+            status = TaskStatus.OVERDUE
+            deadline = now - timedelta(hours=rnd.randint(1, 240))
+        else:
+            status = TaskStatus.ACTIVE
+            deadline = now + timedelta(hours=rnd.randint(1, 24 * 14))
+
+        for_sector = rnd.random() < 0.3
+        notified = status != TaskStatus.ACTIVE and rnd.random() < 0.97
+        batch.append({
+            "title": f"Задача {i}",
+            "description": "Описание задачи",
+            "deadline": deadline,
+            "status": status,
+            "sector_task": rnd.choice(sectors) if for_sector else None,
+            "created_at": deadline - timedelta(days=1),
+            "notified_overdue": notified,
+            "executor_id": None if for_sector else rnd.choice(staff),
+            "manager_id": rnd.choice(managers),
+        })
+        for offset_minutes in REMINDER_OFFSETS:
+            fire_at = deadline - timedelta(minutes=offset_minutes)
+            reminders.append({
+                "task_id": i + 1,
+                "offset_minutes": offset_minutes,
+                "fire_at": fire_at,
+                "sent_at": fire_at if fire_at <= now and rnd.random() < 0.999 else None,
+            })
+        if len(batch) == 5000:
+            await conn.execute(insert(Task), batch)
+            await conn.execute(insert(TaskReminder), reminders)
+            batch = []
+            reminders = []
+    if batch:
+        await conn.execute(insert(Task), batch)
+        await conn.execute(insert(TaskReminder), reminders)
+
+
+async def explain(conn: AsyncConnection, stmt) -> list[str]:
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+
+    def add_prefix(connection, cursor, statement, parameters, context, executemany):
+        return prefix + statement, parameters
+
+    sync_engine = conn.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", add_prefix, retval=True)
+    try:
+        result = await conn.execute(stmt)
+        rows = result.cursor.fetchall()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", add_prefix)
+    return [str(row[-1]) for row in rows]
+
+
+async def measure(conn: AsyncConnection, stmt, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = await conn.execute(stmt)
+        result.fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def report(conn: AsyncConnection, queries: dict, runs: int, title: str):
+    print(f"\n===== {title} =====")
+    for name, stmt in queries.items():
+        plan = await explain(conn, stmt)
+        elapsed = await measure(conn, stmt, runs)
+        print(f"\n-- {name}: {elapsed:.2f} ms (median of {runs})")
+        for line in plan:
+            print(f"   {line}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Планы и время горячих запросов к tasks до и после индексов")
+    parser.add_argument("--url", default=None, help="URL базы данных (по умолчанию временный SQLite)")
+    parser.add_argument("--tasks", type=int, default=300_000)
+    parser.add_argument("--users", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    url = args.url or f"sqlite+aiosqlite:///{Path(tempfile.gettempdir()) / 'task_indexes_benchmark.db'}"
+    engine = create_async_engine(url)
+    now = datetime.now().replace(microsecond=0)
+    indexes = [
+        index
+        for table in (Task.__table__, TaskReminder.__table__)
+        for index in table.indexes
+        if index.name in NEW_INDEXES
+    ]
+
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.drop_all)
+        await conn.run_sync(BaseModel.metadata.create_all)
+        for index in indexes:
+            await conn.run_sync(index.drop)
+        print(f"Заполнение: {args.users} сотрудников, {args.tasks} задач...")
+        await seed(conn, args.users, args.tasks, now)
+        await conn.execute(text("ANALYZE"))
+
+    queries = build_queries(executor_id=100001, now=now)
+
+    async with engine.connect() as conn:
+        await report(conn, queries, args.runs, "До миграций aade7945594c и 8983bb5102e4")
+
+    async with engine.begin() as conn:
+        for index in indexes:
+            await conn.run_sync(index.create)
+        await conn.execute(text("ANALYZE"))
+
+    async with engine.connect() as conn:
+        await report(conn, queries, args.runs, "После миграций aade7945594c и 8983bb5102e4")
+
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
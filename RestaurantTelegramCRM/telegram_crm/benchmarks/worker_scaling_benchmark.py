@@ -0,0 +1,122 @@
+import argparse
+import asyncio
+import itertools
+import multiprocessing
+import signal
+import time
+from collections import Counter
+
+from aiogram import Bot, Dispatcher, Router
+from aiogram.types import Message
+
+from app.fsm.event_isolation import ChatEventIsolation
+from app.workers.cluster import WorkerCluster
+from app.workers.worker import ShardConsumer
+from benchmarks.fake_telegram_client import build_update
+
+BENCH_TOKEN = "42:benchmark"
+
+
+def burn_cpu(milliseconds: float):
+    deadline = time.perf_counter() + milliseconds / 1000
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _bench_worker(index, update_queue, results, cpu_ms, io_ms, concurrency):
+    router = Router()
+    last_seen: dict[int, int] = {}
+    violations = 0
+
+    @router.message()
+    async def handle(message: Message):
+        nonlocal violations
+        if last_seen.get(message.chat.id, -1) > message.message_id:
+            violations += 1
+        last_seen[message.chat.id] = message.message_id
+        burn_cpu(cpu_ms)
+        await asyncio.sleep(io_ms / 1000)
+
+    dp = Dispatcher(events_isolation=ChatEventIsolation())
+    dp.include_router(router)
+    bot = Bot(BENCH_TOKEN)
+    consumer = ShardConsumer(dp, bot, update_queue, concurrency)
+
+    results.put(("ready", index))
+    await consumer.run()
+    results.put(("done", index, consumer.processed, violations))
+    await bot.session.close()
+
+
+def bench_worker(index, update_queue, results, cpu_ms, io_ms, concurrency):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(_bench_worker(index, update_queue, results, cpu_ms, io_ms, concurrency))
+
+
+async def run_case(worker_count: int, updates: list[dict], args) -> dict:
+    loop = asyncio.get_running_loop()
+    results = multiprocessing.get_context("spawn").Queue()
+    cluster = WorkerCluster(
+        worker_count,
+        target=bench_worker,
+        target_args=(results, args.cpu_ms, args.io_ms, args.concurrency),
+    )
+    await cluster.start()
+    for _ in range(worker_count):
+        await loop.run_in_executor(None, results.get)
+
+    shards = Counter()
+    started = time.perf_counter()
+    for update in updates:
+        chat_id = update["message"]["chat"]["id"]
+        shards[cluster.ring.get_node(chat_id)] += 1
+        await cluster.dispatch(chat_id, update)
+    stop_task = asyncio.create_task(cluster.stop())
+
+    processed = 0
+    violations = 0
+    for _ in range(worker_count):
+        _, _, worker_processed, worker_violations = await loop.run_in_executor(None, results.get)
+        processed += worker_processed
+        violations += worker_violations
+    elapsed = time.perf_counter() - started
+    await stop_task
+
+    return {
+        "workers": worker_count,
+        "processed": processed,
+        "elapsed": elapsed,
+        "rate": processed / elapsed,
+        "violations": violations,
+        "max_share": max(shards.values()) / len(updates),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Пропускная способность обработки обновлений в зависимости от числа воркеров")
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--chats", type=int, default=200)
+    parser.add_argument("--cpu-ms", type=float, default=2.0)
+    parser.add_argument("--io-ms", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    chat_ids = itertools.cycle(range(1, args.chats + 1))
+    updates = [build_update(update_id, next(chat_ids), "benchmark") for update_id in range(1, args.updates + 1)]
+
+    print(f"Обновлений: {args.updates}, чатов: {args.chats}, CPU {args.cpu_ms} мс + ожидание {args.io_ms} мс на обновление")
+    print(f"{'воркеров':>8} | {'обработано':>10} | {'время, с':>8} | {'обн./с':>8} | {'ускорение':>9} | "
+          f"{'макс. доля шарда':>16} | {'нарушений порядка':>17}")
+
+    baseline = None
+    for worker_count in [int(value) for value in args.workers.split(",")]:
+        result = await run_case(worker_count, updates, args)
+        baseline = baseline or result["rate"]
+        print(f"{result['workers']:>8} | {result['processed']:>10} | {result['elapsed']:>8.2f} | "
+              f"{result['rate']:>8.1f} | {result['rate'] / baseline:>8.2f}x | "
+              f"{result['max_share']:>15.0%} | {result['violations']:>17}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
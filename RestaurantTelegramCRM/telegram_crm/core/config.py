@@ -12,22 +12,134 @@ class EnvLoader:
 class DatabaseENV(EnvLoader):
     DATABASE_URL: str = getenv("DATABASE_URL")
     TOKEN: str = getenv("TOKEN")
+    BOT_MODE: str = getenv("BOT_MODE", "polling")
+    WEBHOOK_URL: str | None = getenv("WEBHOOK_URL")
+    WEBHOOK_SECRET: str | None = getenv("WEBHOOK_SECRET")
+    BOT_WORKERS: int = int(getenv("BOT_WORKERS", "1"))
+    WEBHOOK_REPLICAS: int = int(getenv("WEBHOOK_REPLICAS", "1"))
 
 
 class DataBaseConfig(BaseModel):
     url: str = DatabaseENV.DATABASE_URL
     echo: bool = False
-    pool_size: int = 10
-    max_overflow: int = 15
+    pool_size: int = 20
+    max_overflow: int = 44
 
 
 class TelegramConfig(BaseModel):
     token: str = DatabaseENV.TOKEN
+    page_size: int = 10
+
+
+class WebhookConfig(BaseModel):
+    mode: str = DatabaseENV.BOT_MODE
+    base_url: str | None = DatabaseENV.WEBHOOK_URL
+    path: str = "/webhook"
+    secret_token: str | None = DatabaseENV.WEBHOOK_SECRET
+    replicas: int = DatabaseENV.WEBHOOK_REPLICAS
+    host: str = "0.0.0.0"
+    port: int = 8080
+    max_concurrency: int = 64
+    polling_concurrency: int = 64
+    register_webhook: bool = True
+
+
+class WorkersConfig(BaseModel):
+    count: int = DatabaseENV.BOT_WORKERS
+    queue_size: int = 10000
+    hash_replicas: int = 64
+    max_concurrency: int = 64
+    max_pending: int = 1000
+    monitor_interval: float = 5.0
+    shutdown_timeout: float = 30.0
+    lease_name: str = "scheduler"
+    lease_ttl: int = 30
+    lease_renew_interval: int = 10
+    cache_sync_interval: float = 2.0
+
+
+class LoggingConfig(BaseModel):
+    level: str = "INFO"
+
+
+class FsmConfig(BaseModel):
+    flush_interval: float = 1.0
+    batch_size: int = 500
+    cache_ttl: int = 600
+    state_ttl: int = 86400
+    purge_interval: int = 3600
+
+
+class MediaGroupConfig(BaseModel):
+    window: float = 0.5
+
+
+class CacheConfig(BaseModel):
+    user_ttl: int = 300
+    user_negative_ttl: int = 30
+    user_max_size: int = 1024
+    roster_reconcile_interval: int = 600
+    metrics_interval: int = 300
+
+
+class WarmupConfig(BaseModel):
+    enabled: bool = True
+    preload_users: bool = True
+    timeout: float = 30.0
+
+
+class SchedulerConfig(BaseModel):
+    resync_interval: int = 3600
+    signal_poll_interval: float = 1.0
+
+
+class ReminderConfig(BaseModel):
+    default_offsets: list[int] = [1440, 600, 120]
+    sector_offsets: dict[str, list[int]] = {}
+    grace_period: int = 60
+
+
+class JobsConfig(BaseModel):
+    restart_delay: float = 1.0
+    max_restart_delay: float = 60.0
+    restart_jitter: float = 0.1
+    shutdown_timeout: float = 10.0
+
+
+class SenderConfig(BaseModel):
+    max_concurrency: int = 16
+    global_rate: float = 25.0
+    global_burst: int = 25
+    per_chat_rate: float = 1.0
+    per_chat_burst: int = 3
+    max_retries: int = 3
+    metrics_interval: int = 300
+
+
+class OutboxConfig(BaseModel):
+    batch_size: int = 50
+    poll_interval: int = 30
+    lease_timeout: int = 120
+    max_attempts: int = 8
+    retry_base_delay: float = 5.0
+    retry_max_delay: float = 3600.0
 
 
 class Settings(BaseSettings):
     db: DataBaseConfig = DataBaseConfig()
     tg: TelegramConfig = TelegramConfig()
+    webhook: WebhookConfig = WebhookConfig()
+    fsm: FsmConfig = FsmConfig()
+    media_groups: MediaGroupConfig = MediaGroupConfig()
+    workers: WorkersConfig = WorkersConfig()
+    logging: LoggingConfig = LoggingConfig()
+    cache: CacheConfig = CacheConfig()
+    warmup: WarmupConfig = WarmupConfig()
+    scheduler: SchedulerConfig = SchedulerConfig()
+    reminders: ReminderConfig = ReminderConfig()
+    jobs: JobsConfig = JobsConfig()
+    sender: SenderConfig = SenderConfig()
+    outbox: OutboxConfig = OutboxConfig()
 
 
 settings = Settings()
@@ -1,7 +1,36 @@
+import inspect
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
 
 from core.config import settings
 
+logger = logging.getLogger(__name__)
+
+AFTER_COMMIT_KEY = "after_commit"
+HAS_WRITES_KEY = "has_writes"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_write_statement(orm_execute_state: ORMExecuteState):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context: Any):
+    session.info[HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_writes(session: Session, transaction: SessionTransaction):
+    if transaction.parent is None:
+        session.info.pop(HAS_WRITES_KEY, None)
+
 
 class DatabaseHelper:
     def __init__(
@@ -25,10 +54,62 @@ class DatabaseHelper:
             expire_on_commit=False
         )
 
+    @asynccontextmanager
+    async def session_scope(self, session: AsyncSession | None = None) -> AsyncIterator[AsyncSession]:
+        if session is not None:
+            yield session
+            return
+
+        async with self.session_factory() as new_session:
+            try:
+                yield new_session
+            except Exception:
+                await self.rollback(new_session)
+                raise
+            await self.commit(new_session)
+
+    @asynccontextmanager
+    async def savepoint(self, session: AsyncSession) -> AsyncIterator[AsyncSession]:
+        mark = len(session.info.get(AFTER_COMMIT_KEY, []))
+        try:
+            async with session.begin_nested():
+                yield session
+        except Exception:
+            del session.info.get(AFTER_COMMIT_KEY, [])[mark:]
+            raise
+
+    @staticmethod
+    def is_read_only(session: AsyncSession) -> bool:
+        return (
+            not session.info.get(HAS_WRITES_KEY)
+            and not session.in_nested_transaction()
+            and not (session.new or session.dirty or session.deleted)
+        )
+
+    @staticmethod
+    def after_commit(session: AsyncSession, callback: Callable[[], Any]):
+        session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+    @staticmethod
+    async def commit(session: AsyncSession):
+        await session.commit()
+        for callback in session.info.pop(AFTER_COMMIT_KEY, []):
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Ошибка в обработчике после фиксации транзакции: {e}")
+
+    @staticmethod
+    async def rollback(session: AsyncSession):
+        session.info.pop(AFTER_COMMIT_KEY, None)
+        await session.rollback()
+
 
 db_helper = DatabaseHelper(
     settings.db.url,
     settings.db.echo,
     settings.db.pool_size,
     settings.db.max_overflow,
-)
\ No newline at end of file
+)
@@ -0,0 +1,46 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from core.config import settings
+
+LOG_FORMAT = "%(levelname)s:%(name)s:%(message)s"
+
+QUIET_LOGGERS = (
+    "aiogram",
+    "app.services.notification_service",
+    "app.services.deadline_scheduler",
+    "app.services.deadline_notification_service",
+    "app.services.notification_outbox",
+)
+
+
+class StructuredFormatter(logging.Formatter):
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = super().formatMessage(record)
+        context = getattr(record, "context", None)
+        if context:
+            message += " " + " ".join(f"{key}={value}" for key, value in context.items())
+        return message
+
+
+def setup_logging() -> QueueListener:
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(StructuredFormatter(LOG_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(settings.logging.level)
+
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
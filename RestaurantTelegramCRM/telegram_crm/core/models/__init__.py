@@ -1,7 +1,13 @@
 from sqlalchemy.orm import configure_mappers
 
-from .base_model import BaseModel, UserRole, TaskStatus, SectorStatus
+from .base_model import BaseModel, UserRole, TaskStatus, SectorStatus, OutboxStatus
 from .user_model import User
 from .task_model import Task
+from .outbox_model import OutboxMessage
+from .task_reminder_model import TaskReminder
+from .task_photo_model import TaskPhoto
+from .fsm_state_model import FsmState
+from .leader_lease_model import LeaderLease
+from .cache_version_model import CacheVersion
 
 configure_mappers()
\ No newline at end of file
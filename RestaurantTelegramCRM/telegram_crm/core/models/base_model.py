@@ -21,4 +21,8 @@ class TaskStatus(Enum):
 class SectorStatus(Enum):
     BAR = "BAR"
     HALL = "HALL"
-    KITCHEN = "KITCHEN"
\ No newline at end of file
+    KITCHEN = "KITCHEN"
+
+class OutboxStatus(Enum):
+    PENDING = "pending"
+    DEAD = "dead"
@@ -1,15 +1,28 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import Integer, Text, DateTime, ForeignKey, BigInteger, String, Enum, Boolean
+from sqlalchemy import Integer, Text, DateTime, ForeignKey, BigInteger, String, Enum, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.models.base_model import BaseModel, TaskStatus, SectorStatus
 from core.models.user_model import User
+from core.models.task_photo_model import TaskPhoto
 
 
 class Task(BaseModel):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_executor_id_status", "executor_id", "status"),
+        Index("ix_tasks_sector_task_status", "sector_task", "status"),
+        Index("ix_tasks_status_deadline", "status", "deadline"),
+        Index(
+            "ix_tasks_overdue_unnotified",
+            "status",
+            "executor_id",
+            postgresql_where=text("notified_overdue = false"),
+            sqlite_where=text("notified_overdue = 0"),
+        ),
+    )
 
     task_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, index=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
@@ -21,11 +34,7 @@ class Task(BaseModel):
                                                  nullable=False)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     comment: Mapped[str | None] = mapped_column(Text, nullable=True)
-    photo_url: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    notified_24_hours: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    notified_10_hours: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    notified_2_hours: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     notified_overdue: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     executor_id: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("users.telegram_id"), nullable=True)
@@ -34,10 +43,15 @@ class Task(BaseModel):
     executor: Mapped["User | None"] = relationship(
         back_populates="executed_tasks",
         foreign_keys=[executor_id],
-        lazy="selectin"
+        lazy="raise"
     )
     manager: Mapped["User"] = relationship(
         back_populates="managed_tasks",
         foreign_keys=[manager_id],
-        lazy="selectin"
+        lazy="raise"
+    )
+    photos: Mapped[list["TaskPhoto"]] = relationship(
+        order_by="TaskPhoto.ordinal",
+        passive_deletes=True,
+        lazy="raise"
     )
\ No newline at end of file
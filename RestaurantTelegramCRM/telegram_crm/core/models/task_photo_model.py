@@ -0,0 +1,18 @@
+from sqlalchemy import Integer, String, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.models.base_model import BaseModel
+
+
+class TaskPhoto(BaseModel):
+    __tablename__ = "task_photos"
+    __table_args__ = (
+        UniqueConstraint("task_id", "ordinal", name="uq_task_photos_task_ordinal"),
+    )
+
+    photo_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    task_id: Mapped[int] = mapped_column(Integer, ForeignKey("tasks.task_id", ondelete="CASCADE"), nullable=False)
+    file_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_unique_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    ordinal: Mapped[int] = mapped_column(Integer, nullable=False)
+    size: Mapped[int | None] = mapped_column(Integer, nullable=True)
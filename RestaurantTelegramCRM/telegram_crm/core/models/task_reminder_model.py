@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import Integer, DateTime, ForeignKey, Index, UniqueConstraint, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.models.base_model import BaseModel
+
+
+class TaskReminder(BaseModel):
+    __tablename__ = "task_reminders"
+    __table_args__ = (
+        UniqueConstraint("task_id", "offset_minutes", name="uq_task_reminders_task_offset"),
+        Index(
+            "ix_task_reminders_due",
+            "fire_at",
+            postgresql_where=text("sent_at IS NULL"),
+            sqlite_where=text("sent_at IS NULL"),
+        ),
+    )
+
+    reminder_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    task_id: Mapped[int] = mapped_column(Integer, ForeignKey("tasks.task_id", ondelete="CASCADE"), nullable=False)
+    offset_minutes: Mapped[int] = mapped_column(Integer, nullable=False)
+    fire_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
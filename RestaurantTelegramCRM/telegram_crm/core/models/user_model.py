@@ -18,11 +18,11 @@ class User(BaseModel):
         "Task",
         back_populates="manager",
         foreign_keys="Task.manager_id",
-        lazy="selectin"
+        lazy="raise"
     )
     executed_tasks = relationship(
         "Task",
         back_populates="executor",
         foreign_keys="Task.executor_id",
-        lazy="selectin"
+        lazy="raise"
     )
\ No newline at end of file
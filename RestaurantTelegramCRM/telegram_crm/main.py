@@ -2,54 +2,92 @@ import asyncio
 import logging
 
 from aiogram import Bot, Dispatcher
-from aiogram.client.default import DefaultBotProperties
-from aiogram.enums import ParseMode
-from aiogram.fsm.storage.memory import MemoryStorage
 
 from core.config import settings
-from app.handlers import all_routers
-from app.middlewares.overdue_checker_middleware import OverdueCheckerMiddleware
-from app.middlewares.access_middleware import CommandAccessMiddleware
-
-from app.services.notification_service import init_notifier
-
-logging.basicConfig(level=logging.INFO)
-logging.getLogger('aiogram').setLevel(logging.WARNING)
-logging.getLogger('app.services.notification_service').setLevel(logging.WARNING)
-logging.getLogger('app.middlewares.overdue_checker_middleware').setLevel(logging.WARNING)
-logging.getLogger('app.services.deadline_notification_service').setLevel(logging.WARNING)
+from core.logging_config import setup_logging
+from app.bootstrap import (
+    create_bot, create_storage, setup_dispatcher, setup_update_middlewares,
+    register_local_jobs, register_leader_jobs, build_job_supervisor,
+)
+from app.fsm.event_isolation import ChatEventIsolation
+from app.jobs.supervisor import JobRegistry
+from app.services.warmup import startup_warmup
+from app.webhook.server import run_webhook
+from app.workers.cluster import WorkerCluster, ShardRouterMiddleware
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-async def main():
-    bot = Bot(
-        token=settings.tg.token,
-        default=DefaultBotProperties(parse_mode=ParseMode.HTML)
-    )
 
-    init_notifier(bot)
+async def run_dispatcher(dp: Dispatcher, bot: Bot):
+    try:
+        if settings.webhook.mode == "webhook":
+            await run_webhook(dp, bot)
+        elif settings.webhook.mode == "polling":
+            await bot.delete_webhook()
+            await dp.start_polling(
+                bot,
+                handle_as_tasks=True,
+                tasks_concurrency_limit=settings.webhook.polling_concurrency,
+            )
+        else:
+            raise ValueError(f"Неизвестный режим работы бота: {settings.webhook.mode}")
+    finally:
+        await bot.session.close()
 
-    storage = MemoryStorage()
-    dp = Dispatcher(storage=storage)
 
-    overdue_middleware = OverdueCheckerMiddleware(bot, check_interval=60)
-    dp.message.middleware(overdue_middleware)
-    dp.callback_query.middleware(overdue_middleware)
+async def run_single():
+    bot = create_bot()
+    storage = create_storage(pinned_chats=settings.webhook.mode != "webhook" or settings.webhook.replicas == 1)
+    dp = Dispatcher(storage=storage, events_isolation=ChatEventIsolation())
+    setup_update_middlewares(dp)
+    setup_dispatcher(dp, bot)
 
-    dp.message.middleware(CommandAccessMiddleware())
+    job_registry = JobRegistry()
+    register_local_jobs(job_registry, storage)
+    register_leader_jobs(job_registry, bot)
+    job_supervisor = build_job_supervisor(job_registry)
+    dp.startup.register(startup_warmup.run)
+    dp.startup.register(job_supervisor.start)
+    dp.shutdown.register(job_supervisor.stop)
 
-    dp.include_routers(all_routers)
+    await run_dispatcher(dp, bot)
 
-    try:
-        await dp.start_polling(bot)
-    finally:
-        if hasattr(overdue_middleware, 'stop'):
-            overdue_middleware.stop()
-        await bot.session.close()
+
+async def run_cluster():
+    config = settings.workers
+    cluster = WorkerCluster(
+        config.count,
+        queue_size=config.queue_size,
+        hash_replicas=config.hash_replicas,
+        monitor_interval=config.monitor_interval,
+        shutdown_timeout=config.shutdown_timeout,
+    )
+
+    bot = create_bot()
+    dp = Dispatcher(disable_fsm=True)
+    dp.update.outer_middleware(ShardRouterMiddleware(cluster))
+
+    job_registry = JobRegistry()
+    job_registry.register("worker_monitor", cluster.monitor)
+    job_supervisor = build_job_supervisor(job_registry)
+    dp.startup.register(cluster.start)
+    dp.startup.register(job_supervisor.start)
+    dp.shutdown.register(job_supervisor.stop)
+    dp.shutdown.register(cluster.stop)
+
+    await run_dispatcher(dp, bot)
+
+
+async def main():
+    if settings.workers.count > 1:
+        await run_cluster()
+    else:
+        await run_single()
 
 if __name__ == '__main__':
+    setup_logging()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        pass
\ No newline at end of file
+        pass
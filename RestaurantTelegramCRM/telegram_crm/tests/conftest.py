@@ -0,0 +1,53 @@
+import asyncio
+import os
+import tempfile
+
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/test.db")
+os.environ.setdefault("TOKEN", "42:test")
+
+import pytest
+from sqlalchemy import event
+
+from core.db_helper import db_helper
+from core.models import BaseModel
+
+
+async def _with_engine(coro):
+    try:
+        return await coro
+    finally:
+        await db_helper.engine.dispose()
+
+
+def run(coro):
+    return asyncio.run(_with_engine(coro))
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __enter__(self):
+        event.listen(db_helper.engine.sync_engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(db_helper.engine.sync_engine, "before_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+@pytest.fixture
+def database():
+    async def create_tables():
+        async with db_helper.engine.begin() as connection:
+            await connection.run_sync(BaseModel.metadata.create_all)
+
+    async def drop_tables():
+        async with db_helper.engine.begin() as connection:
+            await connection.run_sync(BaseModel.metadata.drop_all)
+
+    run(create_tables())
+    yield run
+    run(drop_tables())
@@ -0,0 +1,49 @@
+from conftest import QueryCounter
+
+from core.db_helper import db_helper
+from core.models.base_model import SectorStatus, UserRole
+from app.repository.cache_version_repository import CacheVersionRepository
+from app.repository.user_repository import UserRepository
+from app.services.cache_sync import USERS_CACHE, user_cache_sync
+from app.services.user_cache import user_cache
+from app.services.user_service import UserService
+
+
+async def delete_in_other_worker(telegram_id: int):
+    async with db_helper.session_scope() as session:
+        await UserRepository(session).delete_user(telegram_id)
+        await CacheVersionRepository(session).bump_version(USERS_CACHE)
+
+
+def test_cached_lookups_do_not_touch_database(database):
+    async def scenario():
+        user_cache.clear()
+        await UserService.create_new_user(1, "Бармен", UserRole.STAFF, "Бармен", SectorStatus.BAR)
+        await user_cache_sync.check()
+        await UserService.get_user_by_telegram_id(1)
+        await UserService.get_sector_chat_ids(SectorStatus.BAR)
+
+        with QueryCounter() as counter:
+            for _ in range(10):
+                await UserService.get_user_by_telegram_id(1)
+                await UserService.get_sector_chat_ids(SectorStatus.BAR)
+        return counter.count
+
+    assert database(scenario()) == 0
+
+
+def test_version_change_from_other_worker_drops_caches(database):
+    async def scenario():
+        user_cache.clear()
+        await UserService.create_new_user(1, "Бармен", UserRole.STAFF, "Бармен", SectorStatus.BAR)
+        await user_cache_sync.check()
+        cached_before = await UserService.get_user_by_telegram_id(1)
+        roster_before = await UserService.get_sector_chat_ids(SectorStatus.BAR)
+
+        await delete_in_other_worker(1)
+        stale = await UserService.get_user_by_telegram_id(1)
+        await user_cache_sync.check()
+        return (cached_before is not None, roster_before, stale is not None,
+                await UserService.get_user_by_telegram_id(1), await UserService.get_sector_chat_ids(SectorStatus.BAR))
+
+    assert database(scenario()) == (True, [1], True, None, [])
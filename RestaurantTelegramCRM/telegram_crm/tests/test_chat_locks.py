@@ -0,0 +1,145 @@
+import asyncio
+
+from aiogram import Bot, Dispatcher, F, Router
+from aiogram.filters import Command, StateFilter
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import Message, Update
+
+from app.fsm.event_isolation import ChatEventIsolation, ChatLocks
+
+BOT_TOKEN = "42:test"
+CHATS = 20
+UPDATES = 200
+
+
+class ReportStates(StatesGroup):
+    waiting_comment = State()
+
+
+def build_update(update_id: int, chat_id: int, text: str) -> Update:
+    return Update.model_validate({
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": f"user{chat_id}"},
+            "text": text,
+        },
+    })
+
+
+def build_dispatcher(router: Router) -> tuple[Dispatcher, ChatLocks]:
+    chat_locks = ChatLocks()
+    dp = Dispatcher(storage=MemoryStorage(), events_isolation=ChatEventIsolation(chat_locks))
+    dp.include_router(router)
+    return dp, chat_locks
+
+
+def test_concurrent_updates_keep_every_write():
+    router = Router()
+
+    @router.message()
+    async def append_text(message: Message, state: FSMContext):
+        data = await state.get_data()
+        await asyncio.sleep(0.01)
+        await state.update_data(texts=data.get("texts", []) + [message.text])
+
+    async def scenario():
+        dp, chat_locks = build_dispatcher(router)
+        bot = Bot(BOT_TOKEN)
+        await asyncio.gather(*(
+            dp.feed_update(bot, build_update(update_id, 1 + update_id % CHATS, str(update_id)))
+            for update_id in range(UPDATES)
+        ))
+
+        saved = 0
+        for chat_id in range(1, CHATS + 1):
+            data = await dp.storage.get_data(StorageKey(bot.id, chat_id, chat_id))
+            saved += len(data.get("texts", []))
+        await bot.session.close()
+        return saved, len(chat_locks)
+
+    saved, locks_left = asyncio.run(scenario())
+    assert saved == UPDATES
+    assert locks_left == 0
+
+
+def test_state_is_read_after_previous_update_of_chat():
+    router = Router()
+    routed = []
+
+    @router.message(Command("report"))
+    async def start_report(message: Message, state: FSMContext):
+        await asyncio.sleep(0.01)
+        await state.set_state(ReportStates.waiting_comment)
+        routed.append("report")
+
+    @router.message(StateFilter(ReportStates.waiting_comment), F.text)
+    async def save_comment(message: Message, state: FSMContext):
+        await state.clear()
+        routed.append("comment")
+
+    @router.message()
+    async def fallback(message: Message):
+        routed.append("fallback")
+
+    async def scenario():
+        dp, _ = build_dispatcher(router)
+        bot = Bot(BOT_TOKEN)
+        await asyncio.gather(
+            dp.feed_update(bot, build_update(1, 1, "/report")),
+            dp.feed_update(bot, build_update(2, 1, "Готово")),
+        )
+        await bot.session.close()
+
+    asyncio.run(scenario())
+    assert routed == ["report", "comment"]
+
+
+def test_chats_are_not_serialized_with_each_other():
+    router = Router()
+    active = 0
+    max_active = 0
+
+    @router.message()
+    async def slow_handler(message: Message):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    async def scenario():
+        dp, _ = build_dispatcher(router)
+        bot = Bot(BOT_TOKEN)
+        await asyncio.gather(*(
+            dp.feed_update(bot, build_update(update_id, update_id, "ping"))
+            for update_id in range(1, CHATS + 1)
+        ))
+        await bot.session.close()
+
+    asyncio.run(scenario())
+    assert max_active == CHATS
+
+
+def test_lock_is_removed_when_chat_is_idle():
+    chat_locks = ChatLocks()
+
+    async def scenario():
+        async with chat_locks.hold(1):
+            waiter = asyncio.create_task(_hold_once(chat_locks, 1))
+            await asyncio.sleep(0)
+            assert len(chat_locks) == 1
+        await waiter
+        return len(chat_locks)
+
+    assert asyncio.run(scenario()) == 0
+
+
+async def _hold_once(chat_locks: ChatLocks, key: int):
+    async with chat_locks.hold(key):
+        pass
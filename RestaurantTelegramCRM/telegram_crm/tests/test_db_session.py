@@ -0,0 +1,141 @@
+from datetime import datetime
+
+import pytest
+from aiogram import Bot, Dispatcher, Router
+from aiogram.client.session.base import BaseSession
+from aiogram.types import Chat, Message, Update
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db_helper import db_helper
+from core.models import User
+from core.models.base_model import UserRole
+from app.middlewares.db_session_middleware import DbSessionMiddleware, ReleaseReadOnlySessionMiddleware
+
+
+class RecordingSession(BaseSession):
+    def __init__(self):
+        super().__init__()
+        self.checked_out = []
+
+    async def make_request(self, bot, method, timeout=None):
+        self.checked_out.append(db_helper.engine.pool.checkedout())
+        return Message(message_id=1, date=datetime.now(), chat=Chat(id=method.chat_id, type="private"),
+                       text=method.text)
+
+    async def close(self):
+        pass
+
+    async def stream_content(self, *args, **kwargs):
+        yield b""
+
+
+def build_update(chat_id: int, text: str) -> Update:
+    return Update.model_validate({
+        "update_id": 1,
+        "message": {
+            "message_id": 1,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "user"},
+            "text": text,
+        },
+    })
+
+
+def build_dispatcher(router: Router) -> tuple[Dispatcher, Bot, RecordingSession]:
+    dp = Dispatcher()
+    dp.update.middleware(DbSessionMiddleware(db_helper.session_factory))
+    dp.include_router(router)
+    session = RecordingSession()
+    session.middleware(ReleaseReadOnlySessionMiddleware())
+    return dp, Bot("42:test", session=session), session
+
+
+async def count_users() -> int:
+    async with db_helper.session_scope() as session:
+        return await session.scalar(select(func.count()).select_from(User))
+
+
+def add_user(session: AsyncSession, telegram_id: int):
+    session.add(User(telegram_id=telegram_id, full_name="Сотрудник", role=UserRole.STAFF, position="Повар"))
+
+
+def test_failure_after_api_call_rolls_back_whole_update(database):
+    router = Router()
+
+    @router.message()
+    async def handler(message: Message, session: AsyncSession):
+        add_user(session, 1)
+        await session.flush()
+        await message.answer("Сохранено")
+        raise RuntimeError("notification failed")
+
+    async def scenario():
+        dp, bot, _ = build_dispatcher(router)
+        with pytest.raises(RuntimeError):
+            await dp.feed_update(bot, build_update(1, "start"))
+        return await count_users()
+
+    assert database(scenario()) == 0
+
+
+def test_writes_are_committed_once_handler_returns(database):
+    router = Router()
+
+    @router.message()
+    async def handler(message: Message, session: AsyncSession):
+        add_user(session, 1)
+        await session.flush()
+        await message.answer("Сохранено")
+        add_user(session, 2)
+
+    async def scenario():
+        dp, bot, recording_session = build_dispatcher(router)
+        await dp.feed_update(bot, build_update(1, "start"))
+        return await count_users(), recording_session.checked_out
+
+    users, checked_out = database(scenario())
+    assert users == 2
+    assert checked_out == [1]
+
+
+def test_read_only_update_releases_connection_before_api_call(database):
+    router = Router()
+
+    @router.message()
+    async def handler(message: Message, session: AsyncSession):
+        await session.scalar(select(func.count()).select_from(User))
+        await message.answer("Прочитано")
+        await session.scalar(select(func.count()).select_from(User))
+        await message.answer("Прочитано ещё раз")
+
+    async def scenario():
+        dp, bot, recording_session = build_dispatcher(router)
+        await dp.feed_update(bot, build_update(1, "start"))
+        return recording_session.checked_out
+
+    assert database(scenario()) == [0, 0]
+
+
+def test_open_savepoint_is_not_committed_by_api_call(database):
+    router = Router()
+
+    @router.message()
+    async def handler(message: Message, session: AsyncSession):
+        await session.scalar(select(func.count()).select_from(User))
+        try:
+            async with db_helper.savepoint(session):
+                await message.answer("Внутри точки сохранения")
+                add_user(session, 1)
+                await session.flush()
+                raise RuntimeError("step failed")
+        except RuntimeError:
+            pass
+
+    async def scenario():
+        dp, bot, recording_session = build_dispatcher(router)
+        await dp.feed_update(bot, build_update(1, "start"))
+        return await count_users(), recording_session.checked_out
+
+    assert database(scenario()) == (0, [1])
@@ -0,0 +1,124 @@
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import run
+
+from app.repository.reminder_repository import ReminderRepository
+from app.repository.task_repository import TaskRepository
+from app.services.deadline_scheduler import DeadlineScheduler, OVERDUE, REMINDER
+
+
+def make_scheduler() -> DeadlineScheduler:
+    scheduler = DeadlineScheduler(resync_interval=60)
+    scheduler._running = True
+    return scheduler
+
+
+def local_time(scheduler: DeadlineScheduler, timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, scheduler.kemerovo_tz).replace(tzinfo=None)
+
+
+def due_events(scheduler: DeadlineScheduler, now: float) -> list[tuple[int, str]]:
+    return [(task_id, kind) for _, task_id, _, kind in scheduler._pop_due(now)]
+
+
+def test_rescheduled_task_skips_stale_events():
+    scheduler = make_scheduler()
+    now = time.time()
+
+    scheduler.schedule_task(1, local_time(scheduler, now - 60), [local_time(scheduler, now - 120)])
+    scheduler.schedule_task(1, local_time(scheduler, now + 3600), [local_time(scheduler, now + 1800)])
+
+    assert scheduler.pending_events() == 2
+    assert due_events(scheduler, now) == []
+    assert due_events(scheduler, now + 7200) == [(1, REMINDER), (1, OVERDUE)]
+
+
+def test_unscheduled_task_never_fires():
+    scheduler = make_scheduler()
+    now = time.time()
+
+    scheduler.schedule_task(1, local_time(scheduler, now - 60))
+    scheduler.schedule_task(2, local_time(scheduler, now - 30))
+    scheduler.unschedule_task(1)
+
+    assert scheduler.pending_events() == 1
+    assert due_events(scheduler, now) == [(2, OVERDUE)]
+
+
+def test_notified_overdue_task_keeps_only_reminders():
+    scheduler = make_scheduler()
+    now = time.time()
+
+    scheduler.schedule_task(1, local_time(scheduler, now - 60), [local_time(scheduler, now - 120)],
+                            overdue_notified=True)
+
+    assert due_events(scheduler, now) == [(1, REMINDER)]
+
+
+def test_reschedule_during_resync_wins_over_loaded_rows(monkeypatch):
+    scheduler = make_scheduler()
+    now = time.time()
+    stale_deadline = local_time(scheduler, now - 60)
+    new_deadline = local_time(scheduler, now + 3600)
+
+    scheduler.schedule_task(4, local_time(scheduler, now - 10))
+
+    async def get_schedulable_tasks(self):
+        scheduler.schedule_task(1, new_deadline)
+        scheduler.unschedule_task(2)
+        return [
+            SimpleNamespace(task_id=1, deadline=stale_deadline, notified_overdue=False),
+            SimpleNamespace(task_id=2, deadline=stale_deadline, notified_overdue=False),
+            SimpleNamespace(task_id=3, deadline=stale_deadline, notified_overdue=False),
+        ]
+
+    async def get_pending_reminders(self):
+        return [
+            SimpleNamespace(task_id=2, fire_at=local_time(scheduler, now - 120)),
+            SimpleNamespace(task_id=5, fire_at=local_time(scheduler, now - 90)),
+        ]
+
+    monkeypatch.setattr(TaskRepository, "get_schedulable_tasks", get_schedulable_tasks)
+    monkeypatch.setattr(ReminderRepository, "get_pending_reminders", get_pending_reminders)
+    run(scheduler.resync())
+
+    assert scheduler.pending_events() == 3
+    assert due_events(scheduler, now) == [(5, REMINDER), (3, OVERDUE)]
+    assert due_events(scheduler, now + 7200) == [(1, OVERDUE)]
+
+
+def test_failed_resync_keeps_scheduled_events(monkeypatch):
+    scheduler = make_scheduler()
+    now = time.time()
+    scheduler.schedule_task(1, local_time(scheduler, now - 60))
+
+    async def get_schedulable_tasks(self):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(TaskRepository, "get_schedulable_tasks", get_schedulable_tasks)
+    with pytest.raises(RuntimeError):
+        run(scheduler.resync())
+
+    assert scheduler._touched is None
+    assert due_events(scheduler, now) == [(1, OVERDUE)]
+
+
+def test_resync_requested_while_loading_runs_again(monkeypatch):
+    scheduler = make_scheduler()
+
+    async def get_schedulable_tasks(self):
+        scheduler.request_resync()
+        return []
+
+    async def get_pending_reminders(self):
+        return []
+
+    monkeypatch.setattr(TaskRepository, "get_schedulable_tasks", get_schedulable_tasks)
+    monkeypatch.setattr(ReminderRepository, "get_pending_reminders", get_pending_reminders)
+    run(scheduler.resync())
+
+    assert scheduler._resync_requested
@@ -0,0 +1,45 @@
+from collections import Counter
+
+import pytest
+
+from app.workers.hashing import ConsistentHashRing
+
+KEYS = range(10_000)
+
+
+def test_same_key_maps_to_same_node():
+    ring = ConsistentHashRing([0, 1, 2, 3])
+    other_ring = ConsistentHashRing([0, 1, 2, 3])
+
+    assert [ring.get_node(key) for key in KEYS] == [other_ring.get_node(key) for key in KEYS]
+    assert ring.get_node(-1001234567890) == ring.get_node("-1001234567890")
+
+
+def test_keys_are_spread_over_all_nodes():
+    ring = ConsistentHashRing([0, 1, 2, 3], replicas=64)
+
+    counts = Counter(ring.get_node(key) for key in KEYS)
+
+    assert set(counts) == {0, 1, 2, 3}
+    assert max(counts.values()) < 2 * min(counts.values())
+
+
+def test_adding_node_moves_keys_only_to_new_node():
+    ring = ConsistentHashRing([0, 1, 2])
+    grown_ring = ConsistentHashRing([0, 1, 2, 3])
+
+    moved = [key for key in KEYS if ring.get_node(key) != grown_ring.get_node(key)]
+
+    assert all(grown_ring.get_node(key) == 3 for key in moved)
+    assert len(moved) < len(KEYS) / 2
+
+
+def test_single_node_ring_owns_every_key():
+    ring = ConsistentHashRing([5], replicas=1)
+
+    assert {ring.get_node(key) for key in range(100)} == {5}
+
+
+def test_empty_ring_is_rejected():
+    with pytest.raises(ValueError):
+        ConsistentHashRing([])
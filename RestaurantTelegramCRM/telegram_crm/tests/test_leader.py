@@ -0,0 +1,105 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from core.db_helper import db_helper
+from app.repository.lease_repository import LeaseRepository
+from app.workers.leader import LeaderElection
+
+LEASE_NAME = "scheduler"
+RENEW_INTERVAL = 0.05
+
+
+class RecordingSupervisor:
+    def __init__(self):
+        self.events = []
+
+    async def start(self):
+        self.events.append("start")
+
+    async def stop(self):
+        self.events.append("stop")
+
+
+def make_election(holder: str) -> tuple[LeaderElection, RecordingSupervisor]:
+    supervisor = RecordingSupervisor()
+    election = LeaderElection(LEASE_NAME, supervisor, lease_ttl=30, renew_interval=RENEW_INTERVAL, holder=holder)
+    return election, supervisor
+
+
+async def wait_for_leader(election: LeaderElection, timeout: float = 2.0):
+    async def poll():
+        while not election.is_leader:
+            await asyncio.sleep(RENEW_INTERVAL / 2)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+async def stop(task: asyncio.Task):
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+def test_only_one_worker_leads(database):
+    async def scenario():
+        first, first_supervisor = make_election("worker-1")
+        second, second_supervisor = make_election("worker-2")
+
+        first_task = asyncio.create_task(first.run())
+        await wait_for_leader(first)
+        second_task = asyncio.create_task(second.run())
+        await asyncio.sleep(RENEW_INTERVAL * 5)
+
+        leaders = (first.is_leader, second.is_leader)
+        await stop(second_task)
+        await stop(first_task)
+        return leaders, first_supervisor.events, second_supervisor.events
+
+    leaders, first_events, second_events = database(scenario())
+
+    assert leaders == (True, False)
+    assert first_events == ["start", "stop"]
+    assert second_events == []
+
+
+def test_lease_is_handed_over_when_leader_stops(database):
+    async def scenario():
+        first, first_supervisor = make_election("worker-1")
+        second, second_supervisor = make_election("worker-2")
+
+        first_task = asyncio.create_task(first.run())
+        await wait_for_leader(first)
+        second_task = asyncio.create_task(second.run())
+        await asyncio.sleep(RENEW_INTERVAL * 2)
+
+        await stop(first_task)
+        await wait_for_leader(second)
+        await stop(second_task)
+        return first.is_leader, first_supervisor.events, second_supervisor.events
+
+    first_is_leader, first_events, second_events = database(scenario())
+
+    assert not first_is_leader
+    assert first_events == ["start", "stop"]
+    assert second_events == ["start", "stop"]
+
+
+def test_expired_lease_can_be_taken_over(database):
+    async def scenario():
+        now = datetime(2026, 10, 18, 12, 0)
+        lease_ttl = timedelta(seconds=30)
+        results = []
+        async with db_helper.session_scope() as session:
+            lease_repository = LeaseRepository(session)
+            results.append(await lease_repository.try_acquire(LEASE_NAME, "worker-1", now, now + lease_ttl))
+            results.append(await lease_repository.try_acquire(LEASE_NAME, "worker-2", now, now + lease_ttl))
+            renewed_at = now + timedelta(seconds=10)
+            results.append(await lease_repository.try_acquire(LEASE_NAME, "worker-1", renewed_at,
+                                                              renewed_at + lease_ttl))
+            expired_at = renewed_at + lease_ttl + timedelta(seconds=1)
+            results.append(await lease_repository.try_acquire(LEASE_NAME, "worker-2", expired_at,
+                                                              expired_at + lease_ttl))
+            results.append(await lease_repository.try_acquire(LEASE_NAME, "worker-1", expired_at,
+                                                              expired_at + lease_ttl))
+        return results
+
+    assert database(scenario()) == [True, False, True, True, False]
@@ -0,0 +1,39 @@
+from core.db_helper import db_helper
+from core.models import Task, TaskPhoto, User
+from core.models.base_model import TaskStatus, UserRole
+from app.services.task_service import TaskService
+
+from conftest import QueryCounter
+
+MANAGER_ID = 1
+EXECUTOR_ID = 2
+
+
+async def seed_completed_task() -> int:
+    async with db_helper.session_scope() as session:
+        session.add_all([
+            User(telegram_id=MANAGER_ID, full_name="Менеджер", role=UserRole.MANAGER, position="Управляющий"),
+            User(telegram_id=EXECUTOR_ID, full_name="Повар", role=UserRole.STAFF, position="Су-шеф"),
+        ])
+        task = Task(title="Отчёт", description="Сфотографировать холодильник", status=TaskStatus.COMPLETED,
+                    manager_id=MANAGER_ID, executor_id=EXECUTOR_ID)
+        session.add(task)
+        await session.flush()
+        session.add_all([TaskPhoto(task_id=task.task_id, file_id=f"photo{ordinal}", ordinal=ordinal)
+                         for ordinal in (1, 0)])
+        return task.task_id
+
+
+def test_completed_task_view_loads_full_graph(database):
+    async def scenario():
+        task_id = await seed_completed_task()
+        with QueryCounter() as counter:
+            async with db_helper.session_scope() as session:
+                task = await TaskService.get_task_by_id_and_staff(task_id, session=session)
+        return task, counter.count
+
+    task, queries = database(scenario())
+
+    assert (task.executor.full_name, task.manager.full_name) == ("Повар", "Менеджер")
+    assert [photo.file_id for photo in task.photos] == ["photo0", "photo1"]
+    assert queries == 2
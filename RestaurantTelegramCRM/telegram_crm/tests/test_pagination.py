@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+
+from core.config import settings
+from core.db_helper import db_helper
+from core.models import Task, User
+from core.models.base_model import UserRole
+from app.repository.pagination import decode_cursor, encode_cursor, parse_cursor
+from app.services.task_service import TaskService
+
+NO_DEADLINE = datetime(9999, 12, 31)
+BOARD_KINDS = (datetime, int)
+EXECUTOR_ID = 1
+MANAGER_ID = 2
+
+
+def test_sentinel_cursor_round_trips():
+    raw = encode_cursor((NO_DEADLINE, 42))
+
+    assert decode_cursor(raw, BOARD_KINDS) == (NO_DEADLINE, 42)
+
+
+def test_deadline_cursor_round_trips():
+    deadline = datetime(2026, 10, 18, 9, 30, 15, 250)
+
+    assert decode_cursor(encode_cursor((deadline, 7)), BOARD_KINDS) == (deadline, 7)
+
+
+def test_malformed_cursor_starts_from_first_page():
+    assert parse_cursor("oops", BOARD_KINDS) is None
+    assert parse_cursor("1.2.3", BOARD_KINDS) is None
+    assert parse_cursor(None, BOARD_KINDS) is None
+
+
+async def seed_board() -> list[int]:
+    base = datetime(2030, 1, 1, 12, 0)
+    deadlines = [base + timedelta(hours=2), None, base, None, base + timedelta(hours=1), None, base]
+
+    async with db_helper.session_scope() as session:
+        session.add_all([
+            User(telegram_id=EXECUTOR_ID, full_name="Исполнитель", role=UserRole.STAFF, position="Повар"),
+            User(telegram_id=MANAGER_ID, full_name="Менеджер", role=UserRole.MANAGER, position="Управляющий"),
+        ])
+        tasks = [
+            Task(title=f"Задача {index}", description="", deadline=deadline,
+                 executor_id=EXECUTOR_ID, manager_id=MANAGER_ID)
+            for index, deadline in enumerate(deadlines)
+        ]
+        session.add_all(tasks)
+        await session.flush()
+        ordered = sorted(tasks, key=lambda task: (task.deadline or NO_DEADLINE, task.task_id))
+        return [task.task_id for task in ordered]
+
+
+def page_ids(page) -> list[int]:
+    return [task.task_id for task, _ in page.items]
+
+
+async def walk_board() -> tuple[list[int], list[list[int]], list[list[int]]]:
+    expected = await seed_board()
+
+    forward = []
+    page = await TaskService.get_user_board_page(EXECUTOR_ID, None)
+    forward.append(page_ids(page))
+    while page.next_cursor:
+        page = await TaskService.get_user_board_page(EXECUTOR_ID, None, cursor=page.next_cursor)
+        forward.append(page_ids(page))
+
+    backward = []
+    while page.prev_cursor:
+        page = await TaskService.get_user_board_page(EXECUTOR_ID, None, cursor=page.prev_cursor, backward=True)
+        backward.append(page_ids(page))
+    return expected, forward, backward
+
+
+def test_board_pages_through_tasks_without_deadline(database, monkeypatch):
+    monkeypatch.setattr(settings.tg, "page_size", 2)
+
+    expected, forward, backward = database(walk_board())
+
+    assert [task_id for page in forward for task_id in page] == expected
+    assert all(len(page) == 2 for page in forward[:-1])
+    assert backward == forward[-2::-1]
+
+
+def test_sentinel_cursor_continues_after_tasks_without_deadline(database, monkeypatch):
+    monkeypatch.setattr(settings.tg, "page_size", 2)
+
+    async def scenario():
+        expected = await seed_board()
+        no_deadline_ids = expected[-3:]
+        cursor = encode_cursor((NO_DEADLINE, no_deadline_ids[0]))
+        next_page = await TaskService.get_user_board_page(EXECUTOR_ID, None, cursor=cursor)
+        prev_page = await TaskService.get_user_board_page(EXECUTOR_ID, None, cursor=cursor, backward=True)
+        return expected, page_ids(next_page), page_ids(prev_page)
+
+    expected, next_ids, prev_ids = database(scenario())
+
+    assert next_ids == expected[-2:]
+    assert prev_ids == expected[-5:-3]
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+from core.db_helper import db_helper
+from core.models import User
+from core.models.base_model import UserRole
+from app.repository.outbox_repository import OutboxRepository
+from app.services.deadline_scheduler import deadline_scheduler
+from app.services.notification_outbox import notification_outbox
+from app.services.schedule_sync import schedule_sync
+from app.services.task_service import TaskService
+
+EXECUTOR_ID = 1
+MANAGER_ID = 2
+
+
+async def seed_users():
+    async with db_helper.session_scope() as session:
+        session.add_all([
+            User(telegram_id=EXECUTOR_ID, full_name="Исполнитель", role=UserRole.STAFF, position="Повар"),
+            User(telegram_id=MANAGER_ID, full_name="Менеджер", role=UserRole.MANAGER, position="Управляющий"),
+        ])
+
+
+async def enqueue_in_other_worker(next_attempt_at: datetime):
+    async with db_helper.session_scope() as session:
+        OutboxRepository(session).add_messages([EXECUTOR_ID], "Уведомление", None, next_attempt_at)
+
+
+def test_task_change_in_other_worker_requests_resync(database):
+    async def scenario():
+        await seed_users()
+        schedule_sync.version = None
+        deadline_scheduler._resync_requested = False
+        await schedule_sync.check()
+        requested_before = deadline_scheduler._resync_requested
+
+        result = await TaskService.create_new_task(MANAGER_ID, EXECUTOR_ID, "Задача", "",
+                                                   datetime.now() + timedelta(days=1))
+        await schedule_sync.check()
+        return requested_before, result["success"], deadline_scheduler._resync_requested
+
+    assert database(scenario()) == (False, True, True)
+
+
+def test_due_message_from_other_worker_wakes_outbox(database):
+    async def scenario():
+        now = datetime.now(notification_outbox.kemerovo_tz).replace(tzinfo=None)
+        await enqueue_in_other_worker(now + timedelta(hours=1))
+        notification_outbox._wakeup.clear()
+        await schedule_sync.check()
+        woken_for_future = notification_outbox._wakeup.is_set()
+
+        await enqueue_in_other_worker(now)
+        await schedule_sync.check()
+        return woken_for_future, notification_outbox._wakeup.is_set()
+
+    assert database(scenario()) == (False, True)
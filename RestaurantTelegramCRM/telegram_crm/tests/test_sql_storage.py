@@ -0,0 +1,70 @@
+from aiogram.fsm.storage.base import StorageKey
+
+from conftest import QueryCounter
+
+from core.db_helper import db_helper
+from app.fsm.sql_storage import SqlStorage
+from app.middlewares.db_session_middleware import current_session
+
+KEY = StorageKey(bot_id=42, chat_id=1, user_id=1)
+WAITING_COMMENT = "ReportStates:waiting_comment"
+
+
+def make_storage(pinned_chats: bool) -> SqlStorage:
+    return SqlStorage(flush_interval=1.0, batch_size=500, cache_ttl=600, state_ttl=86400, purge_interval=3600,
+                      pinned_chats=pinned_chats)
+
+
+def test_replicas_see_each_other_writes(database):
+    async def scenario():
+        first, second = make_storage(False), make_storage(False)
+        await second.get_state(KEY)
+        await first.set_state(KEY, WAITING_COMMENT)
+        await first.set_data(KEY, {"task_id": 7})
+        seen = (await second.get_state(KEY), await second.get_data(KEY))
+
+        await second.set_state(KEY, None)
+        await second.set_data(KEY, {})
+        return seen, await first.get_state(KEY), await first.get_data(KEY)
+
+    assert database(scenario()) == ((WAITING_COMMENT, {"task_id": 7}), None, {})
+
+
+async def set_state_in_update(storage: SqlStorage, commit: bool):
+    async with db_helper.session_factory() as session:
+        token = current_session.set(session)
+        try:
+            await storage.set_state(KEY, WAITING_COMMENT)
+            await storage.set_data(KEY, {"task_id": 7})
+        finally:
+            current_session.reset(token)
+        if commit:
+            await db_helper.commit(session)
+        else:
+            await db_helper.rollback(session)
+
+
+def test_state_is_saved_with_the_update_transaction(database):
+    async def scenario():
+        first, second = make_storage(False), make_storage(False)
+        await set_state_in_update(first, commit=False)
+        rolled_back = (await second.get_state(KEY), await first.get_state(KEY))
+        await set_state_in_update(first, commit=True)
+        return rolled_back, await second.get_state(KEY), await second.get_data(KEY)
+
+    assert database(scenario()) == ((None, None), WAITING_COMMENT, {"task_id": 7})
+
+
+def test_pinned_storage_serves_chat_from_memory(database):
+    async def scenario():
+        storage = make_storage(True)
+        await storage.get_state(KEY)
+        with QueryCounter() as counter:
+            await storage.set_state(KEY, WAITING_COMMENT)
+            await storage.set_data(KEY, {"task_id": 7})
+            state, data = await storage.get_state(KEY), await storage.get_data(KEY)
+        await storage.close()
+        reloaded = make_storage(True)
+        return counter.count, state, data, await reloaded.get_state(KEY), await reloaded.get_data(KEY)
+
+    assert database(scenario()) == (0, WAITING_COMMENT, {"task_id": 7}, WAITING_COMMENT, {"task_id": 7})